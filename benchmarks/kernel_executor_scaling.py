@@ -0,0 +1,105 @@
+"""
+Scaling of the kernel executor with the number of threads.
+
+Runs a typical per-tick kernel (move, bounce off the walls, distance to
+the player) over arrays of entities of growing size, for 1, 2, 4, ...
+worker threads, and prints the time per tick and the speedup.
+
+Usage (from the root of the repo):
+    python -m benchmarks.kernel_executor_scaling [--repeat N]
+"""
+
+import argparse
+import os
+import time
+
+import numpy as np
+
+from src.misc.kernel_executor import KernelExecutor
+
+SIZES = (10_000, 100_000, 1_000_000, 4_000_000)
+WIDTH, HEIGHT = 2560.0, 1440.0
+TIME_DELTA = 1 / 60
+
+
+def make_state(n: int, rng: np.random.Generator) -> dict[str, np.ndarray]:
+    return {
+        "pos": rng.uniform((0.0, 0.0), (WIDTH, HEIGHT), size=(n, 2)),
+        "vel": rng.uniform(-300.0, 300.0, size=(n, 2)),
+        "dist_sq": np.empty(n),
+        "tmp": np.empty((n, 2)),
+    }
+
+
+def make_kernel(state: dict[str, np.ndarray], player_pos: np.ndarray):
+    pos, vel, dist_sq, tmp = state["pos"], state["vel"], state["dist_sq"], state["tmp"]
+    bounds = np.array((WIDTH, HEIGHT))
+
+    def kernel(start: int, stop: int):
+        p, v, d, t = (
+            pos[start:stop],
+            vel[start:stop],
+            dist_sq[start:stop],
+            tmp[start:stop],
+        )
+        np.multiply(v, TIME_DELTA, out=t)
+        p += t
+        # reflect off the walls
+        outside = (p < 0.0) | (p > bounds)
+        np.negative(v, out=v, where=outside)
+        np.clip(p, 0.0, bounds, out=p)
+        # squared distance to the player
+        np.subtract(p, player_pos, out=t)
+        np.square(t, out=t)
+        np.add(t[:, 0], t[:, 1], out=d)
+
+    return kernel
+
+
+def worker_counts() -> list[int]:
+    n_cores = os.cpu_count() or 1
+    counts = [1]
+    while counts[-1] * 2 <= n_cores:
+        counts.append(counts[-1] * 2)
+    if counts[-1] != n_cores:
+        counts.append(n_cores)
+    return counts
+
+
+def measure(executor: KernelExecutor, kernel, n: int, repeat: int) -> float:
+    """The best time of one tick, in ms."""
+    executor.run(kernel, n)  # warm up the pool
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        executor.run(kernel, n)
+        best = min(best, time.perf_counter() - start)
+    return best * 1000.0
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    player_pos = np.array((WIDTH / 2, HEIGHT / 2))
+    counts = worker_counts()
+    print(f"{os.cpu_count()} cores; best of {args.repeat} ticks, ms (speedup)")
+    print(f"{'entities':>10} " + " ".join(f"{f'{c} thr':>16}" for c in counts))
+    for n in SIZES:
+        kernel = make_kernel(make_state(n, rng), player_pos)
+        row = []
+        single = None
+        for count in counts:
+            # threshold=1 forces the split so that every row is comparable
+            executor = KernelExecutor(max_workers=count, threshold=1)
+            ms = measure(executor, kernel, n, args.repeat)
+            executor.shutdown()
+            single = single or ms
+            row.append(f"{ms:8.2f} ({single / ms:4.1f}x)")
+        print(f"{n:>10} " + " ".join(f"{cell:>16}" for cell in row))
+
+
+if __name__ == "__main__":
+    main()
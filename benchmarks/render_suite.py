@@ -0,0 +1,352 @@
+"""
+The cost of RenderManager.render() alone, without the simulation.
+
+A synthetic game is populated with a number of entities of each type (placed
+at random, with full trails) and rendered for a number of frames, without any
+game update in between. Measures:
+    - the whole frame with all the entities;
+    - each entity type on its own (a game with only those entities, minus
+      the frame of an empty game);
+    - each primitive (pygame.draw functions, the blits and fills of the render
+      surface, the stamped discs): calls and time per frame.
+The results are written as JSON, with what is needed to compare them across
+commits and machines (the commit, the versions, the platform).
+Runs offscreen (SDL dummy video driver), e.g. on a headless Linux box.
+
+Usage (from the root of the repo):
+    python -m benchmarks.render_suite [--counts enemy=200,projectile=1000,...]
+        [--frames N] [--render-scale S] [--seed N] [--output results.json]
+"""
+
+import argparse
+from collections import defaultdict
+import datetime
+import json
+import os
+import platform
+import random
+import statistics
+import subprocess
+import sys
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import pygame
+from pygame import Color, Vector2
+
+from config import BACKGROUND_COLOR_HEX, TRAIL_MAX_LENGTH
+from config.settings import Settings
+from src.game import Game
+from src.entities.enemy import ENEMY_TYPE_TO_CLASS
+from src.entities.projectile import (
+    Projectile,
+    HomingProjectile,
+    ExplosiveProjectile,
+    DefinedTrajectoryProjectile,
+)
+from src.entities.energy_orb import EnergyOrb
+from src.entities.oil_spill import OilSpill
+from src.entities.corpse import Corpse
+from src.entities.mine import Mine
+from src.entities.aoe_effect import AOEEffect
+from src.entities.artifact_chest import ArtifactChest
+from src.entities.bomb import Bomb
+from src.misc.artifacts import InactiveArtifact, StatsBoost
+from src.utils.enums import AnimationType, EnemyType, ProjectileType
+from front.render_manager import RenderManager
+
+WIDTH, HEIGHT = 2560, 1440
+WARMUP_FRAMES = 5  # rendered before the timed ones
+ANIMATION_AGE = 0.1  # s; how far into their animations the animations are
+
+DEFAULT_COUNTS = {
+    "enemy": 100,
+    "projectile": 500,
+    "energy_orb": 20,
+    "oil_spill": 20,
+    "corpse": 50,
+    "mine": 20,
+    "crater": 10,
+    "artifact_chest": 5,
+    "bomb": 5,
+    "animation": 50,
+}
+
+DRAW_FUNCTIONS = ("circle", "line", "lines", "aaline", "arc", "rect", "polygon")
+SURFACE_METHODS = ("blit", "blits", "fill")
+
+
+def random_pos() -> Vector2:
+    return Vector2(random.uniform(0, WIDTH), random.uniform(0, HEIGHT))
+
+
+def random_enemy(game: Game):
+    enemy_type = random.choice([t for t in EnemyType if t != EnemyType.BOSS])
+    return ENEMY_TYPE_TO_CLASS[enemy_type](pos=random_pos(), player=game.player)
+
+
+def random_projectile(game: Game):
+    vel = Vector2(1.0, 0.0).rotate(random.uniform(0, 360))
+    projectile_type = random.choice(list(ProjectileType))
+    if projectile_type == ProjectileType.HOMING:
+        return HomingProjectile(random_pos(), vel)
+    if projectile_type == ProjectileType.EXPLOSIVE:
+        return ExplosiveProjectile(random_pos(), vel)
+    if projectile_type == ProjectileType.DEF_TRAJECTORY:
+        return DefinedTrajectoryProjectile([random_pos() for _ in range(4)])
+    return Projectile(random_pos(), vel, projectile_type)
+
+
+FACTORIES = {
+    "enemy": random_enemy,
+    "projectile": random_projectile,
+    "energy_orb": lambda game: EnergyOrb(random_pos(), 20.0, 10.0),
+    "oil_spill": lambda game: OilSpill(random_pos()),
+    "corpse": lambda game: Corpse(random_enemy(game)),
+    "mine": lambda game: Mine(random_pos()),
+    "crater": lambda game: AOEEffect(random_pos(), random.uniform(60.0, 200.0)),
+    "artifact_chest": lambda game: ArtifactChest(
+        random_pos(), InactiveArtifact(StatsBoost(health=10.0))
+    ),
+    "bomb": lambda game: Bomb(random_pos(), game.player),
+}
+
+
+def with_trail(entity):
+    """The entity with a full trail behind it."""
+    if entity.i_render_trail is not None:
+        step = entity.vel.normalize() * 4.0 if entity.vel else Vector2(4.0, 0.0)
+        for i in range(TRAIL_MAX_LENGTH, 0, -1):
+            entity.i_render_trail.add(entity.get_pos() - step * i)
+    return entity
+
+
+def build_game(counts: dict[str, int]) -> Game:
+    game = Game(pygame.Rect(0, 0, WIDTH, HEIGHT), Settings())
+    with_trail(game.player)  # the ghosts sit on it
+    for name, factory in FACTORIES.items():
+        game.add_entities(with_trail(factory(game)) for _ in range(counts.get(name, 0)))
+    for _ in range(counts.get("animation", 0)):
+        game.animation_handler.add_animation(
+            random_pos(),
+            random.choice(list(AnimationType)),
+            bullet_vel=Vector2(1.0, 0.0).rotate(random.uniform(0, 360)),
+            enemy_size=random.uniform(20.0, 60.0),
+        )
+    game.animation_handler.update(ANIMATION_AGE)
+    return game
+
+
+def summary(times: list[float]) -> dict[str, float]:
+    """Of the times of the frames, in ms."""
+    ms = sorted(t * 1000.0 for t in times)
+    return {
+        "median_ms": statistics.median(ms),
+        "p95_ms": ms[min(len(ms) - 1, round(0.95 * (len(ms) - 1)))],
+        "min_ms": ms[0],
+        "mean_ms": statistics.fmean(ms),
+    }
+
+
+def time_frames(
+    display: pygame.Surface,
+    renderer: RenderManager,
+    frames: int,
+    warmup: int = WARMUP_FRAMES,
+) -> list[float]:
+    """The times of the frames after the warmup ones, which fill the caches."""
+    background = Color(BACKGROUND_COLOR_HEX)
+    times = []
+    for i in range(warmup + frames):
+        # the background is not part of the render (nor of the timed fills)
+        pygame.Surface.fill(display, background)
+        start = time.perf_counter()
+        renderer.render(1.0 / renderer.game.settings.framerate)
+        if i >= warmup:
+            times.append(time.perf_counter() - start)
+    return times
+
+
+def bench_frame(display: pygame.Surface, counts: dict, args) -> dict[str, float]:
+    random.seed(args.seed)
+    renderer = RenderManager(display, build_game(counts), render_scale=args.scale)
+    return summary(time_frames(display, renderer, args.frames))
+
+
+def bench_types(display: pygame.Surface, counts: dict, args) -> dict[str, dict]:
+    """Each entity type on its own, over the frame of an empty game."""
+    empty = bench_frame(display, {}, args)
+    results = {"empty": empty}
+    for name, count in counts.items():
+        if count:
+            alone = bench_frame(display, {name: count}, args)
+            alone["over_empty_ms"] = alone["median_ms"] - empty["median_ms"]
+            results[name] = alone
+    return results
+
+
+class Timings:
+    """The calls and the time spent in each primitive."""
+
+    def __init__(self):
+        self.calls: dict[str, int] = defaultdict(int)
+        self.seconds: dict[str, float] = defaultdict(float)
+
+    def clear(self) -> None:
+        self.calls.clear()
+        self.seconds.clear()
+
+    def wrap(self, name: str, function):
+        def timed(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return function(*args, **kwargs)
+            finally:
+                self.seconds[name] += time.perf_counter() - start
+                self.calls[name] += 1
+
+        return timed
+
+    def per_frame(self, frames: int) -> dict[str, dict[str, float]]:
+        return {
+            name: {
+                "calls": self.calls[name] / frames,
+                "ms": self.seconds[name] * 1000.0 / frames,
+            }
+            for name in sorted(self.seconds, key=self.seconds.get, reverse=True)
+        }
+
+
+def timed_surface_class(timings: Timings) -> type[pygame.Surface]:
+    """A Surface whose blits and fills are timed."""
+    methods = {
+        name: timings.wrap(f"Surface.{name}", getattr(pygame.Surface, name))
+        for name in SURFACE_METHODS
+    }
+    return type("TimedSurface", (pygame.Surface,), methods)
+
+
+def timed_copy(surface: pygame.Surface, cls: type[pygame.Surface]) -> pygame.Surface:
+    copy = cls(surface.get_size(), 0, surface)
+    copy.blit(surface, (0, 0))
+    copy.set_colorkey(surface.get_colorkey())
+    return copy
+
+
+def bench_primitives(display: pygame.Surface, counts: dict, args) -> dict:
+    """
+    The frame with all the entities, rendered onto surfaces whose blits and
+    fills are timed, with the pygame.draw functions and the stamps timed too.
+    """
+    timings = Timings()
+    random.seed(args.seed)
+    cls = timed_surface_class(timings)
+    screen = timed_copy(display, cls)
+    renderer = RenderManager(screen, build_game(counts), render_scale=args.scale)
+    if renderer.world is not None:
+        renderer.world = renderer.surface = timed_copy(renderer.world, cls)
+    stamps = renderer.disc_stamps
+    stamps.stamp = timings.wrap("DiscStamps.stamp", stamps.stamp)  # type: ignore
+    originals = {name: getattr(pygame.draw, name) for name in DRAW_FUNCTIONS}
+    try:
+        for name, function in originals.items():
+            setattr(pygame.draw, name, timings.wrap(f"draw.{name}", function))
+        time_frames(screen, renderer, 0)
+        timings.clear()
+        frame = summary(time_frames(screen, renderer, args.frames, warmup=0))
+    finally:
+        for name, function in originals.items():
+            setattr(pygame.draw, name, function)
+    return {"frame_instrumented": frame, "primitives": timings.per_frame(args.frames)}
+
+
+def git_commit() -> str | None:
+    try:
+        commit = subprocess.run(
+            ["git", "describe", "--always", "--dirty"],
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return commit.stdout.strip()
+
+
+def environment(args, counts: dict[str, int]) -> dict:
+    return {
+        "commit": git_commit(),
+        "timestamp": datetime.datetime.now(datetime.timezone.utc).isoformat(),
+        "python": sys.version.split()[0],
+        "pygame": pygame.version.ver,
+        "sdl": ".".join(map(str, pygame.get_sdl_version())),
+        "video_driver": pygame.display.get_driver(),
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "processor": platform.processor(),
+        "cpu_count": os.cpu_count(),
+        "size": [WIDTH, HEIGHT],
+        "render_scale": args.scale,
+        "frames": args.frames,
+        "warmup_frames": WARMUP_FRAMES,
+        "seed": args.seed,
+        "counts": counts,
+    }
+
+
+def parse_counts(text: str) -> dict[str, int]:
+    counts = dict(DEFAULT_COUNTS)
+    for item in filter(None, text.split(",")):
+        name, _, count = item.partition("=")
+        if name not in DEFAULT_COUNTS:
+            raise argparse.ArgumentTypeError(
+                f"unknown entity type {name!r}; one of {', '.join(DEFAULT_COUNTS)}"
+            )
+        counts[name] = int(count)
+    return counts
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument(
+        "--counts",
+        type=parse_counts,
+        default=dict(DEFAULT_COUNTS),
+        help="entities of each type, e.g. enemy=200,projectile=0 (the others default)",
+    )
+    parser.add_argument("--frames", type=int, default=100)
+    parser.add_argument("--render-scale", dest="scale", type=float, default=1.0)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", default="render_suite.json")
+    args = parser.parse_args()
+
+    pygame.init()
+    display = pygame.display.set_mode((WIDTH, HEIGHT))
+    results = {
+        "environment": environment(args, args.counts),
+        "frame": bench_frame(display, args.counts, args),
+        "types": bench_types(display, args.counts, args),
+        **bench_primitives(display, args.counts, args),
+    }
+    pygame.quit()
+
+    print(f"median of {args.frames} frames, ms")
+    print(f"{'whole frame':>16} {results['frame']['median_ms']:8.2f}")
+    for name, result in results["types"].items():
+        print(f"{name:>16} {result['median_ms']:8.2f}", end="")
+        if "over_empty_ms" in result:
+            over = result["over_empty_ms"]
+            print(f" ({over:+.2f} for {args.counts[name]})", end="")
+        print()
+    print("per primitive, per frame")
+    for name, result in results["primitives"].items():
+        print(f"{name:>16} {result['ms']:8.2f} ms {result['calls']:8.1f} calls")
+    with open(args.output, "w") as f:
+        json.dump(results, f, indent=2)
+    print(f"written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,115 @@
+"""
+Status rings drawn from the sprite cache versus rasterized with pygame.draw.arc.
+
+Measures the rings alone (300 health bars of random fill), then a whole
+RenderManager frame with 300 damaged enemies, with and without the cache.
+Runs offscreen (SDL dummy video driver).
+
+Usage (from the root of the repo):
+    python -m benchmarks.status_ring_cache [--enemies N] [--frames N]
+"""
+
+import argparse
+import math
+import os
+import random
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import pygame
+from pygame import Color, Vector2
+
+from config.settings import Settings
+from src.game import Game
+from src.utils.enums import EnemyType
+from src.utils.utils import Slider
+from front import render_manager
+
+WIDTH, HEIGHT = 2560, 1440
+
+
+def draw_arc_directly(
+    surface: pygame.Surface,
+    pos: Vector2,
+    slider,
+    radius: float,
+    color: Color = Color("white"),
+    draw_full: bool = False,
+    width: int = 3,
+):
+    """draw_circular_status_bar as it was before the cache."""
+    arc_percent = slider.get_percent_full()
+    if draw_full or arc_percent < 1.0:
+        angle = math.pi * (2 * arc_percent + 0.5)
+        rect = pygame.Rect(0, 0, radius * 2, radius * 2)
+        rect.center = pos
+        pygame.draw.arc(surface, color, rect, math.pi / 2, angle, width=width)
+
+
+def compare(draw_frame, frames: int) -> tuple[float, float]:
+    """
+    The best time of one frame in ms, with draw.arc and with the cache.
+    The two are measured in turns, so that they run in the same conditions.
+    """
+    cached_draw = render_manager.draw_circular_status_bar
+    best = {draw_arc_directly: float("inf"), cached_draw: float("inf")}
+    draw_frame()  # warm up the cache
+    try:
+        for _ in range(frames):
+            for draw in best:
+                render_manager.draw_circular_status_bar = draw
+                start = time.perf_counter()
+                draw_frame()
+                best[draw] = min(best[draw], time.perf_counter() - start)
+    finally:
+        render_manager.draw_circular_status_bar = cached_draw
+    return best[draw_arc_directly] * 1000.0, best[cached_draw] * 1000.0
+
+
+def bench_rings(surface: pygame.Surface, n: int, frames: int) -> tuple[float, float]:
+    bars = []
+    for _ in range(n):
+        slider = Slider(100.0)
+        slider.set_percent_full(random.random())
+        pos = Vector2(random.uniform(0, WIDTH), random.uniform(0, HEIGHT))
+        bars.append((pos, slider, random.choice((20.0, 25.0, 30.0))))
+
+    def frame():
+        draw = render_manager.draw_circular_status_bar
+        for pos, slider, radius in bars:
+            draw(surface, pos, slider, radius, color=Color("green"), width=3)
+
+    return compare(frame, frames)
+
+
+def bench_render(surface: pygame.Surface, n: int, frames: int) -> tuple[float, float]:
+    game = Game(surface.get_rect(), Settings())
+    for _ in range(n):
+        game.spawn_enemy(EnemyType.BASIC)
+    for enemy in game.enemies():
+        enemy.get_health().set_percent_full(random.random())
+    renderer = render_manager.RenderManager(surface, game)
+    return compare(renderer.render, frames)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--enemies", type=int, default=300)
+    parser.add_argument("--frames", type=int, default=100)
+    args = parser.parse_args()
+
+    random.seed(0)
+    pygame.init()
+    surface = pygame.display.set_mode((WIDTH, HEIGHT))
+    print(f"{args.enemies} health bars; best of {args.frames} frames, ms")
+    print(f"{'':>14} {'draw.arc':>10} {'cached':>10} {'speedup':>8}")
+    for name, bench in (("rings only", bench_rings), ("whole frame", bench_render)):
+        direct, cached = bench(surface, args.enemies, args.frames)
+        print(f"{name:>14} {direct:10.2f} {cached:10.2f} {direct / cached:7.1f}x")
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main()
@@ -3,7 +3,22 @@ GAME_MAX_LEVEL = 10
 WAVE_DURATION = 45.0  # seconds
 TRAIL_MAX_LENGTH = 50  # positions
 TRAIL_POINTS_PER_SECOND = 50
+TRAIL_STORE_INITIAL_CAPACITY = 256  # trails; the store grows when they are all taken
+ANIMATION_INITIAL_CAPACITY = 64  # animations; the handler grows when they are all taken
 SPAWN_ENEMY_EVERY = 7.0  # seconds
+HAZARD_FIELD_CELL_SIZE = 20.0  # px
+HAZARD_FIELD_ENTITY_MARGIN = 40.0  # px; should be at least the size of the biggest entity
+FLOW_FIELD_COARSENING = 2  # hazard field cells per flow field cell (along each axis)
+FLOW_FIELD_HAZARD_PENALTY = 8.0  # extra cost of crossing a cell with a hazard
+KERNEL_EXECUTOR_PARALLEL_THRESHOLD = 200_000  # array items; smaller arrays use one thread
+KERNEL_EXECUTOR_MAX_WORKERS = None  # None means one per core
+COLLISION_WORKER_CAPACITY = 32_768  # bodies mirrored into shared memory
+COLLISION_WORKER_RING_SLOTS = 2
+COLLISION_WORKER_MAX_CONTACTS = 65_536  # per frame; more means checking in-process
+COLLISION_WORKER_MAX_TIME_DELTA = 0.05  # seconds; longer frames are checked in-process
+COLLISION_WORKER_SLACK = 15.0  # px; covers the nudge of the reflected projectiles
+COLLISION_WORKER_TIMEOUT = 1.0  # seconds
+SOUND_BUFFER_CAPACITY = 256  # sound events; the oldest go when nobody plays them
 
 
 # player
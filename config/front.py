@@ -1,4 +1,5 @@
 FRAMERATE_MIN_MAX = (30, 220)
+RENDER_SCALE_MIN_MAX = (0.5, 1.0)  # of the display resolution
 
 SAVES_BATCH_SIZE = 5
 
@@ -21,6 +22,38 @@ GAME_ENERGY_BAR_SIZE = 240, 30
 GAME_STATS_TEXTBOX_SIZE = 200, 200
 GAME_DEBUG_RECT_SIZE = 220, 80
 
+SPRITE_ATLAS_CAPACITY = 512  # sprites
+SPRITE_ATLAS_MAX_RADIUS = 64  # px; bigger primitives are drawn directly
+STATUS_RING_STEPS = 64  # a status ring is drawn filled to the nearest step
+STATUS_RING_CACHE_CAPACITY = 32  # rings, of up to STATUS_RING_STEPS + 1 sprites each
+TRAIL_DOT_RADIUS = 3  # px
+TRAIL_PALETTE_CAPACITY = 64  # colors
+TEXT_CACHE_CAPACITY = 256  # rendered texts
+COLOR_GRADIENT_STEPS = 256  # a palette gradient gives the color of the nearest step
+HUD_REFRESH_RATE = 10.0  # Hz; how often the texts of the HUD are recomputed
+HUD_BAR_REFRESH_RATE = 30.0  # Hz; same for the health and energy bars
+DIRTY_RECTS_MAX_COVERAGE = 0.5  # of the screen; above it the whole frame is redrawn
+DIRTY_RECTS_MAX_COUNT = 2000  # rects; above it the whole frame is redrawn
+DIRTY_RECTS_POINTS_PER_RECT = 5  # consecutive points of a trail boxed together
+STATIC_LAYER_TILE_SIZE = 256  # px
+QUALITY_FRAME_TIME_SMOOTHING = 0.1  # weight of the last frame in the average frame time
+QUALITY_STEP_DOWN_FRAMES = 30  # frames over the budget before the quality goes down
+QUALITY_STEP_UP_FRAMES = 180  # frames well under the budget before it goes back up
+QUALITY_STEP_UP_RATIO = 0.7  # of the frame budget; "well under" it
+QUALITY_TRAIL_FRACTIONS = (1.0, 0.5, 0.25, 0.0)  # of the trails drawn at each tier
+PROJECTILE_PIXEL_RENDER_THRESHOLD = 64  # projectiles; more are stamped into the pixels
+NOTIFICATIONS_MAX_LIVE = 24  # the oldest notifications go first
+NOTIFICATIONS_MERGE_WINDOW = 0.75  # seconds; the same feedback is merged for this long
+NOTIFICATIONS_MERGE_DISTANCE = 60.0  # px; the feedbacks this close are at the same spot
+SFX_CHANNELS = 16  # mixer channels for the sound effects
+SFX_RESERVED_CHANNELS = 2  # of them, kept for the critical cues
+SFX_STACK_GAIN = 0.25  # louder by this much per doubling of the plays in a frame
+SFX_STACK_MAX_GAIN = 1.0  # at most this much louder; the channels leave room for it
+SFX_PAN_AMOUNT = 0.6  # of the full stereo panning, for the sounds at the edges
+FRAME_CAPTURE_SLOTS = 8  # frames waiting to be encoded; more are dropped
+FRAME_CAPTURE_WORKERS = 2  # processes encoding the PNGs
+FRAME_CAPTURE_NICENESS = 10  # added to that of the encoding processes (not on Windows)
+
 GAME_OVER_WINDOW_SIZE = 600, 700
 
 BACKGROUND_COLOR_HEX = "#101010"
@@ -3,7 +3,10 @@ import pathlib
 ASSETS_DIR = pathlib.Path("assets").resolve()
 SOUNDS_DIR = ASSETS_DIR / "sounds"
 SAVES_DIR = ASSETS_DIR / "saves"
+CAPTURES_DIR = ASSETS_DIR / "captures"
+SOUND_CACHE_DIR = ASSETS_DIR / "cache"
 SETTINGS_FILE = ASSETS_DIR / "settings.json"
 FONT_FILE = ASSETS_DIR / "cnr.otf"
-SAVES_FILE = SAVES_DIR / "saves.shlv"
+SAVES_DB_FILE = SAVES_DIR / "saves.sqlite3"
+SAVES_FILE = SAVES_DIR / "saves.shlv"  # the old saves, moved into SAVES_DB_FILE
 ACHIEVEMENTS_FILE = SAVES_DIR / "achievements.pckl"
@@ -2,6 +2,7 @@ from dataclasses import dataclass
 import json
 
 from config.paths import SETTINGS_FILE
+from config.front import RENDER_SCALE_MIN_MAX
 
 
 @dataclass
@@ -10,6 +11,10 @@ class Settings:
     music_volume: float = 0.15
     difficulty: int = 3  # from 1 to 5; 3 is normal
     framerate: int = 60
+    collision_worker: bool = False  # for stress modes with tens of thousands of bullets
+    dirty_rects: bool = False  # update only the changed parts of the screen
+    render_scale: float = 1.0  # of the display resolution the world is drawn at
+    render_thread: bool = False  # draw the world on another thread, a frame behind
 
     def dump(self):
         with open(SETTINGS_FILE, "w") as f:
@@ -19,6 +24,9 @@ class Settings:
         self.sfx_volume = max(0.0, min(1.0, self.sfx_volume))
         self.music_volume = max(0.0, min(1.0, self.music_volume))
         self.difficulty = max(1, min(5, self.difficulty))
+        self.render_scale = max(
+            RENDER_SCALE_MIN_MAX[0], min(RENDER_SCALE_MIN_MAX[1], self.render_scale)
+        )
 
     @staticmethod
     def create_default() -> "Settings":
@@ -0,0 +1,126 @@
+import numpy as np
+import pygame
+import pygame_gui
+from pygame import Vector2
+
+from config import (
+    DIRTY_RECTS_MAX_COVERAGE,
+    DIRTY_RECTS_MAX_COUNT,
+    DIRTY_RECTS_POINTS_PER_RECT,
+)
+
+
+class DirtyRects:
+    """
+    The regions of the screen drawn to in the current and in the last frame.
+
+    With dirty rects on, a screen restores the background only under what was
+    drawn in the last frame (`restore`) and pushes to the display only what
+    was drawn in either frame (`end_frame`). The whole frame is redrawn when
+    the regions cover more than DIRTY_RECTS_MAX_COVERAGE of the screen, when
+    there are too many of them, or when something untracked was drawn
+    (`request_full_redraw`).
+
+    The drawing code reports what it draws through `add`, `add_circle` and
+    `add_points`; these do nothing while dirty rects are off.
+    """
+
+    def __init__(self):
+        self.enabled = False
+        self.screen_rect = pygame.Rect(0, 0, 0, 0)
+        self._current: list[pygame.Rect] = []
+        self._previous: list[pygame.Rect] | None = None  # None is the whole screen
+        self._full_redraw = True
+
+    def start(self, screen_rect: pygame.Rect) -> None:
+        self.enabled = True
+        self.screen_rect = screen_rect
+        self.request_full_redraw()
+
+    def stop(self) -> None:
+        self.enabled = False
+        self._current.clear()
+
+    def request_full_redraw(self) -> None:
+        """Redraw the whole screen this frame and clear it in the next one."""
+        self._full_redraw = True
+        self._previous = None
+
+    def add(self, rect: pygame.Rect) -> None:
+        if self.enabled:
+            self._current.append(rect)
+
+    def add_circle(self, pos: Vector2, radius: float) -> None:
+        """The bounding square of a circle, with a pixel to spare."""
+        if self.enabled:
+            size = 2 * radius + 3
+            self._current.append(
+                pygame.Rect(pos[0] - radius - 1, pos[1] - radius - 1, size, size)
+            )
+
+    def add_points(
+        self,
+        points: np.ndarray,
+        margin: float,
+        per_rect: int = DIRTY_RECTS_POINTS_PER_RECT,
+    ) -> None:
+        """
+        Points of shape (n, 2) drawn with the given margin around them, such as
+        a trail. They are boxed in runs of `per_rect`: one box around a long
+        diagonal path would cover most of the screen.
+        """
+        if not self.enabled or not len(points):
+            return
+        starts = np.arange(0, len(points), per_rect)
+        lows = np.minimum.reduceat(points, starts) - (margin + 1)
+        highs = np.maximum.reduceat(points, starts) + (margin + 2)
+        self._current.extend(
+            pygame.Rect(x0, y0, x1 - x0, y1 - y0)
+            for (x0, y0), (x1, y1) in zip(lows.tolist(), highs.tolist())
+        )
+
+    def add_ui(self, manager: pygame_gui.UIManager) -> None:
+        """The visible elements of the UI (containers draw nothing)."""
+        for element in manager.get_sprite_group().sprites():
+            image = element.image
+            if element.visible and image is not None and image.get_width():
+                self.add(element.rect)
+
+    def restore(self, surface: pygame.Surface, background: pygame.Surface) -> None:
+        """Blit the background over what was drawn in the last frame."""
+        if self._previous is None:
+            surface.blit(background, (0, 0))
+        else:
+            surface.blits(
+                [(background, rect, rect) for rect in self._previous], doreturn=False
+            )
+
+    def end_frame(self) -> list[pygame.Rect] | None:
+        """
+        The regions of the display to update, None for the whole display.
+        Starts the next frame.
+        """
+        current = [
+            clipped
+            for rect in self._current
+            if (clipped := rect.clip(self.screen_rect)).width
+        ]
+        self._current = []
+        previous, self._previous = self._previous, current
+        full_redraw, self._full_redraw = self._full_redraw, False
+        if previous is None or full_redraw:
+            self._previous = None if full_redraw else current
+            return None
+        changed = previous + current
+        covered = sum(rect.width * rect.height for rect in changed)
+        screen_area = self.screen_rect.width * self.screen_rect.height
+        if (
+            len(changed) > DIRTY_RECTS_MAX_COUNT
+            or covered > DIRTY_RECTS_MAX_COVERAGE * screen_area
+        ):
+            self._previous = None
+            return None
+        return changed
+
+
+dirty_rects = DirtyRects()
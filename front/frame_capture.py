@@ -0,0 +1,153 @@
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from multiprocessing import shared_memory
+import datetime
+import multiprocessing
+import os
+import pathlib
+
+import numpy as np
+import pygame
+
+from src.utils.shm import attach_shared_memory
+from config import FRAME_CAPTURE_SLOTS, FRAME_CAPTURE_WORKERS, FRAME_CAPTURE_NICENESS
+from config.paths import CAPTURES_DIR
+
+# a fresh interpreter: a forked one would inherit the signal handlers of SDL
+mp_context = multiprocessing.get_context("spawn")
+
+# in a worker: the frames of the capture it encodes
+_slots: np.ndarray | None = None
+_memory: shared_memory.SharedMemory | None = None
+
+
+def attach_slots(name: str, shape: tuple[int, int, int]) -> None:
+    """The initializer of the workers."""
+    global _slots, _memory
+    if hasattr(os, "nice"):
+        os.nice(FRAME_CAPTURE_NICENESS)  # the game goes first
+    _memory = attach_shared_memory(name)  # the game unlinks it
+    _slots = np.ndarray(shape, dtype=np.uint32, buffer=_memory.buf)
+
+
+def encode_png(slot: int, masks: tuple[int, ...], path: str) -> None:
+    """Save the frame in the slot (pixels of the masks) as a PNG; runs in a worker."""
+    assert _slots is not None
+    pixels = _slots[slot]
+    height, width = pixels.shape
+    image = pygame.Surface((width, height), 0, 32, masks)
+    pygame.surfarray.blit_array(image, pixels.T)
+    pygame.image.save(image, path)
+
+
+class FrameCapture:
+    """
+    Records the frames of the screen as a sequence of PNGs, for perf triage,
+    without stalling the game loop.
+
+    The pixels of a frame are copied as they are (through surfarray, row by row)
+    into a free slot of a ring in shared memory, and the slot is handed to a process pool that
+    encodes it while the game goes on; the slot is free again once the PNG is
+    written. When the pool falls behind and all the FRAME_CAPTURE_SLOTS slots
+    are taken, the frame is dropped instead of waiting.
+    """
+
+    def __init__(self):
+        self.is_on = False
+        self.directory: pathlib.Path | None = None
+        self.frames = 0  # captured or dropped, numbers the files
+        self.encoded = 0
+        self.dropped = 0
+        self.failed = 0
+        self._pool: ProcessPoolExecutor | None = None
+        self._memory: shared_memory.SharedMemory | None = None
+        self._slots: np.ndarray | None = None
+        self._pending: list[Future | None] = []  # by slot
+
+    def start(self, size: tuple[int, int]) -> None:
+        width, height = size
+        shape = (FRAME_CAPTURE_SLOTS, height, width)  # 32-bit pixels
+        self.directory = CAPTURES_DIR / datetime.datetime.now().strftime(
+            "%Y-%m-%d_%H-%M-%S"
+        )
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.frames = self.encoded = self.dropped = self.failed = 0
+        self._memory = shared_memory.SharedMemory(
+            create=True, size=int(np.prod(shape)) * 4
+        )
+        self._slots = np.ndarray(shape, dtype=np.uint32, buffer=self._memory.buf)
+        self._slots.fill(0)  # maps the pages now rather than in the first frames
+        self._pending = [None] * FRAME_CAPTURE_SLOTS
+        self._pool = ProcessPoolExecutor(
+            max_workers=FRAME_CAPTURE_WORKERS,
+            mp_context=mp_context,
+            initializer=attach_slots,
+            initargs=(self._memory.name, shape),
+        )
+        self.is_on = True
+
+    def capture(self, surface: pygame.Surface) -> None:
+        """Hand the frame to the pool, or drop it if there is no free slot."""
+        if not self.is_on:
+            return
+        assert self._pool is not None and self._slots is not None
+        self.frames += 1
+        slot = self._free_slot()
+        if slot is None:
+            self.dropped += 1
+            return
+        pixels = pygame.surfarray.pixels2d(surface)  # (width, height), a view
+        np.copyto(self._slots[slot], pixels.T)
+        del pixels  # unlocks the surface
+        path = self.directory / f"{self.frames:06d}.png"  # type: ignore
+        try:
+            self._pending[slot] = self._pool.submit(
+                encode_png, slot, surface.get_masks(), str(path)
+            )
+        except BrokenProcessPool:
+            print("[FrameCapture] the encoding processes died; stopping the capture")
+            self.dropped += 1
+            self.stop()
+
+    def stop(self) -> None:
+        """Wait for the frames being encoded, then release the pool and the slots."""
+        if not self.is_on:
+            return
+        assert self._pool is not None and self._memory is not None
+        self.is_on = False
+        self._pool.shutdown(wait=True)
+        for slot in range(len(self._pending)):
+            self._collect(slot)
+        self._pool = None
+        del self._slots
+        self._slots = None
+        self._memory.close()
+        self._memory.unlink()
+        self._memory = None
+        print(f"[FrameCapture] {self.report()} to {self.directory}")
+
+    def report(self) -> str:
+        report = f"{self.encoded} frames encoded, {self.dropped} dropped"
+        if self.failed:
+            report += f", {self.failed} failed"
+        return report
+
+    def _free_slot(self) -> int | None:
+        for slot in range(len(self._pending)):
+            if self._collect(slot):
+                return slot
+        return None
+
+    def _collect(self, slot: int) -> bool:
+        """Count the frame of the slot if it is encoded; whether the slot is free."""
+        future = self._pending[slot]
+        if future is None:
+            return True
+        if not future.done():
+            return False
+        self._pending[slot] = None
+        if future.exception() is None:
+            self.encoded += 1
+        else:
+            self.failed += 1
+        return True
@@ -1,7 +1,5 @@
-import datetime
 import pickle
 import random
-import shelve
 from typing import Literal
 from pprint import pprint
 
@@ -11,6 +9,7 @@ import pygame_gui
 
 from front.inventory_info import InventoryInfo
 from front.stats_window import StatsWindow
+from front.save_store import save_store
 from src.entities.aoe_effect import AOEEffect
 from src.entities.artifact_chest import ArtifactChest
 from src.entities.mine import Mine
@@ -21,23 +20,32 @@ from src.misc.line import Line, LineType
 from src.entities.oil_spill import OilSpill
 from src.utils.player_utils import Achievements
 
-from src.utils.utils import Feedback, random_unit_vector, Timer
+from src.utils.utils import random_unit_vector, Timer
 from src.game import Game
 
 from front.sounds import play_sfx
 from front.screen import Screen
 from front.render_manager import RenderManager
-from front.utils import HUGE_FONT, Label, Notification
+from front.utils import HUGE_FONT, Label
+from front.notifications import NotificationFeed
+from front.frame_capture import FrameCapture
 from front.stats_panel import StatsPanel
 
 from config import GAME_OVER_WINDOW_SIZE, SAVE_GAMES_LONGER_THAN
-from config.paths import ACHIEVEMENTS_FILE, SAVES_FILE
+from config.paths import ACHIEVEMENTS_FILE
 from config.settings import Settings
 
 
 class GameScreen(Screen):
     def __init__(self, surface: pygame.Surface, settings: Settings):
-        super().__init__(surface, framerate=settings.framerate)
+        super().__init__(
+            surface,
+            framerate=settings.framerate,
+            # the world drawn offscreen covers the whole screen
+            use_dirty_rects=settings.dirty_rects
+            and settings.render_scale == 1.0
+            and not settings.render_thread,
+        )
         self.settings = settings
         self.debug = False
         self.setup_game(surface)
@@ -47,6 +55,7 @@ class GameScreen(Screen):
             text="paused", surface=surface, rect=rect, font=HUGE_FONT
         )
         self.victory_notification_shown = False
+        self.frame_capture = FrameCapture()
 
         self.sfx_heartbeat_low_health_timer = Timer(3.0)
         self.sfx_heartbeat_low_health_timer.turn_off()
@@ -57,17 +66,20 @@ class GameScreen(Screen):
         play_sfx("start_game")
         self.screen_rectangle = self.surface.get_rect()
         self.game = Game(self.screen_rectangle, self.settings)
-        self.game.animation_handler.set_surface(surface)
         self.stats_panel = StatsPanel(
             surface, self.manager, self.game, stats_panel_visibility
         )
         self.inventory_info = InventoryInfo(surface, self.game.player)
         self.render_manager = RenderManager(
-            surface=surface, debug=self.debug, game=self.game
+            surface=surface,
+            debug=self.debug,
+            game=self.game,
+            render_scale=self.settings.render_scale,
+            render_thread=self.settings.render_thread,
         )
 
         self.game_is_over_window_shown = False
-        self.notifications: list[Notification] = []
+        self.notifications = NotificationFeed(surface, self.notification_position)
 
     def process_ui_event(self, event: pygame.event.Event):
         if event.type == pygame.KEYDOWN:
@@ -173,6 +185,8 @@ class GameScreen(Screen):
                     self.toggle_debug()
                 elif event.key == pygame.K_F2:
                     self.stats_panel.toggle_visibility()
+                elif event.key == pygame.K_F9:
+                    self.toggle_capture()
                 elif event.key == pygame.K_F5:
                     self.post_run()
                     self.setup_game(self.surface, self.stats_panel.show_stats_panel)
@@ -214,9 +228,9 @@ class GameScreen(Screen):
                 self.game.player_try_ultimate(artifact_type=ArtifactType.RAGE)
 
     def update(self, time_delta: float):
+        # the world of the last frame is drawn on the render thread meanwhile
+        self.render_manager.replay_world()
         self.game.update(time_delta)
-        if self.game.paused:
-            self.paused_label.update()
         if (
             self.game.collected_artifact_cache
         ):  # this adds the artifact to the ult picker
@@ -226,30 +240,31 @@ class GameScreen(Screen):
             self.game.collected_artifact_cache.clear()
         self.render_manager.ult_picker.set_mouse_pos(Vector2(pygame.mouse.get_pos()))
         self.game.reflect_projectiles_vel()
+        self.render(time_delta)
+        # the HUD goes over the world
+        if self.game.paused:
+            self.paused_label.update()
         self.stats_panel.update(time_delta=time_delta)
         self.inventory_info.update(time_delta)
-        self.render()
         if not self.game.is_running() and not self.game_is_over_window_shown:
             self.show_game_is_over_window()
             play_sfx("game_over")  # TODO: move this to `on_game_over()`
             self.game_is_over_window_shown = True
         if self.game.is_victory and not self.victory_notification_shown:
             self.victory_notification_shown = True
-            self.notifications.append(
-                Notification(
-                    "you won!",
-                    Vector2(self.surface.get_rect().center - Vector2(250, 0)),
-                    self.surface,
-                    duration=5.0,
-                    color=Color("green"),
-                    font=HUGE_FONT,
-                )
+            self.notifications.spawn(
+                "you won!",
+                Vector2(self.surface.get_rect().center - Vector2(250, 0)),
+                duration=5.0,
+                color=Color("green"),
+                font=HUGE_FONT,
             )
         self.render_manager.reset()
         self.process_feedback_buffer()
         self.game.set_last_fps(self.clock.get_fps())
-        for notification in self.notifications:
-            notification.update(time_delta)
+        self.render_manager.quality.report(self.clock.get_rawtime() / 1000.0)
+        self.notifications.update(time_delta)
+        self.process_sound_buffer()
         self.process_sound_effects(time_delta)
 
     def process_sound_effects(self, time_delta: float):
@@ -278,18 +293,49 @@ class GameScreen(Screen):
             elif b._id in self.game.ids_played_sound_effect:
                 self.game.ids_played_sound_effect.remove(b._id)
 
+    def process_sound_buffer(self):
+        """The sounds the game made this frame; they are played at its end."""
+        width = self.screen_rectangle.width
+        while self.game.sound_buffer:
+            event = self.game.sound_buffer.popleft()
+            pan = None if event.pos is None else event.pos.x / width
+            play_sfx(event.name, event.priority, pan)
+
     def process_feedback_buffer(self):
-        if len(self.game.feedback_buffer):
-            feedback = self.game.feedback_buffer.popleft()
-            self.spawn_notification(feedback=feedback)
+        self.notifications.drain(self.game.feedback_buffer)
 
-    def render(self):
-        self.render_manager.render()
+    def render(self, time_delta: float):
+        self.render_manager.render(time_delta)
 
     def toggle_debug(self):
         self.debug = not self.debug
         self.render_manager.set_debug(self.debug)
 
+    def toggle_capture(self):
+        if self.frame_capture.is_on:
+            self.frame_capture.stop()
+            text = f"capture: {self.frame_capture.report()}"
+        else:
+            self.frame_capture.start(self.surface.get_size())
+            text = "capturing"
+        self.notifications.spawn(text, Vector2(self.surface.get_rect().midtop))
+
+    def draw_background(self):
+        # the world drawn offscreen is opaque and covers the whole screen
+        if self.render_manager.world is None:
+            super().draw_background()
+
+    def update_display(self):
+        # the whole frame, HUD and UI included
+        self.frame_capture.capture(self.surface)
+        super().update_display()
+
+    def run(self):
+        try:
+            return super().run()
+        finally:
+            self.frame_capture.stop()
+
     def show_game_is_over_window(self):
         html_stats = StatsWindow.construct_one_save_html("now", self.game.get_info())
         r = pygame.Rect(0, 0, *GAME_OVER_WINDOW_SIZE)
@@ -302,45 +348,22 @@ class GameScreen(Screen):
             blocking=True,
         )
 
-    def spawn_notification(
-        self,
-        text: str = "",
-        duration: float = 3.0,
-        at_pos: Literal["player", "cursor", "center"] | Vector2 = "cursor",
-        color: Color = Color("white"),
-        feedback: Feedback | None = None,
-    ):
-        if feedback is not None:
-            text = feedback.text
-            duration = feedback.duration
-            at_pos = feedback.at_pos
-            color = feedback.color
+    def notification_position(
+        self, at_pos: Literal["player", "cursor", "center"] | Vector2
+    ) -> Vector2:
         random_vector = random_unit_vector() * random.random() * 80
         if at_pos == "player":
-            pos = self.game.player.get_pos() + random_vector
+            return self.game.player.get_pos() + random_vector
         elif at_pos == "cursor":
-            pos = Vector2(pygame.mouse.get_pos()) + random_vector
+            return Vector2(pygame.mouse.get_pos()) + random_vector
         elif at_pos == "center":
-            pos = self.surface.get_rect().center + random_vector
-        else:
-            pos = at_pos + random_vector
-        self.notifications.append(
-            Notification(
-                text=text,
-                position=pos,
-                surface=self.surface,
-                duration=duration,
-                color=color,
-            )
-        )
-        self.notifications = [
-            notification
-            for notification in self.notifications
-            if notification._is_alive
-        ]
+            return self.surface.get_rect().center + random_vector
+        return at_pos + random_vector
 
     def post_run(self):
-        """Saves the game info to the "saves" file."""
+        """Saves the game info to the save store."""
+        self.game.close()
+        self.render_manager.close()
         # if player quit the game witout dying
         if self.game.player.is_alive():
             # do not write the reason of death to the info
@@ -349,10 +372,7 @@ class GameScreen(Screen):
         # do not save games that ran for less than 15 seconds
         if self.game.time < SAVE_GAMES_LONGER_THAN:
             return
-        with shelve.open(str(SAVES_FILE)) as saves:
-            saves[
-                datetime.datetime.now().strftime("%d/%m/%Y, %H:%M:%S")
-            ] = self.game.get_info()
+        save_store.add(self.game.get_info())
 
         with ACHIEVEMENTS_FILE.open("rb") as f:
             ach_global: Achievements = pickle.load(f)
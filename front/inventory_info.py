@@ -3,7 +3,8 @@ from pygame import Vector2
 
 from front.utils import TextBox
 from src.entities.player import Player
-from config.front import LIGHT_ORANGE_HEX, NICER_RED_HEX
+from src.utils.utils import Timer
+from config.front import LIGHT_ORANGE_HEX, NICER_RED_HEX, HUD_REFRESH_RATE
 
 
 ORANGE = pygame.Color(LIGHT_ORANGE_HEX)
@@ -16,6 +17,8 @@ class InventoryInfo:
         self.surface = surface
         self.surf_rect = surface.get_rect()
         self.N_old = 0
+        self.refresh_timer = Timer(1.0 / HUD_REFRESH_RATE)
+        self.refresh_timer.turn_off()
         self.rebuild_textbox_if()
 
     def rebuild_textbox_if(self):
@@ -38,6 +41,10 @@ class InventoryInfo:
             self.textbox.labels[i].set_color(color)
 
     def update(self, time_delta: float):
-        self.rebuild_textbox_if()
-        self.textbox.labels[-1].set_text(f"{self.player.boosts}")
+        """The artifacts and the boosts are refreshed at HUD_REFRESH_RATE."""
+        self.refresh_timer.tick(time_delta)
+        if not self.refresh_timer.running():
+            self.refresh_timer.reset()
+            self.rebuild_textbox_if()
+            self.textbox.labels[-1].set_text(f"{self.player.boosts}")
         self.textbox.update()
@@ -1,5 +1,4 @@
 import pickle
-import shelve
 
 import pygame
 import pygame_gui
@@ -9,12 +8,13 @@ from front.game_screen import GameScreen
 from front.console_window import ConsoleWindow
 from front.settings_window import SettingsWindow
 from front.rules_window import RulesWindow
-from front.sounds import set_sfx_volume, set_bg_music_vol, play_bg_music
+from front.sounds import set_sfx_volume, set_bg_music_vol, play_bg_music, prefetch_sfx
 from front.stats_window import StatsWindow
+from front.save_store import save_store
 from front.utils import paint
 from config import MENU_BUTTONS_SIZE, NICER_GREEN_HEX
 from config.settings import Settings
-from config.paths import ACHIEVEMENTS_FILE, SAVES_DIR, SAVES_FILE
+from config.paths import ACHIEVEMENTS_FILE, SAVES_DIR
 from src.utils.player_utils import Achievements
 
 
@@ -30,8 +30,7 @@ class MenuScreen(Screen):
 
         if not SAVES_DIR.exists():
             SAVES_DIR.mkdir(exist_ok=True, parents=True)
-            with shelve.open(str(SAVES_FILE)) as saves:
-                saves.clear()
+        save_store.set_up()
         if not ACHIEVEMENTS_FILE.exists():
             # this is global achievements
             with ACHIEVEMENTS_FILE.open("wb") as f:
@@ -77,6 +76,8 @@ class MenuScreen(Screen):
         self.achievements_window = None
 
         self.game_screen = None
+        # decoded while the menu is up, not on the first play of each sound
+        prefetch_sfx()
 
     def reload_settings(self):
         self.settings = Settings.load()
@@ -0,0 +1,112 @@
+from collections import deque
+from typing import Callable, Hashable, Literal
+
+import pygame
+from pygame import Color, Vector2, freetype
+
+from src.utils.utils import Feedback
+from front.utils import FONT, Notification
+from config import (
+    NOTIFICATIONS_MAX_LIVE,
+    NOTIFICATIONS_MERGE_WINDOW,
+    NOTIFICATIONS_MERGE_DISTANCE,
+)
+
+AtPos = Literal["player", "cursor", "center"] | Vector2
+
+
+class NotificationFeed:
+    """
+    The notifications on the screen, most of them fed by the feedback buffer
+    of the game, which is drained every frame (`drain`).
+
+    A feedback with the same text and color as a notification that showed up
+    at the same spot less than NOTIFICATIONS_MERGE_WINDOW seconds ago is
+    counted in that notification ("-120hp ×3") instead of getting one of its own.
+    At most NOTIFICATIONS_MAX_LIVE notifications are shown: the oldest ones
+    make room for the new ones. The notifications that are gone are kept in
+    a pool and reused.
+    """
+
+    def __init__(self, surface: pygame.Surface, locate: Callable[[AtPos], Vector2]):
+        self.surface = surface
+        self.locate = locate  # where a feedback shows up on the screen
+        self.live: list[Notification] = []  # the oldest first
+        self._pool: list[Notification] = []
+        self._by_key: dict[Hashable, Notification] = {}
+
+    def drain(self, feedback_buffer: deque[Feedback]):
+        while feedback_buffer:
+            feedback = feedback_buffer.popleft()
+            key = (feedback.text, int(feedback.color), self.spot(feedback.at_pos))
+            notification = self._by_key.get(key)
+            if (
+                notification is not None
+                and notification.key == key
+                and notification.is_alive()
+                and notification.lifetime_timer.get_value() < NOTIFICATIONS_MERGE_WINDOW
+            ):
+                notification.merge(feedback.duration)
+                continue
+            self._by_key[key] = self.spawn(
+                feedback.text,
+                self.locate(feedback.at_pos),
+                feedback.duration,
+                feedback.color,
+                key=key,
+            )
+
+    def spawn(
+        self,
+        text: str,
+        position: Vector2,
+        duration: float = 3.0,
+        color: Color = Color("white"),
+        font: freetype.Font = FONT,
+        key: Hashable = None,
+    ) -> Notification:
+        if len(self.live) >= NOTIFICATIONS_MAX_LIVE:
+            oldest = self.live.pop(0)
+            oldest.kill()
+            self._retire(oldest)
+        if self._pool:
+            notification = self._pool.pop()
+            notification.respawn(text, position, duration, color, font)
+        else:
+            notification = Notification(
+                text, position, self.surface, duration, color, font=font
+            )
+        notification.key = key
+        self.live.append(notification)
+        return notification
+
+    def update(self, time_delta: float):
+        """Move and draw the notifications; those that are gone go to the pool."""
+        gone = False
+        for notification in self.live:
+            notification.update(time_delta)
+            gone = gone or not notification.is_alive()
+        if gone:
+            for notification in self.live:
+                if not notification.is_alive():
+                    self._retire(notification)
+            self.live[:] = [n for n in self.live if n.is_alive()]
+
+    def _retire(self, notification: Notification):
+        """To the pool; its feedbacks are not merged into it any more."""
+        if self._by_key.get(notification.key) is notification:
+            del self._by_key[notification.key]
+        self._pool.append(notification)
+
+    @staticmethod
+    def spot(at_pos: AtPos) -> Hashable:
+        """The feedbacks at the same spot are merged."""
+        if isinstance(at_pos, str):
+            return at_pos
+        return (
+            round(at_pos[0] / NOTIFICATIONS_MERGE_DISTANCE),
+            round(at_pos[1] / NOTIFICATIONS_MERGE_DISTANCE),
+        )
+
+    def __len__(self) -> int:
+        return len(self.live)
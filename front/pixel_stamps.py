@@ -0,0 +1,102 @@
+import numpy as np
+import pygame
+from pygame import Color
+
+from src.entities.projectile import PROJECTILE_COLOR_MAP
+from src.utils.enums import SpriteShape
+from front.sprite_atlas import COLORKEY, rasterize
+
+
+class DiscStamps:
+    """
+    Filled discs written straight into the pixels of a surface, all of them
+    with a few numpy operations: the bodies of the projectiles when there are
+    too many of them to blit one by one (PROJECTILE_PIXEL_RENDER_THRESHOLD).
+
+    The stamp of a radius is the offsets of the pixels of the disc the sprite
+    atlas would blit, so a stamped disc looks exactly like a blitted one.
+    The colors are packed into pixels once per surface format; those of
+    PROJECTILE_COLOR_MAP are packed up front.
+    """
+
+    def __init__(self):
+        self._stamps: dict[int, tuple[np.ndarray, np.ndarray]] = {}
+        # by pixel format, the pixels of the colors (as ints)
+        self._pixels: dict[tuple[int, ...], dict[int, int]] = {}
+
+    def stamp(
+        self,
+        surface: pygame.Surface,
+        points: np.ndarray,
+        radius: float,
+        colors: list[Color],
+    ) -> None:
+        """Discs of the radius around the points, shape (n, 2), one color each."""
+        radius = int(radius)
+        dx, dy = self._stamp(radius)
+        values = self._pack(surface, colors)
+        corners = points.astype(np.intp)  # as the atlas truncates the positions
+        xs, ys = corners[:, 0], corners[:, 1]
+        width, height = surface.get_size()
+        # the pixels are written as one flat array, rows `pitch` bytes apart
+        row = surface.get_pitch() // surface.get_bytesize()
+        indices = (ys * row + xs)[:, None] + (dy * row + dx)
+        on_edge = np.flatnonzero(
+            (xs < radius)
+            | (xs >= width - radius)
+            | (ys < radius)
+            | (ys >= height - radius)
+        )
+        if len(on_edge):
+            # the pixels of a disc off the surface go to one of its pixels on it,
+            # which keeps the discs in order (the later ones drawn over)
+            disc_xs, disc_ys = xs[on_edge, None] + dx, ys[on_edge, None] + dy
+            inside = (
+                (disc_xs >= 0) & (disc_xs < width) & (disc_ys >= 0) & (disc_ys < height)
+            )
+            visible = inside.any(axis=1)
+            clipped = indices[on_edge]
+            first = clipped[np.arange(len(on_edge)), inside.argmax(axis=1)]
+            indices[on_edge] = np.where(inside, clipped, first[:, None])
+            if not visible.all():
+                shown = np.ones(len(xs), dtype=bool)
+                shown[on_edge[~visible]] = False
+                indices, values = indices[shown], values[shown]
+        surface_pixels = pygame.surfarray.pixels2d(surface)
+        flat = np.lib.stride_tricks.as_strided(
+            surface_pixels,
+            shape=((height - 1) * row + width,),
+            strides=(surface.get_bytesize(),),
+        )
+        flat[indices] = values[:, None]
+        del flat, surface_pixels  # unlocks the surface
+
+    def _stamp(self, radius: int) -> tuple[np.ndarray, np.ndarray]:
+        stamp = self._stamps.get(radius)
+        if stamp is None:
+            sprite, half = rasterize(SpriteShape.CIRCLE, radius, Color("white"), 0)
+            drawn = pygame.surfarray.array2d(sprite) != sprite.map_rgb(COLORKEY)
+            xs, ys = np.nonzero(drawn)
+            stamp = self._stamps[radius] = (xs - half, ys - half)
+        return stamp
+
+    def _pack(self, surface: pygame.Surface, colors: list[Color]) -> np.ndarray:
+        """The colors as pixels of the surface."""
+        pixel_format = (surface.get_bitsize(), *surface.get_masks())
+        pixels = self._pixels.get(pixel_format)
+        if pixels is None:
+            pixels = self._pixels[pixel_format] = {
+                int(color): surface.map_rgb(color)
+                for color in PROJECTILE_COLOR_MAP.values()
+            }
+        keys, index = np.unique(
+            np.fromiter(map(int, colors), dtype=np.int64, count=len(colors)),
+            return_inverse=True,
+        )
+        palette = np.empty(len(keys), dtype=np.uint32)
+        for i, key in enumerate(keys.tolist()):
+            pixel = pixels.get(key)
+            if pixel is None:
+                pixel = pixels[key] = surface.map_rgb(Color(key))
+            palette[i] = pixel
+        return palette[index]
@@ -1,20 +1,52 @@
+from itertools import chain
 import math
 import random
 
+import numpy as np
 import pygame
 from pygame import Color, Vector2, freetype
 from src.entities.artifact_chest import ArtifactChest
 from src.misc.artifacts import Artifact
 from src.entities.enemy import Enemy
-from src.utils.enums import ArtifactType, EnemyType, ProjectileType
+from src.utils.enums import (
+    ArtifactType,
+    EnemyType,
+    EntityType,
+    ProjectileType,
+    HazardKind,
+    SpriteShape,
+    AnimationType,
+    RenderQuality,
+)
 
 from src.game import Game
 from src.entities.entity import Entity
 from src.entities.mine import Mine
 from src.entities.bomb import Bomb
 from src.entities.projectile import Projectile
+from src.entities.aoe_effect import AOEEffect
+from src.entities.energy_orb import EnergyOrb
+from src.entities.corpse import Corpse
+from src.misc.entity_registry import RENDER_ORDER
+from src.misc.animation import (
+    yellow_to_bg_gradient,
+    boss_to_bg_gradient,
+    white_to_bg_gradient,
+    magenta_to_bg_gradient,
+)
 from src.utils.utils import Slider, Timer
-from front.utils import ColorGradient, Label, TextBox
+from front.utils import Label, TextBox
+from front.sprite_atlas import (
+    SpriteAtlas,
+    StatusRingCache,
+    TrailPalette,
+    rasterize,
+)
+from front.dirty_rects import dirty_rects
+from front.static_layer import StaticLayer
+from front.pixel_stamps import DiscStamps
+from front.render_quality import RenderQualityController
+from front.render_thread import DisplayList, RenderThread
 from config import (
     PLAYER_SHOT_COST,
     PLAYER_DEFAULT_SPEED_RANGE,
@@ -24,12 +56,17 @@ from config import (
     GRAY_HEX,
     WAVE_DURATION,
     BM,
+    BACKGROUND_COLOR_HEX,
     BULLET_SHIELD_SIZE,
     NICER_MAGENTA_HEX,
     NICER_GREEN_HEX,
     BOSS_ENEMY_COLOR_HEX,
     LIGHT_ORANGE_HEX,
     MINER_DETONATION_RADIUS,
+    TRAIL_DOT_RADIUS,
+    QUALITY_TRAIL_FRACTIONS,
+    HUD_REFRESH_RATE,
+    PROJECTILE_PIXEL_RENDER_THRESHOLD,
 )
 
 
@@ -46,8 +83,18 @@ RED = Color(NICER_RED_HEX)
 GRAY = Color(GRAY_HEX)
 DARK_PURPLE = Color("#772277")
 BLACK = Color("black")
+BACKGROUND_COLOR = Color(BACKGROUND_COLOR_HEX)
 BOSS_ENEMY_COLOR = Color(BOSS_ENEMY_COLOR_HEX)
 ALMOST_BG_COLOR = Color("#080808")
+DEF_TRAJ_DOT_COLOR = Color("#202020")
+HAZARD_KIND_OVERLAY_COLOR = {
+    HazardKind.OIL_SPILL: Color("#a37d37"),
+    HazardKind.AOE_DAMAGE: RED,
+    HazardKind.AOE_ENEMY_BLOCK: LIGHT_ORANGE,
+    HazardKind.MINE: Color("#851828"),
+}
+
+status_rings = StatusRingCache()
 
 
 def draw_circular_status_bar(
@@ -61,10 +108,9 @@ def draw_circular_status_bar(
 ):
     arc_percent = slider.get_percent_full()
     if draw_full or arc_percent < 1.0:
-        angle = math.pi * (2 * arc_percent + 0.5)
-        rect = pygame.Rect(0, 0, radius * 2, radius * 2)
-        rect.center = pos
-        pygame.draw.arc(surface, color, rect, math.pi / 2, angle, width=width)
+        dirty_rects.add(
+            status_rings.blit(surface, pos, arc_percent, radius, color, width)
+        )
 
 
 OPTION_CIRCLE_SIZE = 50.0
@@ -166,10 +212,48 @@ class UltimatePicker:
 
 
 class RenderManager:
+    """
+    Draws the game world onto the display.
+
+    With a render scale under 1.0 the world is drawn at a lower resolution onto
+    an offscreen surface (`world`), which is then scaled up onto the display
+    (`display`). The game itself stays in display coordinates: the drawing
+    goes through `at`, `px` and `stroke`, which map them to the render surface.
+    The overlays (the ultimate picker, the debug info) and the text labels are
+    drawn straight onto the display, at its full resolution.
+
+    With the render thread on, the world is recorded into a DisplayList instead
+    (`surface`), which the RenderThread replays onto the display (or the
+    offscreen world) while the game updates (`replay_world`). The animations
+    are then drawn after the replay, over the world.
+    """
+
     HP_COLOR_GRADIENT = (Color("red"), Color("green"))
 
-    def __init__(self, surface: pygame.Surface, game: Game, debug: bool = False):
-        self.surface = surface
+    def __init__(
+        self,
+        surface: pygame.Surface,
+        game: Game,
+        debug: bool = False,
+        render_scale: float = 1.0,
+        render_thread: bool = False,
+    ):
+        self.display = surface
+        self.surface: pygame.Surface | DisplayList = surface
+        self.scale = 1.0
+        self.world: pygame.Surface | None = None
+        if render_scale < 1.0:
+            width, height = surface.get_size()
+            # opaque, with the background: it is scaled over the whole display
+            self.world = pygame.Surface(
+                (round(width * render_scale), round(height * render_scale))
+            ).convert(surface)
+            self.world.fill(BACKGROUND_COLOR)
+            self.surface = self.world
+            self.scale = self.world.get_width() / width
+        self.render_thread: RenderThread | None = None
+        if render_thread:
+            self.render_thread = RenderThread(self.surface)  # type: ignore
         self.debug = debug
         self.game = game
         self.screen_center = Vector2(surface.get_rect().center)
@@ -179,58 +263,81 @@ class RenderManager:
         self.entities_drawn = 0
         self.five_sec_timer = Timer(5.0)
         self.boss_soon_slider = Slider(1.0, 0.0)
-        top_right = Vector2(self.surface.get_rect().topright)
-        self.debug_textbox = TextBox([""] * 6, Vector2(), self.surface)
+        top_right = Vector2(self.display.get_rect().topright)
+        self.debug_textbox = TextBox([""] * 7, Vector2(), self.display)
         self.debug_textbox.set_top_right(top_right - Vector2(100.0, -BM))
-
-    def render(self):
-        for oil_spill in self.game.oil_spills():
-            self.draw_entity_basics(oil_spill)
-        for aoe_effect in self.game.aoe_effects():
-            self.draw_entity_basics(aoe_effect)
-            pygame.draw.circle(
-                self.surface,
-                BLACK,
-                aoe_effect.get_pos(),
-                aoe_effect.get_size(),
-                width=5,
-            )
-        for projectile in self.game.projectiles():
-            self.draw_projectile(projectile)
-        for enemy in self.game.enemies():
-            self.draw_enemy(enemy)
-        for energy_orb in self.game.energy_orbs():
-            self.draw_entity_basics(energy_orb)
-            draw_circular_status_bar(
-                self.surface,
-                energy_orb.get_pos(),
-                energy_orb.i_has_lifetime.timer.get_slider(reverse=True),
-                energy_orb.get_size() * 2.0,
-                color=energy_orb.color,
-                draw_full=True,
-                width=1,
-            )
-        for corpse in self.game.corpses():
-            self.draw_entity_basics(corpse)
-            draw_circular_status_bar(
-                self.surface,
-                corpse.get_pos(),
-                corpse.give_blocks_timer.get_slider(reverse=True),
-                corpse.get_size() * 0.6,
-                BLACK,
-                width=4,
-            )
-        for mine in self.game.mines():
-            self.draw_mine(mine)
-        for art_chest in self.game.artifact_chests():
-            self.draw_artifact_chest(art_chest)
+        self.debug_refresh_timer = Timer(1.0 / HUD_REFRESH_RATE)
+        self.debug_refresh_timer.turn_off()
+        self.hazard_field_overlay: pygame.Surface | None = None
+        self.labels: list[tuple[str, Vector2]] = []  # of the frame, on the display
+        self.hazard_field_overlay_version = -1
+        self.atlas = SpriteAtlas()
+        self.disc_stamps = DiscStamps()
+        self.trail_dot_radius = self.stroke(TRAIL_DOT_RADIUS)
+        self.trail_palette = TrailPalette(dot_radius=self.trail_dot_radius)
+        self.static_layer = StaticLayer(self.surface.get_size(), self.static_sprites)
+        self.quality = RenderQualityController(game.settings.framerate)
+        self.tier = self.quality.tier  # for the whole frame
+        # what is drawn on top of the bodies of the entities of each type
+        self.entity_drawers = {
+            EntityType.OIL_SPILL: self.draw_entity_details,
+            EntityType.CRATER: self.draw_aoe_effect,
+            EntityType.PROJECTILE: self.draw_projectile,
+            EntityType.ENEMY: self.draw_enemy,
+            EntityType.ENERGY_ORB: self.draw_energy_orb,
+            EntityType.CORPSE: self.draw_corpse,
+            EntityType.MINE: None,
+            EntityType.ARTIFACT_CHEST: self.draw_artifact_chest,
+            EntityType.BOMB: self.draw_bomb,
+        }
+
+    def render(self, time_delta: float):
+        if self.render_thread is not None:
+            # the world of the last frame, replayed while the game updated
+            self.render_thread.wait()
+            self.present_world()
+            target = self.world if self.world is not None else self.display
+            self.surface = DisplayList(target.get_size())
+            if self.world is not None:
+                self.surface.fill(BACKGROUND_COLOR)
+        self.tier = self.quality.tier
+        self.game.animation_handler.simplified = self.tier >= RenderQuality.LOW
+        if self.debug or self.ult_picker.is_on:
+            # the overlays and the picker are not tracked
+            dirty_rects.request_full_redraw()
+        self.draw_animations()
+        self.static_layer.sync(self.static_elements())
+        self.static_layer.blit(self.surface)
+        for ent_type in RENDER_ORDER:
+            entities = list(self.game.entities.of_type(ent_type))
+            # all the bodies of a layer are blitted at once, then the details
+            if (
+                ent_type == EntityType.PROJECTILE
+                and len(entities) > PROJECTILE_PIXEL_RENDER_THRESHOLD
+            ):
+                self.stamp_projectile_bodies(entities)  # type: ignore
+            else:
+                for entity in entities:
+                    self.queue_entity_body(entity)
+                self.atlas.flush(self.surface)
+            self.draw_trails(entities)
+            draw = self.entity_drawers[ent_type]
+            if draw is not None:
+                for entity in entities:
+                    draw(entity)
         for line in self.game.lines():
-            pygame.draw.line(self.surface, line.color, line.p1, line.p2, width=2)
-        for magnet in self.game.bombs():
-            self.draw_bomb(magnet)
-        self.ult_picker.render()
+            dirty_rects.add(self.draw_line(line.color, line.p1, line.p2, width=2))
         self.dash_animation()
         self.draw_player()
+        if self.render_thread is not None:
+            self.render_thread.stage(self.surface)  # type: ignore
+        else:
+            self.present_world()
+        # over the world, at the full resolution of the display
+        if self.debug:
+            self.draw_hazard_field_overlay()
+        self.draw_labels()
+        self.ult_picker.render()
 
         # "boss spawns in 5 seconds" indicator
         if self.game.one_wave_timer.get_value() > WAVE_DURATION - 5.0:
@@ -239,7 +346,7 @@ class RenderManager:
                 - (self.game.one_wave_timer.get_value() - (WAVE_DURATION - 5.0)) / 5.0
             )
             draw_circular_status_bar(
-                self.surface,
+                self.display,
                 self.screen_center,
                 self.boss_soon_slider,
                 80.0,
@@ -248,7 +355,11 @@ class RenderManager:
                 width=8,
             )
 
+        # the debug rows are refreshed at HUD_REFRESH_RATE
         if self.debug:
+            self.debug_refresh_timer.tick(time_delta)
+        if self.debug and not self.debug_refresh_timer.running():
+            self.debug_refresh_timer.reset()
             ROWS = [
                 "fps",
                 "entities drawn",
@@ -256,6 +367,7 @@ class RenderManager:
                 "accuracy",
                 "orbs collected",
                 "damage received",
+                "quality",
             ]
             VALUES = [
                 f"{self.game.get_last_fps():.1f}",
@@ -264,17 +376,58 @@ class RenderManager:
                 f"{self.game.player.get_stats().get_accuracy():.0%}",
                 f"{self.game.player.get_stats().ENERGY_ORBS_COLLECTED}/{self.game.energy_orbs_spawned}",
                 f"{self.game.player.get_stats().DAMAGE_TAKEN:.1f}",
+                self.tier.name.lower(),
             ]
             self.debug_textbox.set_lines(
                 [f"[{row:<16} {value:>5}]" for row, value in zip(ROWS, VALUES)]
             )
+        if self.debug:
             self.debug_textbox.update()
         self.reset()
 
+    def draw_labels(self):
+        """The text queued while drawing the world, in display coordinates."""
+        for text, position in self.labels:
+            Label(text, self.display, position=position).update()
+        self.labels.clear()
+
+    def draw_hazard_field_overlay(self):
+        """Draws the cells of the hazard field that are reached by any hazard.
+        The overlay is rebuilt only when the hazard field changes."""
+        hazard_field = self.game.hazard_field
+        if self.hazard_field_overlay_version != hazard_field.version:
+            self.hazard_field_overlay_version = hazard_field.version
+            self.hazard_field_overlay = None
+            rgb = np.zeros(
+                (hazard_field.n_cols, hazard_field.n_rows, 3), dtype=np.uint8
+            )
+            covered = np.zeros((hazard_field.n_cols, hazard_field.n_rows), dtype=bool)
+            for kind, color in HAZARD_KIND_OVERLAY_COLOR.items():
+                kind_covered = hazard_field.coverage(kind).T
+                rgb[kind_covered] = (color.r, color.g, color.b)
+                covered |= kind_covered
+            if covered.any():
+                # crop to the covered cells to keep the blit small
+                cols = np.flatnonzero(covered.any(axis=1))
+                rows = np.flatnonzero(covered.any(axis=0))
+                c0, c1, r0, r1 = cols[0], cols[-1] + 1, rows[0], rows[-1] + 1
+                small = pygame.surfarray.make_surface(rgb[c0:c1, r0:r1]).convert_alpha()
+                alpha = pygame.surfarray.pixels_alpha(small)
+                alpha[:] = covered[c0:c1, r0:r1] * 40
+                del alpha  # unlocks the surface
+                self.hazard_field_overlay = pygame.transform.scale_by(
+                    small, hazard_field.cell_size
+                )
+                self.hazard_field_overlay_pos = (
+                    hazard_field.origin + Vector2(c0, r0) * hazard_field.cell_size
+                )
+        if self.hazard_field_overlay is not None:
+            # straight onto the display, at its full resolution
+            self.display.blit(self.hazard_field_overlay, self.hazard_field_overlay_pos)
+
     def draw_entity_debug(self, entity: Entity):
         if entity.speed and entity.vel.magnitude_squared():
-            pygame.draw.line(
-                self.surface,
+            self.draw_line(
                 WHITE,
                 entity.get_pos(),
                 entity.get_pos() + entity.vel.normalize() * entity.speed * 0.1,
@@ -286,23 +439,15 @@ class RenderManager:
         return -5.625 * x**2 + 4.625 * x + 1
 
     def draw_bomb(self, bomb: Bomb):
-        pygame.draw.circle(
-            self.surface,
-            bomb.get_color(),
-            bomb.get_pos(),
-            bomb.get_size(),
-            width=4,
-        )
-        draw_circular_status_bar(
-            self.surface,
+        self.draw_circle(bomb.get_color(), bomb.get_pos(), bomb.get_size(), width=4)
+        self.draw_status_bar(
             bomb.get_pos(),
             bomb.defuse_timer.get_slider(),
             bomb.get_size() * 0.8,
             color=WHITE,
             width=3,
         )
-        draw_circular_status_bar(
-            self.surface,
+        self.draw_status_bar(
             bomb.get_pos(),
             bomb.i_has_lifetime.timer.get_slider(reverse=True),
             bomb.get_size() * 1.0,
@@ -311,8 +456,7 @@ class RenderManager:
         )
         p = bomb.get_pos() + Vector2(-bomb.get_size(), 0)
         p_to_center = (bomb.get_pos() - p).normalize()
-        pygame.draw.line(
-            self.surface,
+        self.draw_line(
             WHITE,
             p + p_to_center * 5,
             p - p_to_center * 5,
@@ -321,7 +465,7 @@ class RenderManager:
 
     def draw_artifact_chest(self, art_chest: ArtifactChest):
         can_be_picked_up = art_chest.can_be_picked_up()
-        self.draw_entity_basics(art_chest)
+        self.draw_entity_details(art_chest)
         pos = art_chest.get_pos()
         size = art_chest.get_size()
         _color = (
@@ -329,96 +473,112 @@ class RenderManager:
             if can_be_picked_up
             else GRAY
         )
-        draw_circular_status_bar(
-            self.surface,
+        self.draw_status_bar(
             pos,
             art_chest.i_has_lifetime.timer.get_slider(reverse=True),
             size * 1.2,
             color=WHITE,
             width=2,
         )
-        for i in range(3):
-            pygame.draw.circle(self.surface, _color, pos, size * i / 3 + 3, width=3)
-        label = Label(
-            str(art_chest.artifact),
+        self.atlas.blit(
             self.surface,
-            position=pos + Vector2(-size, -size * 1.5),
+            SpriteShape.RINGS,
+            self.at(pos),
+            self.px(size),
+            _color,
+            width=self.stroke(3),
+        )
+        self.labels.append((str(art_chest.artifact), pos + Vector2(-size, -size * 1.5)))
+
+    def draw_aoe_effect(self, aoe_effect: AOEEffect):
+        self.draw_entity_details(aoe_effect)
+        self.draw_circle(BLACK, aoe_effect.get_pos(), aoe_effect.get_size(), width=5)
+
+    def draw_energy_orb(self, energy_orb: EnergyOrb):
+        self.draw_entity_details(energy_orb)
+        if self.tier >= RenderQuality.MINIMAL:
+            return
+        self.draw_status_bar(
+            energy_orb.get_pos(),
+            energy_orb.i_has_lifetime.timer.get_slider(reverse=True),
+            energy_orb.get_size() * 2.0,
+            color=energy_orb.color,
+            draw_full=True,
+            width=1,
+        )
+
+    def draw_corpse(self, corpse: Corpse):
+        self.draw_entity_details(corpse)
+        if self.tier >= RenderQuality.MINIMAL:
+            return
+        self.draw_status_bar(
+            corpse.get_pos(),
+            corpse.give_blocks_timer.get_slider(reverse=True),
+            corpse.get_size() * 0.6,
+            BLACK,
+            width=4,
         )
-        label.update()
 
     def draw_enemy(self, enemy: Enemy):
-        self.draw_entity_basics(enemy)
+        self.draw_entity_details(enemy)
         # do not draw health bar if enemy can always be killed with one shot
         can_one_shot = (
             enemy.health.max_value
             <= self.game.player.get_damage() - self.game.player.damage_spread
         )
-        draw_circular_status_bar(
-            self.surface,
-            enemy.get_pos(),
-            enemy.get_health(),
-            enemy.get_size() * 1.0,
-            color=NICER_GREEN,
-            draw_full=not can_one_shot,
-            width=3,
-        )
-        if enemy.has_block:
-            block_vec = Vector2(enemy.get_size(), 0.0) * 1.2
-            delta = Vector2(0.0, 4)
-            pygame.draw.line(
-                self.surface,
-                LIGHT_ORANGE,
-                enemy.get_pos() - block_vec + delta,
-                enemy.get_pos() + block_vec + delta,
-                width=5,
+        if not (can_one_shot and self.tier >= RenderQuality.REDUCED):
+            self.draw_status_bar(
+                enemy.get_pos(),
+                enemy.get_health(),
+                enemy.get_size() * 1.0,
+                color=NICER_GREEN,
+                draw_full=not can_one_shot,
+                width=3,
             )
-            pygame.draw.line(
+        if enemy.has_block:
+            self.atlas.blit(
                 self.surface,
+                SpriteShape.BLOCK,
+                self.at(enemy.get_pos()),
+                self.px(enemy.get_size()),
                 LIGHT_ORANGE,
-                enemy.get_pos() - block_vec - delta,
-                enemy.get_pos() + block_vec - delta,
-                width=5,
+                width=self.stroke(5),
             )
         if self.game.time_frozen and enemy.enemy_type != EnemyType.GHOST:
             cross_vec = Vector2(enemy.get_size(), enemy.get_size()) * 1.7
-            pygame.draw.line(
-                self.surface,
+            self.draw_line(
                 WHITE,
                 enemy.get_pos() - cross_vec,
                 enemy.get_pos() + cross_vec,
                 width=4,
             )
         # if less than 1. sec left on the cooldown timer, indicate shooting intent
-        if enemy.shoots_player:
+        if enemy.shoots_player and self.tier < RenderQuality.LOW:
             if (t := enemy.cooldown.get_time_left()) < 1.0:
-                pygame.draw.circle(
-                    self.surface,
+                self.draw_circle(
                     WHITE,
                     enemy.get_pos(),
                     enemy.get_size() * self.soon_shooting_coef_function(1.0 - t),
                     width=3,
                 )
-        if enemy.enemy_type == EnemyType.MINER:
-            pygame.draw.circle(
-                self.surface,
-                ALMOST_BG_COLOR,
-                enemy.get_pos(),
-                MINER_DETONATION_RADIUS,
-                width=2,
+        if enemy.enemy_type == EnemyType.MINER and self.tier < RenderQuality.REDUCED:
+            self.draw_circle(
+                ALMOST_BG_COLOR, enemy.get_pos(), MINER_DETONATION_RADIUS, width=2
             )
         if self.debug:
-            health_text = f"{enemy.get_health()}"
-            label = Label(
-                health_text,
-                self.surface,
-                position=enemy.get_pos()
-                + Vector2(enemy.get_size(), -enemy.get_size() * 1.5),
-            )
-            label.update()
+            offset = Vector2(enemy.get_size(), -enemy.get_size() * 1.5)
+            self.labels.append((f"{enemy.get_health()}", enemy.get_pos() + offset))
 
     def draw_player(self):
         player = self.game.player
         self.draw_entity_basics(player)
+        # the move arrow goes the furthest, unless the bullet shield is on
+        arrow_length = player.get_size() * 2.0 * math.exp(
+            player.speed / PLAYER_DEFAULT_SPEED_RANGE[1]
+        )
+        dirty_rects.add_circle(
+            player.get_pos(), max(arrow_length, BULLET_SHIELD_SIZE + 10.0) + 10.0
+        )
 
         player_indicator_default_color = (
             YELLOW if not self.game.is_victory else LIGHTER_MAGENTA
@@ -436,8 +596,7 @@ class RenderManager:
             player.artifacts_handler.is_present(ArtifactType.RAGE)
             and player.artifacts_handler.get_rage().is_on()
         ):
-            draw_circular_status_bar(
-                self.surface,
+            self.draw_status_bar(
                 player.get_pos(),
                 player.artifacts_handler.get_rage().duration_timer.get_slider(
                     reverse=True
@@ -448,17 +607,16 @@ class RenderManager:
             )
             _indicator_color = DARK_PURPLE
 
-        pygame.draw.circle(
-            self.surface,
+        self.draw(
+            pygame.draw.circle,
             _indicator_color,
-            player.get_pos(),
-            player.get_size(),
-            width=6,
+            self.at(player.get_pos()),
+            self.px(player.get_size()),
+            width=self.stroke(6),
         )
 
         # shoot cooldown indicator
-        draw_circular_status_bar(
-            self.surface,
+        self.draw_status_bar(
             player.get_pos(),
             player.shoot_cooldown_timer.get_slider(),
             player.get_size() * 2,
@@ -475,15 +633,13 @@ class RenderManager:
             left = move_direction_smaller.rotate(angle)
             right = move_direction_smaller.rotate(-angle)
             mid_point = player.get_pos() + move_direction
-            pygame.draw.line(
-                self.surface,
+            self.draw_line(
                 _indicator_color,
                 mid_point,
                 player.get_pos() + left,
                 width=4,
             )
-            pygame.draw.line(
-                self.surface,
+            self.draw_line(
                 _indicator_color,
                 mid_point,
                 player.get_pos() + right,
@@ -495,11 +651,14 @@ class RenderManager:
             player.artifacts_handler.is_present(ArtifactType.BULLET_SHIELD)
             and player.artifacts_handler.get_bullet_shield().is_on()
         ):
-            pygame.draw.circle(
-                self.surface, YELLOW, player.get_pos(), BULLET_SHIELD_SIZE, width=2
+            self.draw(
+                pygame.draw.circle,
+                YELLOW,
+                self.at(player.get_pos()),
+                self.px(BULLET_SHIELD_SIZE),
+                width=self.stroke(2),
             )
-            draw_circular_status_bar(
-                self.surface,
+            self.draw_status_bar(
                 player.get_pos(),
                 player.artifacts_handler.get_bullet_shield().duration_timer.get_slider(
                     reverse=True
@@ -512,8 +671,7 @@ class RenderManager:
             player.artifacts_handler.is_present(ArtifactType.TIME_SLOW)
             and player.artifacts_handler.get_time_slow().is_on()
         ):
-            draw_circular_status_bar(
-                self.surface,
+            self.draw_status_bar(
                 player.get_pos(),
                 player.artifacts_handler.get_time_slow().duration_timer.get_slider(
                     reverse=True
@@ -523,19 +681,24 @@ class RenderManager:
             )
 
     def draw_projectile(self, projectile: Projectile):
-        if projectile.projectile_type == ProjectileType.DEF_TRAJECTORY:
-            for def_traj_pos in projectile.render_traj_points:  # type: ignore
-                pygame.draw.circle(self.surface, "#202020", def_traj_pos, 2)
+        self.draw_entity_details(projectile)
+        if (
+            projectile.projectile_type == ProjectileType.DEF_TRAJECTORY
+            and self.tier < RenderQuality.LOW
+        ):
+            # the path itself is on the static layer
+            if dirty_rects.enabled and projectile.render_traj_points:  # type: ignore
+                dirty_rects.add_points(
+                    np.array(projectile.render_traj_points), 2, per_rect=1  # type: ignore
+                )
         if self.game.time_frozen and projectile.projectile_type != ProjectileType.PLAYER_BULLET:
             cross_vec = Vector2(projectile.get_size(), projectile.get_size()) * 2.0
-            pygame.draw.line(
-                self.surface,
+            self.draw_line(
                 WHITE,
                 projectile.get_pos() - cross_vec,
                 projectile.get_pos() + cross_vec,
                 width=2,
             )
-        self.draw_entity_basics(projectile)
 
     def dash_animation(self):
         if self.game.player.artifacts_handler.is_present(ArtifactType.DASH):
@@ -543,41 +706,301 @@ class RenderManager:
             if not dash.path_animation_lingering_timer.running():
                 return
             a, b = dash.dash_path_history[-1]
+            dirty_rects.add_points(np.array((a, b)), 2)
             N = 50
             for i in range(N):
-                pygame.draw.circle(self.surface, NICER_GREEN, a + (b - a) * i / N, 2)
+                self.atlas.queue(
+                    SpriteShape.CIRCLE,
+                    self.at(a + (b - a) * i / N),
+                    self.px(2),
+                    NICER_GREEN,
+                )
+            self.atlas.flush(self.surface)
 
-    def draw_entity_trail(self, entity: Entity):
-        if not entity.i_render_trail:
+    def draw_trails(self, entities: list[Entity]):
+        """The trails of all the entities, blitted at once; the newest part only
+        at the lower quality tiers."""
+        fraction = QUALITY_TRAIL_FRACTIONS[self.tier]
+        if not fraction:
             return
-        _trail_len = len(entity.i_render_trail.get_trail())
-        color_gradient = ColorGradient(BLACK, entity.get_color())
-        for i, pos in enumerate(entity.i_render_trail.get_trail()):
-            pygame.draw.circle(
-                self.surface, color_gradient(i / _trail_len), pos, 3.0, width=1
-            )
+        batch = []
+        for entity in entities:
+            if entity.i_render_trail is None:
+                continue
+            points = entity.i_render_trail.get_trail()
+            if fraction < 1.0:
+                points = points[len(points) - int(len(points) * fraction) :]
+            if not len(points):
+                continue
+            dirty_rects.add_points(points, TRAIL_DOT_RADIUS)
+            if self.scale != 1.0:
+                points = points * self.scale
+            dots = self.trail_palette.sprites(entity.get_color(), len(points))
+            corners = points.astype(int) - self.trail_dot_radius
+            batch.extend(zip(dots, corners.tolist()))
+        if batch:
+            self.surface.blits(batch, doreturn=False)
+
+    def draw_animations(self):
+        """
+        The animations, under everything else: the primitives of each type are
+        laid out for all its animations at once, then drawn in one go.
+        """
+        handler = self.game.animation_handler
+        pos, params, p = handler.live(AnimationType.ACCURATE_SHOT)
+        if len(p):
+            colors = yellow_to_bg_gradient.colors(p)
+            size, direction = params[:, :1], params[:, 1:]
+            normal = direction[:, ::-1] * (-1.0, 1.0)  # the direction turned by 90°
+            for i in [1.0] if handler.simplified else [1.0, 1.5, 2.0]:
+                seed = (
+                    pos + direction * (1 - p + (10 * i) * p)[:, None] + size * direction
+                )
+                wing = normal * ((size * 5 * (1 - p)[:, None]) / i) * 0.5
+                self.draw_batch(pygame.draw.line, colors, seed - wing, seed + wing, 3)
+        pos, params, p = handler.live(AnimationType.ENEMY_SPAWNED)
+        if len(p):
+            colors = white_to_bg_gradient.colors(p)
+            radii = params[:, 0] * (1.0 + 2.0 * p)
+            self.draw_batch(pygame.draw.circle, colors, pos, radii, 3)
+        pos, params, p = handler.live(AnimationType.BOSS_DIED)
+        if len(p):
+            colors = boss_to_bg_gradient.colors(p)
+            for i in [2] if handler.simplified else [2, 3, 4]:
+                radii = params[:, 0] * (1.0 + i * p)
+                self.draw_batch(pygame.draw.circle, colors, pos, radii, i)
+        pos, _, p = handler.live(AnimationType.ENERGY_ORB_COLLECTED)
+        if len(p):
+            colors = magenta_to_bg_gradient.colors(p)
+            radii = np.full(len(p), 10.0)
+            self.draw_batch(pygame.draw.circle, colors, pos, radii, 3)
+
+    def draw_batch(
+        self,
+        primitive,
+        colors: list[Color],
+        points: np.ndarray,
+        extents: np.ndarray,
+        width: int,
+    ):
+        """
+        A primitive per color: a line from a point to an extent (shape (n, 2)),
+        or a circle around a point of radius an extent (shape (n,)).
+        """
+        width, draw, add = self.stroke(width), self.draw, dirty_rects.add
+        points, extents = points * self.scale, extents * self.scale
+        for color, point, extent in zip(colors, points.tolist(), extents.tolist()):
+            add(draw(primitive, color, point, extent, width))
+
+    def draw_circle(self, color, pos: Vector2, radius: float, width: int = 0):
+        """pygame.draw.circle through the sprite atlas when the circle is small enough."""
+        pos, radius, width = self.at(pos), self.px(radius), self.stroke(width)
+        if self.atlas.fits(radius):
+            self.atlas.blit(self.surface, SpriteShape.CIRCLE, pos, radius, color, width)
+        else:
+            self.draw(pygame.draw.circle, color, pos, radius, width=width)
 
-    def draw_entity_basics(self, entity: Entity):
-        pygame.draw.circle(
-            self.surface, entity.get_color(), entity.get_pos(), entity.get_size()
+    def draw_line(self, color, start: Vector2, end: Vector2, width: int = 1):
+        return self.draw(
+            pygame.draw.line, color, self.at(start), self.at(end), self.stroke(width)
+        )
+
+    def draw(self, primitive, *args, **kwargs) -> pygame.Rect:
+        """A pygame.draw function onto the render surface (or the display list)."""
+        if isinstance(self.surface, DisplayList):
+            return self.surface.draw(primitive, *args, **kwargs)
+        return primitive(self.surface, *args, **kwargs)
+
+    def draw_status_bar(
+        self,
+        pos: Vector2,
+        slider: Slider,
+        radius: float,
+        color: Color = Color("white"),
+        draw_full: bool = False,
+        width: int = 3,
+    ):
+        draw_circular_status_bar(
+            self.surface,
+            self.at(pos),
+            slider,
+            self.px(radius),
+            color=color,
+            draw_full=draw_full,
+            width=self.stroke(width),
         )
+
+    def at(self, pos) -> Vector2:
+        """A point of the game on the render surface."""
+        return Vector2(pos) * self.scale
+
+    def px(self, length: float) -> float:
+        """A length of the game on the render surface."""
+        return length * self.scale
+
+    def stroke(self, width: int) -> int:
+        """The width of a line on the render surface, at least a pixel."""
+        if self.scale == 1.0:
+            return width
+        return max(1, round(width * self.scale))
+
+    def present_world(self):
+        """Draw the world over the display when it is drawn offscreen."""
+        if self.world is None:
+            return
+        pygame.transform.scale(self.world, self.display.get_size(), self.display)
+        if self.render_thread is None:
+            self.world.fill(BACKGROUND_COLOR)  # the display list clears it otherwise
+
+    def replay_world(self):
+        """Start drawing the world of the last frame on the render thread."""
+        if self.render_thread is not None:
+            self.render_thread.start()
+
+    def close(self):
+        if self.render_thread is not None:
+            self.render_thread.close()
+
+    @staticmethod
+    def entity_reach(entity: Entity) -> float:
+        """How far from its center an entity is drawn, with all its indicators."""
+        size = entity.get_size()
+        ent_type = entity.get_type()
+        if ent_type == EntityType.ENEMY:
+            # the "about to shoot" circle grows up to twice the size
+            reach = size * 2.0 + 3.0
+            if entity.enemy_type == EnemyType.MINER:  # type: ignore
+                return max(reach, MINER_DETONATION_RADIUS + 2.0)
+            return reach
+        if ent_type == EntityType.PROJECTILE:
+            return size * 3.0 + 2.0  # the cross over the frozen ones
+        if ent_type == EntityType.ENERGY_ORB:
+            return size * 2.0 + 2.0
+        return size * 1.25 + 4.0  # the mine ellipses, the chest timer
+
+    def queue_entity_body(self, entity: Entity):
+        """Queue the body of the entity to be blitted with the rest of its layer."""
+        dirty_rects.add_circle(entity.get_pos(), self.entity_reach(entity))
         self.entities_drawn += 1
-        self.draw_entity_trail(entity)
+        if self.is_static(entity):
+            return  # the body is on the static layer
+        if entity.get_type() == EntityType.MINE:
+            self.queue_mine(entity)  # type: ignore
+        elif self.atlas.fits(self.px(entity.get_size())):
+            self.atlas.queue(
+                SpriteShape.CIRCLE,
+                self.at(entity.get_pos()),
+                self.px(entity.get_size()),
+                entity.get_color(),
+            )
+        else:
+            self.draw(
+                pygame.draw.circle,
+                entity.get_color(),
+                self.at(entity.get_pos()),
+                self.px(entity.get_size()),
+            )
+
+    def stamp_projectile_bodies(self, projectiles: list[Projectile]):
+        """The bodies of many projectiles, written into the pixels at once."""
+        points = np.fromiter(
+            chain.from_iterable(projectile.pos for projectile in projectiles),
+            dtype=float,
+            count=2 * len(projectiles),
+        ).reshape(-1, 2)
+        self.entities_drawn += len(projectiles)
+        dirty_rects.add_points(points, self.entity_reach(projectiles[0]), per_rect=1)
+        by_radius: dict[float, list[int]] = {}
+        for i, projectile in enumerate(projectiles):
+            by_radius.setdefault(projectile.size, []).append(i)
+        for size, indices in by_radius.items():
+            radius = self.px(size)
+            if len(indices) == len(projectiles):
+                group, colors = points, [p.color for p in projectiles]
+            else:
+                group, colors = points[indices], [projectiles[i].color for i in indices]
+            self.draw(self.disc_stamps.stamp, group * self.scale, radius, colors)
+
+    @staticmethod
+    def is_static(entity: Entity) -> bool:
+        """Whether the body of the entity is drawn on the static layer."""
+        ent_type = entity.get_type()
+        if ent_type == EntityType.MINE:
+            return entity.is_activated()  # type: ignore
+        return ent_type == EntityType.OIL_SPILL or ent_type == EntityType.CORPSE
+
+    def static_elements(self) -> dict:
+        """
+        The elements of the static layer, keyed by everything that changes
+        their look: the oil spills grow, the mines and the oil spills change color.
+        """
+        elements = {}
+        # the ranks follow the render order, the paths go right above the oil spills
+        for rank, ent_type in (
+            (0, EntityType.OIL_SPILL),
+            (2, EntityType.CORPSE),
+            (3, EntityType.MINE),
+        ):
+            for entity in self.game.entities.of_type(ent_type):
+                if self.is_static(entity):
+                    pos = entity.get_pos()
+                    key = (
+                        rank,
+                        entity.get_id(),
+                        int(pos[0]),
+                        int(pos[1]),
+                        int(entity.get_size()),
+                        int(Color(entity.get_color())),
+                    )
+                    elements[key] = entity
+        if self.tier >= RenderQuality.LOW:
+            return elements
+        for projectile in self.game.entities.of_type(EntityType.PROJECTILE):
+            if projectile.projectile_type == ProjectileType.DEF_TRAJECTORY:  # type: ignore
+                elements[(1, projectile.get_id())] = projectile  # never changes
+        return elements
+
+    def static_sprites(self, entity: Entity) -> tuple[pygame.Surface, np.ndarray]:
+        """The sprite of an element of the static layer and where it goes."""
+        if entity.get_type() == EntityType.PROJECTILE:
+            dot, half = self.atlas.get(
+                SpriteShape.CIRCLE, self.px(2), DEF_TRAJ_DOT_COLOR
+            )
+            points = np.array(entity.render_traj_points) * self.scale  # type: ignore
+            return dot, points.astype(int) - half
+        size, color = self.px(entity.get_size()), entity.get_color()
+        if entity.get_type() == EntityType.MINE:
+            sprite, half = self.atlas.get(
+                SpriteShape.MINE, size, color, width=self.stroke(2)
+            )
+        elif self.atlas.fits(size):
+            sprite, half = self.atlas.get(SpriteShape.CIRCLE, size, color)
+        else:  # the grown oil spills, each of its own size
+            sprite, half = rasterize(SpriteShape.CIRCLE, int(size), Color(color), 0)
+        pos = self.at(entity.get_pos())
+        return sprite, np.array([(int(pos[0]) - half, int(pos[1]) - half)])
+
+    def draw_entity_details(self, entity: Entity):
         if self.debug:
             self.draw_entity_debug(entity)
 
-    def draw_mine(self, mine: Mine):
-        """Draws two crossing ellipses"""
-        ms = mine.get_size()
-        r1 = pygame.Rect(0, 0, ms, 2.5 * ms)
-        r2 = pygame.Rect(0, 0, 2.5 * ms, ms)
-        r1.center = mine.get_pos()
-        r2.center = mine.get_pos()
+    def draw_entity_basics(self, entity: Entity):
+        self.draw_circle(entity.get_color(), entity.get_pos(), entity.get_size())
+        self.entities_drawn += 1
+        self.draw_trails([entity])
+        self.draw_entity_details(entity)
+
+    def queue_mine(self, mine: Mine):
+        """Two crossing ellipses"""
         is_activated = mine.is_activated()
         color = mine.get_color() if is_activated else random.choice([GRAY, WHITE, RED])
-        pygame.draw.ellipse(self.surface, color, r1, width=2)
-        pygame.draw.ellipse(self.surface, color, r2, width=2)
-        self.entities_drawn += 1
+        self.atlas.queue(
+            SpriteShape.MINE,
+            self.at(mine.get_pos()),
+            self.px(mine.get_size()),
+            color,
+            width=self.stroke(2),
+        )
 
     def set_debug(self, debug: bool):
         self.debug = debug
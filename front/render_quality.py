@@ -0,0 +1,57 @@
+from src.utils.enums import RenderQuality
+from config import (
+    QUALITY_FRAME_TIME_SMOOTHING,
+    QUALITY_STEP_DOWN_FRAMES,
+    QUALITY_STEP_UP_FRAMES,
+    QUALITY_STEP_UP_RATIO,
+)
+
+
+class RenderQualityController:
+    """
+    Picks the render quality tier from the measured frame times.
+
+    The frame times (the work of a frame, without waiting for the next one)
+    are smoothed with an exponential moving average. The quality goes one tier
+    down once the average has stayed over the frame budget for
+    QUALITY_STEP_DOWN_FRAMES frames in a row, and one tier up once it has
+    stayed under QUALITY_STEP_UP_RATIO of the budget for QUALITY_STEP_UP_FRAMES
+    frames: the gap between the two and the longer wait keep the tier from
+    flapping between two neighbours.
+    """
+
+    def __init__(self, framerate: int):
+        self.budget = 1.0 / framerate
+        self.tier = RenderQuality.FULL
+        self.avg_frame_time = 0.0
+        self._frames_over = 0
+        self._frames_under = 0
+
+    def report(self, frame_time: float) -> None:
+        """Take the time of the last frame into account, in seconds."""
+        self.avg_frame_time += QUALITY_FRAME_TIME_SMOOTHING * (
+            frame_time - self.avg_frame_time
+        )
+        if self.avg_frame_time > self.budget:
+            self._frames_over += 1
+            self._frames_under = 0
+        elif self.avg_frame_time < self.budget * QUALITY_STEP_UP_RATIO:
+            self._frames_under += 1
+            self._frames_over = 0
+        else:
+            self._frames_over = self._frames_under = 0
+
+        if (
+            self._frames_over >= QUALITY_STEP_DOWN_FRAMES
+            and self.tier < RenderQuality.MINIMAL
+        ):
+            self._set_tier(RenderQuality(self.tier + 1))
+        elif (
+            self._frames_under >= QUALITY_STEP_UP_FRAMES
+            and self.tier > RenderQuality.FULL
+        ):
+            self._set_tier(RenderQuality(self.tier - 1))
+
+    def _set_tier(self, tier: RenderQuality) -> None:
+        self.tier = tier
+        self._frames_over = self._frames_under = 0
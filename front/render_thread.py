@@ -0,0 +1,114 @@
+import queue
+import threading
+from typing import Callable, Iterable
+
+import pygame
+
+EMPTY_RECT = pygame.Rect(0, 0, 0, 0)
+
+
+class DisplayList:
+    """
+    The drawing of one frame of the world, recorded to be replayed later
+    (and on another thread) onto a surface.
+
+    It stands in for the render surface: it takes the same `blit`, `blits` and
+    `fill` calls, plus `draw` for the pygame.draw functions. Everything the drawing
+    depends on is resolved when it is recorded (the sprites are picked from the
+    caches, the positions are copied), so the game can move on in the meantime.
+    The calls return an empty rect: nothing is drawn yet.
+    """
+
+    def __init__(self, size: tuple[int, int]):
+        self.size = size
+        self.ops: list[tuple] = []
+
+    def get_size(self) -> tuple[int, int]:
+        return self.size
+
+    def blit(self, source: pygame.Surface, dest, area=None) -> pygame.Rect:
+        self.ops.append((pygame.Surface.blit, (source, (dest[0], dest[1]), area)))
+        return EMPTY_RECT
+
+    def blits(self, blit_sequence: Iterable, doreturn: bool = True) -> None:
+        self.ops.append((pygame.Surface.blits, (list(blit_sequence), False)))
+
+    def fill(self, color) -> pygame.Rect:
+        self.ops.append((pygame.Surface.fill, (color,)))
+        return EMPTY_RECT
+
+    def draw(self, primitive: Callable, *args, **kwargs) -> pygame.Rect:
+        """A pygame.draw function; the points must not be changed afterwards."""
+        self.ops.append((primitive, args, kwargs))
+        return EMPTY_RECT
+
+    def replay(self, surface: pygame.Surface) -> None:
+        for op in self.ops:
+            if len(op) == 2:
+                op[0](surface, *op[1])
+            else:
+                op[0](surface, *op[1], **op[2])
+
+
+class RenderThread:
+    """
+    Replays the recorded world (a DisplayList) onto a surface on a thread of its
+    own, while the main thread updates the game; pygame releases the GIL in
+    the blits.
+
+    The world of a frame is recorded after the game update (`stage`) and
+    replayed during the next game update (`start`, `wait`), so the world on the
+    screen is a frame behind the game. The main thread does not draw anything
+    while a replay runs: the surfaces, the caches and the sprites are never
+    used by both threads at once.
+
+    If the thread fails, the world is replayed on the main thread instead.
+    """
+
+    def __init__(self, target: pygame.Surface):
+        self.target = target
+        self.available = True
+        self._staged: DisplayList | None = None
+        self._todo: queue.Queue[DisplayList | None] = queue.Queue(maxsize=1)
+        self._done = threading.Event()
+        self._done.set()
+        self._thread = threading.Thread(target=self._run, name="render", daemon=True)
+        self._thread.start()
+
+    def stage(self, display_list: DisplayList) -> None:
+        self._staged = display_list
+
+    def start(self) -> None:
+        """Replay the staged world onto the world surface."""
+        display_list, self._staged = self._staged, None
+        if display_list is None:
+            return
+        if not self.available or not self._thread.is_alive():
+            self.available = False
+            display_list.replay(self.target)
+            return
+        self._done.clear()
+        self._todo.put(display_list)
+
+    def wait(self) -> None:
+        """Block until the world is drawn."""
+        self._done.wait()
+
+    def close(self) -> None:
+        self.available = False
+        if self._thread.is_alive():
+            self._todo.put(None)
+            self._thread.join()
+
+    def _run(self) -> None:
+        while (display_list := self._todo.get()) is not None:
+            try:
+                display_list.replay(self.target)
+            except Exception as e:
+                print(
+                    f"[RenderThread] replay failed ({e!r}); drawing on the main thread"
+                )
+                self.available = False
+                return
+            finally:
+                self._done.set()
@@ -0,0 +1,146 @@
+from contextlib import closing, contextmanager
+from dataclasses import dataclass
+import datetime
+import dbm
+import pickle
+import shelve
+import sqlite3
+from typing import Iterator
+
+from config.paths import SAVES_DB_FILE, SAVES_FILE
+
+NAME_FORMAT = "%d/%m/%Y, %H:%M:%S"  # the keys of the old shelve
+
+SCHEMA = (
+    """
+    CREATE TABLE saves (
+        id INTEGER PRIMARY KEY,
+        timestamp REAL NOT NULL,  -- unix time of the end of the game
+        name TEXT NOT NULL,  -- the date as shown, in NAME_FORMAT
+        score INTEGER NOT NULL,
+        level INTEGER NOT NULL,
+        difficulty INTEGER NOT NULL,
+        time REAL NOT NULL,
+        info BLOB NOT NULL  -- Game.get_info(), pickled
+    )
+    """,
+    "CREATE INDEX saves_timestamp ON saves (timestamp, id)",
+    "CREATE INDEX saves_score ON saves (score)",
+    "CREATE INDEX saves_level ON saves (level)",
+    "CREATE INDEX saves_difficulty ON saves (difficulty)",
+)
+SCHEMA_VERSION = 1
+
+
+@dataclass
+class Save:
+    id: int
+    timestamp: float
+    name: str
+    info: dict
+
+    def key(self) -> tuple[float, int]:
+        """Where the save is in the list, the newest first."""
+        return self.timestamp, self.id
+
+
+class SaveStore:
+    """
+    The saved games, in an sqlite database: a row per game with the fields to
+    sort by indexed, and the info of the game pickled, so that a page of saves
+    is read (and unpickled) without touching the others.
+
+    The pages are fetched by key, the newest saves first: a page starts after
+    the last save of the previous one (`page`). The saves of the old shelve
+    (SAVES_FILE) are moved into the database when it is created (`set_up`).
+    """
+
+    def __init__(self, path=SAVES_DB_FILE):
+        self.path = path
+
+    def set_up(self) -> None:
+        """Create the database if there is none yet, with the old saves in it."""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with self._connect() as db:
+            db.execute("BEGIN IMMEDIATE")  # the schema and the old saves, or nothing
+            if db.execute("PRAGMA user_version").fetchone()[0] >= SCHEMA_VERSION:
+                return
+            for statement in SCHEMA:
+                db.execute(statement)
+            moved = self._migrate_shelve(db)
+            db.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+        if moved:
+            print(f"[SaveStore] moved {moved} saves from {SAVES_FILE.name}")
+
+    def add(self, info: dict, when: datetime.datetime | None = None) -> None:
+        with self._connect() as db:
+            self._insert(db, info, when or datetime.datetime.now())
+
+    def page(self, size: int, after: Save | None = None) -> list[Save]:
+        """The `size` saves that come after the given one; the first ones if None."""
+        query = "SELECT id, timestamp, name, info FROM saves"
+        params: tuple = ()
+        if after is not None:
+            query += " WHERE (timestamp, id) < (?, ?)"
+            params = after.key()
+        query += " ORDER BY timestamp DESC, id DESC LIMIT ?"
+        with self._connect() as db:
+            rows = db.execute(query, (*params, size)).fetchall()
+        return [
+            Save(id_, timestamp, name, pickle.loads(info))
+            for id_, timestamp, name, info in rows
+        ]
+
+    def __len__(self) -> int:
+        with self._connect() as db:
+            return db.execute("SELECT COUNT(*) FROM saves").fetchone()[0]
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        """A connection that commits (or rolls back) and closes on exit."""
+        with closing(sqlite3.connect(self.path)) as db, db:
+            yield db
+
+    @staticmethod
+    def _insert(
+        db: sqlite3.Connection, info: dict, when: datetime.datetime, name: str = ""
+    ) -> None:
+        db.execute(
+            "INSERT INTO saves (timestamp, name, score, level, difficulty, time, info)"
+            " VALUES (?, ?, ?, ?, ?, ?, ?)",
+            (
+                when.timestamp(),
+                name or when.strftime(NAME_FORMAT),
+                info.get("score", 0),
+                info["level"],
+                info["difficulty"],
+                info["time"],
+                pickle.dumps(info),
+            ),
+        )
+
+    def _migrate_shelve(self, db: sqlite3.Connection) -> int:
+        try:
+            saves = shelve.open(str(SAVES_FILE), "r")
+        except dbm.error:
+            return 0  # there were no saves
+        moved = 0
+        with saves:
+            for name in saves:
+                try:
+                    when = datetime.datetime.strptime(name, NAME_FORMAT)
+                    self._insert(db, saves[name], when, name)
+                except (
+                    ValueError,
+                    KeyError,
+                    AttributeError,
+                    ImportError,
+                    pickle.UnpicklingError,
+                ) as e:
+                    print(f"[SaveStore] skipped the save {name!r} ({e!r})")
+                    continue
+                moved += 1
+        return moved
+
+
+save_store = SaveStore()
@@ -3,8 +3,9 @@ from abc import ABC, abstractmethod
 import pygame
 import pygame_gui
 
-from front.sounds import play_sfx
+from front.sounds import play_sfx, flush_sfx
 from front.utils import FpsInfo
+from front.dirty_rects import dirty_rects
 from config import QUIT_BUTTON_SIZE, BACKGROUND_COLOR_HEX
 from config.settings import Settings
 
@@ -21,9 +22,11 @@ class Screen(ABC):
         surface: pygame.Surface,
         bg_color: str = BACKGROUND_COLOR_HEX,
         framerate: int = FRAMERATE,
+        use_dirty_rects: bool = False,
     ):
         self.surface = surface
         self.framerate = framerate
+        self.use_dirty_rects = use_dirty_rects
         self.window_size = self.surface.get_rect().size
         self.background = pygame.Surface(self.window_size)
         self.background.fill(pygame.Color(bg_color))
@@ -60,6 +63,12 @@ class Screen(ABC):
 
     def run(self) -> FpsInfo:
         """Main loop. Returns the FPSinfo object."""
+        # screens run inside one another: the outer one takes over after this one
+        was_tracking = dirty_rects.enabled
+        if self.use_dirty_rects:
+            dirty_rects.start(self.surface.get_rect())
+        else:
+            dirty_rects.stop()
         while self.is_running:
             time_delta = self.clock.tick(self.framerate) / 1000.0
             self.fps_info.update(time_delta)
@@ -72,10 +81,32 @@ class Screen(ABC):
                 self.process_ui_event(event)
                 if not self.manager.process_events(event):
                     self.process_event(event)
-            self.surface.blit(self.background, (0, 0))
+            if self.use_dirty_rects:
+                dirty_rects.restore(self.surface, self.background)
+            else:
+                self.draw_background()
             self.manager.update(time_delta)
             self.update(time_delta)
+            flush_sfx()  # the sounds of the frame, at once
             self.manager.draw_ui(self.surface)
-            pygame.display.update()
+            self.update_display()
         self.post_run()
+        if was_tracking:
+            dirty_rects.start(self.surface.get_rect())
+        else:
+            dirty_rects.stop()
         return self.fps_info
+
+    def draw_background(self):
+        self.surface.blit(self.background, (0, 0))
+
+    def update_display(self):
+        if not self.use_dirty_rects:
+            pygame.display.update()
+            return
+        dirty_rects.add_ui(self.manager)
+        changed = dirty_rects.end_frame()
+        if changed is None:
+            pygame.display.update()
+        else:
+            pygame.display.update(changed)
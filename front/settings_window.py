@@ -3,7 +3,13 @@ import pygame_gui
 
 from front.utils import ColorGradient, paint
 from config.settings import Settings
-from config import NICER_RED_HEX, NICER_GREEN_HEX, FRAMERATE_MIN_MAX
+from config import (
+    NICER_RED_HEX,
+    NICER_GREEN_HEX,
+    FRAMERATE_MIN_MAX,
+    RENDER_SCALE_MIN_MAX,
+    COLOR_GRADIENT_STEPS,
+)
 
 
 NICER_RED = pygame.Color(NICER_RED_HEX)
@@ -31,7 +37,9 @@ class SettingsWindow(pygame_gui.elements.UIWindow):
         )
         self.menu_screen = menu_screen
         self.settings: Settings = self.menu_screen.settings
-        self.color_gradient = ColorGradient(NICER_RED, NICER_GREEN)
+        self.color_gradient = ColorGradient(
+            NICER_RED, NICER_GREEN, COLOR_GRADIENT_STEPS
+        )
 
         self.sfx_volume_slider = pygame_gui.elements.UIHorizontalSlider(
             pygame.Rect(0, 0, *SLIDERS_SIZE),
@@ -111,8 +119,30 @@ class SettingsWindow(pygame_gui.elements.UIWindow):
             container=self,
         )
 
+        rect_render_scale = pygame.Rect(0, 0, *SLIDERS_SIZE)
+        rect_render_scale.topleft = rect_framerate.bottomleft
+        self.render_scale_slider = pygame_gui.elements.UIHorizontalSlider(
+            rect_render_scale,
+            100 * self.settings.render_scale,
+            (100 * RENDER_SCALE_MIN_MAX[0], 100 * RENDER_SCALE_MIN_MAX[1]),
+            manager=manager,
+            container=self,
+        )
+        self.render_scale_slider.set_tooltip(
+            "Resolution the game is drawn at (lower is faster)"
+        )
+
+        rect_label_render_scale = pygame.Rect(0, 0, *LABEL_SIZE)
+        rect_label_render_scale.topleft = rect_render_scale.topright
+        self.render_scale_label = pygame_gui.elements.UITextBox(
+            self.render_scale_text(),
+            rect_label_render_scale,
+            manager=manager,
+            container=self,
+        )
+
         rect_save_btn = pygame.Rect(0, 0, *LABEL_SIZE)
-        rect_save_btn.topleft = rect_framerate.bottomleft
+        rect_save_btn.topleft = rect_render_scale.bottomleft
         self.save_btn = pygame_gui.elements.UIButton(
             rect_save_btn,
             "Save",
@@ -129,6 +159,11 @@ class SettingsWindow(pygame_gui.elements.UIWindow):
             tool_tip_text="Reset to default settings",
         )
 
+    def render_scale_text(self) -> str:
+        low, high = RENDER_SCALE_MIN_MAX
+        quality = (self.settings.render_scale - low) / (high - low)
+        return f'scale {self.paint_number(self.settings.render_scale, "{:.0%}", self.color_gradient(quality))}'
+
     def process_event(self, event):
         super().process_event(event)
         if event.type == pygame_gui.UI_HORIZONTAL_SLIDER_MOVED:
@@ -158,6 +193,11 @@ class SettingsWindow(pygame_gui.elements.UIWindow):
                 self.framerate_label.set_text(
                     f'framerate {self.paint_number(self.settings.framerate, '{}', self.color_gradient(self.settings.framerate / FRAMERATE_MIN_MAX[1]))}'
                 )
+            elif event.ui_element == self.render_scale_slider:
+                self.settings.render_scale = (
+                    int(self.render_scale_slider.get_current_value()) / 100
+                )
+                self.render_scale_label.set_text(self.render_scale_text())
         elif event.type == pygame_gui.UI_BUTTON_PRESSED:
             if event.ui_element == self.save_btn:
                 self.settings.dump()
@@ -173,6 +213,9 @@ class SettingsWindow(pygame_gui.elements.UIWindow):
                 )
                 self.difficulty_slider.set_current_value(self.settings.difficulty)
                 self.framerate_slider.set_current_value(self.settings.framerate)
+                self.render_scale_slider.set_current_value(
+                    100 * self.settings.render_scale
+                )
                 self.sfx_volume_label.set_text(
                     f'sfx {self.paint_number(self.settings.sfx_volume, '{:.0%}', self.color_gradient(self.settings.sfx_volume))}'
                 )
@@ -185,3 +228,4 @@ class SettingsWindow(pygame_gui.elements.UIWindow):
                 self.framerate_label.set_text(
                     f'framerate {self.paint_number(self.settings.framerate, '{}', self.color_gradient(self.settings.framerate / FRAMERATE_MIN_MAX[1]))}'
                 )
+                self.render_scale_label.set_text(self.render_scale_text())
@@ -1,36 +1,350 @@
+from dataclasses import dataclass
+import json
+import math
+import mmap
+import os
 import random
-from pygame import mixer
+import threading
+import time
 
-from config import SOUNDS_DIR
+import pygame
+from pygame import mixer
 
-mixer.init()
+from src.utils.enums import SfxPriority
+from config import (
+    SOUNDS_DIR,
+    SFX_CHANNELS,
+    SFX_RESERVED_CHANNELS,
+    SFX_STACK_GAIN,
+    SFX_STACK_MAX_GAIN,
+    SFX_PAN_AMOUNT,
+)
+from config.paths import SOUND_CACHE_DIR
 
 SFX_DIR = SOUNDS_DIR / "sfx"
 MUSIC_DIR = SOUNDS_DIR / "music"
 
-
-SOUND_EFFECTS = {file.stem: mixer.Sound(file) for file in SFX_DIR.glob("*.wav")}
+SFX_FILES = {file.stem: file for file in sorted(SFX_DIR.glob("*.wav"))}
 
 BG_MUSIC_FILES = [file for file in MUSIC_DIR.glob("*.mp3")]
 
 
 VOLUME_NORMALIZATION_FACTOR = 0.4
+# the sounds are that much louder and their channels that much quieter, but for
+# the stacked plays
+STACK_HEADROOM = 1.0 + SFX_STACK_MAX_GAIN
+
+# the others are SfxPriority.NORMAL
+SFX_PRIORITIES = {
+    "damage_taken": SfxPriority.CRITICAL,
+    "game_over": SfxPriority.CRITICAL,
+    "new_level": SfxPriority.CRITICAL,
+    "warning": SfxPriority.IMPORTANT,
+    "heartbeat": SfxPriority.IMPORTANT,
+    "new_achievement": SfxPriority.IMPORTANT,
+    "artifact_collected": SfxPriority.IMPORTANT,
+    "bomb_defused": SfxPriority.IMPORTANT,
+    "bomb_ticking": SfxPriority.IMPORTANT,
+    "bullet_shield_on": SfxPriority.IMPORTANT,
+    "mine_planted": SfxPriority.IMPORTANT,
+    "player_dash": SfxPriority.IMPORTANT,
+    "time_slow": SfxPriority.IMPORTANT,
+    "start_game": SfxPriority.IMPORTANT,
+    "toggle_pause": SfxPriority.IMPORTANT,
+    "click": SfxPriority.IMPORTANT,
+    "player_shot": SfxPriority.AMBIENT,
+    "in_oil_spill": SfxPriority.AMBIENT,
+}
+
+# seconds before a sound can be played again; the others only once per frame
+SFX_COOLDOWNS = {
+    "accurate_shot": 0.05,
+    "enemy_killed": 0.05,
+    "explosion": 0.08,
+    "energy_collected": 0.03,
+    "shield_blocked": 0.05,
+    "player_shot": 0.03,
+    "miner_dash": 0.1,
+    "in_oil_spill": 0.25,
+    "warning": 0.25,
+    "new_achievement": 0.5,
+}
+
+
+def init_mixer() -> bool:
+    """Initialize the mixer if it is not yet; whether there is one."""
+    if mixer.get_init() is not None:
+        return True
+    try:
+        mixer.init()
+    except pygame.error as e:
+        print(f"[Sounds] could not initialize the mixer ({e}); no sound")
+        return False
+    return True
+
+
+class SoundBank:
+    """
+    The sound effects, loaded on their first play (`get`) or ahead of time on
+    a background thread (`prefetch`) rather than all at import.
+
+    Once decoded, the sounds are kept as PCM in the format of the mixer in a
+    cache file (SOUND_CACHE_DIR), memory-mapped at the next start: a sound
+    whose file has not changed since is copied from there instead of being
+    decoded again. Without a mixer there are no sounds.
+    """
+
+    PCM_FILE = SOUND_CACHE_DIR / "sfx.pcm"
+    INDEX_FILE = SOUND_CACHE_DIR / "sfx.json"
+
+    def __init__(self, files: dict[str, os.PathLike]):
+        self.files = files
+        self.volume = 1.0
+        self.available: bool | None = None  # None until the first sound
+        self._sounds: dict[str, mixer.Sound] = {}
+        self._lock = threading.Lock()
+        self._cache: mmap.mmap | None = None
+        # name -> (offset, length, mtime_ns, size) of the PCM in the cache
+        self._index: dict[str, list[int]] = {}
+        self._stale = False  # decoded sounds are missing from the cache
+
+    def get(self, name: str) -> mixer.Sound | None:
+        sound = self._sounds.get(name)
+        if sound is not None or not self.ready():
+            return sound
+        with self._lock:
+            sound = self._sounds.get(name)
+            if sound is None:
+                sound = self._sounds[name] = self._load(name)
+        return sound
+
+    def prefetch(self) -> None:
+        """Load all the sounds on a background thread, then update the cache."""
+        if self.ready():
+            threading.Thread(target=self._prefetch, name="sfx", daemon=True).start()
+
+    def set_volume(self, volume: float) -> None:
+        self.volume = min(1.0, volume * VOLUME_NORMALIZATION_FACTOR * STACK_HEADROOM)
+        with self._lock:
+            for sound in self._sounds.values():
+                sound.set_volume(self.volume)
+
+    def ready(self) -> bool:
+        """Whether there is a mixer; initializes it with the first sound."""
+        if self.available is None:
+            self.available = init_mixer()
+            if self.available:
+                self._open_cache()
+        return self.available
+
+    def _prefetch(self) -> None:
+        for name in self.files:
+            self.get(name)
+        if self._stale:
+            with self._lock:
+                self._write_cache()
+
+    def _load(self, name: str) -> mixer.Sound:
+        file = self.files[name]
+        stat = os.stat(file)
+        entry = self._index.get(name)
+        if (
+            self._cache is not None
+            and entry is not None
+            and entry[2:] == [stat.st_mtime_ns, stat.st_size]
+        ):
+            offset, length = entry[:2]
+            with memoryview(self._cache) as cache, cache[
+                offset : offset + length
+            ] as pcm:
+                sound = mixer.Sound(buffer=pcm)
+        else:
+            sound = mixer.Sound(file)
+            self._stale = True
+        sound.set_volume(self.volume)
+        return sound
+
+    def _open_cache(self) -> None:
+        try:
+            with self.INDEX_FILE.open() as f:
+                index = json.load(f)
+            if index["format"] != list(mixer.get_init()):
+                return
+            with self.PCM_FILE.open("rb") as f:
+                self._cache = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except (OSError, ValueError, KeyError):
+            return
+        self._index = index["sounds"]
+
+    def _write_cache(self) -> None:
+        """The sounds loaded so far; the cache file must not be mapped any more."""
+        if self._cache is not None:
+            self._cache.close()
+            self._cache = None
+        index, offset = {}, 0
+        SOUND_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        try:
+            with open(f"{self.PCM_FILE}.tmp", "wb") as f:
+                for name, sound in self._sounds.items():
+                    stat = os.stat(self.files[name])
+                    length = f.write(sound.get_raw())
+                    index[name] = [offset, length, stat.st_mtime_ns, stat.st_size]
+                    offset += length
+            self.INDEX_FILE.unlink(missing_ok=True)  # it is about the old PCM
+            os.replace(f"{self.PCM_FILE}.tmp", self.PCM_FILE)
+            with self.INDEX_FILE.open("w") as f:
+                json.dump({"format": list(mixer.get_init()), "sounds": index}, f)
+        except OSError as e:
+            print(f"[Sounds] could not write the cache ({e})")
+            return
+        self._index = index
+        self._stale = False
+
+
+@dataclass
+class SfxRequests:
+    """The requests for a sound in a frame."""
+
+    priority: SfxPriority
+    count: int = 0
+    pan_total: float = 0.0  # of the requests with a position
+    panned: int = 0
+
+    def pan(self) -> float | None:
+        return self.pan_total / self.panned if self.panned else None
+
+
+class VoiceManager:
+    """
+    Plays the sound effects requested during a frame all at once, at the end
+    of the frame (`flush`), rather than as they are requested.
+
+    A sound requested several times in a frame is played once, louder the
+    more requests there were (SFX_STACK_GAIN, up to SFX_STACK_MAX_GAIN: the
+    channels play below their full volume to leave room for it), and not
+    again before its cooldown is over (SFX_COOLDOWNS); it comes from where
+    the requests were
+    on average, from left to right. The sounds are played by priority
+    (SFX_PRIORITIES, unless requested with a higher one): when all the
+    channels are busy, a sound takes over one playing a sound of a lower
+    priority, or it is dropped. The critical cues have SFX_RESERVED_CHANNELS
+    channels that the other sounds never get.
+    """
+
+    def __init__(self, bank: SoundBank):
+        self.bank = bank
+        self.requests: dict[str, SfxRequests] = {}  # of the frame, by name
+        self.played = 0
+        self.dropped = 0  # on cooldown or without a channel
+        self._last_played: dict[str, float] = {}
+        self._channels: list[mixer.Channel] = []
+        self._priorities: list[SfxPriority] = []  # of what each channel plays
+
+    def request(
+        self, name: str, priority: SfxPriority | None = None, pan: float | None = None
+    ) -> None:
+        """The pan goes from 0.0 (left) to 1.0 (right); None is in the middle."""
+        requests = self.requests.get(name)
+        if requests is None:
+            requests = self.requests[name] = SfxRequests(self.priority(name))
+        requests.count += 1
+        if priority is not None:
+            requests.priority = max(requests.priority, priority)
+        if pan is not None:
+            requests.pan_total += pan
+            requests.panned += 1
+
+    def flush(self) -> None:
+        if not self.requests:
+            return
+        requests, self.requests = self.requests, {}
+        if not self.bank.ready():
+            return
+        if not self._channels:
+            self._set_up_channels()
+        now = time.monotonic()
+        for name, request in sorted(
+            requests.items(), key=lambda item: item[1].priority, reverse=True
+        ):
+            last_played = self._last_played.get(name, -math.inf)
+            if now - last_played < SFX_COOLDOWNS.get(name, 0.0):
+                self.dropped += 1
+                continue
+            sound = self.bank.get(name)
+            channel = self._channel_for(request.priority)
+            if sound is None or channel is None:
+                self.dropped += 1
+                continue
+            # on the channel: the volume of the sound is shared by all its plays
+            gain = min(SFX_STACK_MAX_GAIN, SFX_STACK_GAIN * math.log2(request.count))
+            volume = (1.0 + gain) / STACK_HEADROOM
+            left, right = self.stereo(request.pan())
+            channel.play(sound)
+            channel.set_volume(left * volume, right * volume)
+            self._priorities[channel.id] = request.priority
+            self._last_played[name] = now
+            self.played += 1
+
+    @staticmethod
+    def priority(name: str) -> SfxPriority:
+        return SFX_PRIORITIES.get(name, SfxPriority.NORMAL)
+
+    @staticmethod
+    def stereo(pan: float | None) -> tuple[float, float]:
+        """The volumes of the left and the right speakers."""
+        if pan is None:
+            return 1.0, 1.0
+        pan = 0.5 + (min(max(pan, 0.0), 1.0) - 0.5) * SFX_PAN_AMOUNT
+        return min(1.0, 2.0 * (1.0 - pan)), min(1.0, 2.0 * pan)
+
+    def _set_up_channels(self) -> None:
+        mixer.set_num_channels(SFX_CHANNELS)
+        mixer.set_reserved(SFX_RESERVED_CHANNELS)  # Sound.play leaves them alone
+        self._channels = [mixer.Channel(i) for i in range(SFX_CHANNELS)]
+        self._priorities = [SfxPriority.AMBIENT] * SFX_CHANNELS
+
+    def _channel_for(self, priority: SfxPriority) -> mixer.Channel | None:
+        """A free channel, or the one playing the lowest priority below this one."""
+        first = 0 if priority == SfxPriority.CRITICAL else SFX_RESERVED_CHANNELS
+        channels = range(first, len(self._channels))
+        for i in channels:
+            if not self._channels[i].get_busy():
+                return self._channels[i]
+        lowest = min(channels, key=self._priorities.__getitem__)
+        if self._priorities[lowest] < priority:
+            return self._channels[lowest]
+        return None
+
+
+sound_bank = SoundBank(SFX_FILES)
+voices = VoiceManager(sound_bank)
+
+
+def play_sfx(name: str, priority: SfxPriority | None = None, pan: float | None = None):
+    """The sound is played at the end of the frame (`flush_sfx`)."""
+    voices.request(name, priority, pan)
+
+
+def flush_sfx():
+    voices.flush()
 
 
-def play_sfx(name: str):
-    SOUND_EFFECTS[name].play()
+def prefetch_sfx():
+    sound_bank.prefetch()
 
 
 def play_bg_music():
+    if not BG_MUSIC_FILES or not init_mixer():
+        return
     bg_track = random.choice(BG_MUSIC_FILES)
     mixer.music.load(bg_track)
     mixer.music.play(-1)
 
 
 def set_sfx_volume(volume: float):
-    for sound in SOUND_EFFECTS.values():
-        sound.set_volume(volume * VOLUME_NORMALIZATION_FACTOR)
+    sound_bank.set_volume(volume)
 
 
 def set_bg_music_vol(volume: float):
-    mixer.music.set_volume(volume * VOLUME_NORMALIZATION_FACTOR)
+    if init_mixer():
+        mixer.music.set_volume(volume * VOLUME_NORMALIZATION_FACTOR)
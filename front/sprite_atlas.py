@@ -0,0 +1,225 @@
+from collections import OrderedDict
+import math
+
+import pygame
+from pygame import Color, Vector2
+
+from src.utils.enums import SpriteShape
+from front.utils import ColorGradient
+from config import (
+    SPRITE_ATLAS_CAPACITY,
+    SPRITE_ATLAS_MAX_RADIUS,
+    STATUS_RING_STEPS,
+    STATUS_RING_CACHE_CAPACITY,
+    TRAIL_MAX_LENGTH,
+    TRAIL_DOT_RADIUS,
+    TRAIL_PALETTE_CAPACITY,
+)
+
+# never drawn by the game, marks the transparent pixels of the sprites
+COLORKEY = Color(254, 1, 253)
+
+SpriteKey = tuple[SpriteShape, int, tuple[int, int, int, int], int]
+
+
+def rasterize(shape: SpriteShape, radius: int, color: Color, width: int, step: int = 0):
+    """
+    Draw a primitive centered on the middle pixel of a square surface.
+    Returns the surface and the distance from its top left corner to the center.
+    `step` is the fill of an ARC, out of STATUS_RING_STEPS.
+    """
+    if shape == SpriteShape.CIRCLE:
+        half = radius
+    elif shape == SpriteShape.ARC:
+        half = radius + 1
+    elif shape == SpriteShape.MINE:
+        half = int(1.25 * radius) + 1
+    elif shape == SpriteShape.RINGS:
+        half = int(radius * 2 / 3 + 3)
+    elif shape == SpriteShape.BLOCK:
+        half = int(1.2 * radius) + width
+    else:
+        raise NotImplementedError(f"Unknown SpriteShape {shape}")
+    sprite = pygame.Surface((2 * half + 1, 2 * half + 1))
+    sprite.fill(COLORKEY)
+    center = Vector2(half, half)
+    if shape == SpriteShape.CIRCLE:
+        pygame.draw.circle(sprite, color, center, radius, width=width)
+    elif shape == SpriteShape.MINE:
+        r1 = pygame.Rect(0, 0, radius, 2.5 * radius)
+        r2 = pygame.Rect(0, 0, 2.5 * radius, radius)
+        r1.center = r2.center = (half, half)
+        pygame.draw.ellipse(sprite, color, r1, width=width)
+        pygame.draw.ellipse(sprite, color, r2, width=width)
+    elif shape == SpriteShape.RINGS:
+        for i in range(3):
+            pygame.draw.circle(sprite, color, center, radius * i / 3 + 3, width=width)
+    elif shape == SpriteShape.BLOCK:
+        block_vec = Vector2(radius, 0.0) * 1.2
+        delta = Vector2(0.0, 4)
+        for d in (delta, -delta):
+            pygame.draw.line(
+                sprite, color, center - block_vec + d, center + block_vec + d, width
+            )
+    elif shape == SpriteShape.ARC:
+        rect = pygame.Rect(half - radius, half - radius, 2 * radius, 2 * radius)
+        angle = math.pi * (2 * step / STATUS_RING_STEPS + 0.5)
+        pygame.draw.arc(sprite, color, rect, math.pi / 2, angle, width=width)
+    sprite = sprite.convert()
+    sprite.set_colorkey(COLORKEY, pygame.RLEACCEL)
+    return sprite, half
+
+
+class SpriteAtlas:
+    """
+    A cache of pre-rasterized primitives keyed by (shape, radius, color, width),
+    which drops the least recently used sprites when it is full.
+
+    The radius is truncated to whole pixels, as pygame.draw does, so a sprite
+    looks exactly like the primitive drawn in place. The sprites are colorkeyed
+    RLE surfaces: on the software renderer they blit faster than per-pixel alpha.
+
+    Sprites can be blitted right away (`blit`) or queued and then blitted
+    with a single `Surface.blits` call (`queue`, `flush`).
+    """
+
+    def __init__(self, capacity: int = SPRITE_ATLAS_CAPACITY):
+        self.capacity = capacity
+        self._sprites: OrderedDict[SpriteKey, tuple[pygame.Surface, int]] = (
+            OrderedDict()
+        )
+        self._batch: list[tuple[pygame.Surface, tuple[int, int]]] = []
+
+    def get(
+        self, shape: SpriteShape, radius: float, color, width: int = 0
+    ) -> tuple[pygame.Surface, int]:
+        rgba = tuple(color if isinstance(color, Color) else Color(color))
+        key = (shape, int(radius), rgba, width)
+        sprite = self._sprites.pop(key, None)
+        if sprite is None:
+            sprite = rasterize(shape, int(radius), Color(color), width)
+        self._sprites[key] = sprite  # the most recently used go last
+        if len(self._sprites) > self.capacity:
+            self._sprites.popitem(last=False)
+        return sprite
+
+    @staticmethod
+    def fits(radius: float) -> bool:
+        """Whether a primitive of this size should go through the atlas."""
+        return radius <= SPRITE_ATLAS_MAX_RADIUS
+
+    def queue(
+        self, shape: SpriteShape, pos: Vector2, radius: float, color, width: int = 0
+    ) -> None:
+        sprite, half = self.get(shape, radius, color, width)
+        self._batch.append((sprite, (int(pos[0]) - half, int(pos[1]) - half)))
+
+    def flush(self, surface: pygame.Surface) -> None:
+        """Blit all the queued sprites at once."""
+        if self._batch:
+            surface.blits(self._batch, doreturn=False)
+            self._batch.clear()
+
+    def blit(
+        self,
+        surface: pygame.Surface,
+        shape: SpriteShape,
+        pos: Vector2,
+        radius: float,
+        color,
+        width: int = 0,
+    ) -> None:
+        sprite, half = self.get(shape, radius, color, width)
+        surface.blit(sprite, (int(pos[0]) - half, int(pos[1]) - half))
+
+    def __len__(self) -> int:
+        return len(self._sprites)
+
+
+class StatusRingCache:
+    """
+    Status rings (arcs filled counterclockwise from the top) pre-rasterized
+    at STATUS_RING_STEPS + 1 fills for every (radius, color, width):
+    a ring is blitted filled to the nearest step.
+
+    The steps of a ring are rasterized as the fills show up. A lookup happens
+    for every status bar of every frame, so it is kept to one dict access:
+    when the cache is full the oldest ring is dropped instead of the least
+    recently used one.
+    """
+
+    def __init__(self, capacity: int = STATUS_RING_CACHE_CAPACITY):
+        self.capacity = capacity
+        self._rings: dict[tuple[int, int, int], list[pygame.Surface | None]] = {}
+
+    def blit(
+        self,
+        surface: pygame.Surface,
+        pos: Vector2,
+        percent: float,
+        radius: float,
+        color,
+        width: int,
+    ) -> pygame.Rect:
+        if not isinstance(color, Color):
+            color = Color(color)
+        radius = int(radius)
+        key = (radius, int(color), width)
+        ring = self._rings.get(key)
+        if ring is None:
+            if len(self._rings) >= self.capacity:
+                del self._rings[next(iter(self._rings))]
+            ring = self._rings[key] = [None] * (STATUS_RING_STEPS + 1)
+        step = round(percent * STATUS_RING_STEPS)
+        if not 0 <= step <= STATUS_RING_STEPS:
+            step = min(max(step, 0), STATUS_RING_STEPS)
+        sprite = ring[step]
+        if sprite is None:
+            sprite, _ = rasterize(SpriteShape.ARC, radius, color, width, step)
+            ring[step] = sprite
+        return surface.blit(sprite, (pos[0] - radius - 1, pos[1] - radius - 1))
+
+    def __len__(self) -> int:
+        return len(self._rings)
+
+
+class TrailPalette:
+    """
+    The dots of the trails. For every color, TRAIL_MAX_LENGTH rings fading from
+    black to that color are rasterized once; the i-th point of a trail of n
+    points gets the ring i / n of the way along the gradient.
+    """
+
+    def __init__(
+        self,
+        capacity: int = TRAIL_PALETTE_CAPACITY,
+        dot_radius: int = TRAIL_DOT_RADIUS,
+    ):
+        self.capacity = capacity
+        self.dot_radius = dot_radius
+        self._palettes: dict[int, list[pygame.Surface]] = {}
+        self._spreads: dict[tuple[int, int], list[pygame.Surface]] = {}
+
+    def sprites(self, color: Color, n_points: int) -> list[pygame.Surface]:
+        """The dots of the points of a trail, the oldest one first."""
+        key = (int(color), n_points)
+        spread = self._spreads.get(key)
+        if spread is None:
+            palette = self._palette(color)
+            spread = self._spreads[key] = [
+                palette[i * TRAIL_MAX_LENGTH // n_points] for i in range(n_points)
+            ]
+        return spread
+
+    def _palette(self, color: Color) -> list[pygame.Surface]:
+        palette = self._palettes.get(int(color))
+        if palette is None:
+            if len(self._palettes) >= self.capacity:
+                self._palettes.clear()
+                self._spreads.clear()
+            gradient = ColorGradient(Color("black"), color, TRAIL_MAX_LENGTH)
+            palette = self._palettes[int(color)] = [
+                rasterize(SpriteShape.CIRCLE, self.dot_radius, step, width=1)[0]
+                for step in gradient.palette[:TRAIL_MAX_LENGTH]
+            ]
+        return palette
@@ -0,0 +1,106 @@
+from itertools import repeat
+from typing import Callable, Hashable
+
+import numpy as np
+import pygame
+
+from front.sprite_atlas import COLORKEY
+from config import STATIC_LAYER_TILE_SIZE
+
+
+class StaticLayer:
+    """
+    The world elements that barely change (such as oil spills or the paths of
+    the DEF_TRAJECTORY projectiles), drawn once into a transparent layer
+    and blitted under everything else.
+
+    Every frame the layer is given all the static elements, each under a key
+    that changes whenever the element looks different (`sync`); the keys are
+    tuples that start with the rank of the element, the elements of a lower
+    rank are drawn first. The layer is split into square tiles: only the tiles
+    under the elements that appeared, disappeared or changed are redrawn,
+    and only the tiles with something on them are blitted.
+
+    An element is a sprite blitted at one or more places: `describe` gives the
+    sprite and the top left corners of its copies, shape (n, 2). It is called
+    once per element, when the element shows up.
+    """
+
+    def __init__(
+        self,
+        size: tuple[int, int],
+        describe: Callable[[object], tuple[pygame.Surface, np.ndarray]],
+        tile_size: int = STATIC_LAYER_TILE_SIZE,
+    ):
+        self.describe = describe
+        self.tile_size = tile_size
+        self.n_cols = -(-size[0] // tile_size)
+        self.n_rows = -(-size[1] // tile_size)
+        self._elements: dict[
+            tuple[int, Hashable], tuple[pygame.Rect, pygame.Surface, np.ndarray]
+        ] = {}
+        self._tiles: dict[tuple[int, int], pygame.Surface] = {}  # the non-empty ones
+
+    def sync(self, elements: dict[tuple[int, Hashable], object]) -> None:
+        """Redraw the tiles under what changed since the last call."""
+        if elements.keys() == self._elements.keys():
+            return
+        dirty_tiles: set[tuple[int, int]] = set()
+        for key in self._elements.keys() - elements.keys():
+            dirty_tiles.update(self._tiles_under(self._elements.pop(key)[0]))
+        for key in elements.keys() - self._elements.keys():
+            sprite, corners = self.describe(elements[key])
+            (x0, y0), (x1, y1) = corners.min(axis=0), corners.max(axis=0)
+            w, h = sprite.get_size()
+            rect = pygame.Rect(x0, y0, x1 - x0 + w, y1 - y0 + h)
+            self._elements[key] = (rect, sprite, corners)
+            dirty_tiles.update(self._tiles_under(rect))
+        for tile in dirty_tiles:
+            self._redraw(tile)
+
+    def blit(self, surface: pygame.Surface) -> None:
+        if self._tiles:
+            surface.blits(
+                [
+                    (tile, (col * self.tile_size, row * self.tile_size))
+                    for (col, row), tile in self._tiles.items()
+                ],
+                doreturn=False,
+            )
+
+    def clear(self) -> None:
+        self._elements.clear()
+        self._tiles.clear()
+
+    def _tiles_under(self, rect: pygame.Rect) -> list[tuple[int, int]]:
+        size = self.tile_size
+        cols = range(
+            max(rect.left // size, 0), min(rect.right // size + 1, self.n_cols)
+        )
+        rows = range(
+            max(rect.top // size, 0), min(rect.bottom // size + 1, self.n_rows)
+        )
+        return [(col, row) for col in cols for row in rows]
+
+    def _redraw(self, tile_pos: tuple[int, int]) -> None:
+        topleft = (tile_pos[0] * self.tile_size, tile_pos[1] * self.tile_size)
+        tile_rect = pygame.Rect(topleft, (self.tile_size, self.tile_size))
+        on_tile = sorted(
+            (key[0], i, sprite, corners)
+            for i, (key, (rect, sprite, corners)) in enumerate(self._elements.items())
+            if rect.colliderect(tile_rect)
+        )
+        if not on_tile:
+            self._tiles.pop(tile_pos, None)
+            return
+        tile = self._tiles.get(tile_pos)
+        if tile is None:
+            tile = self._tiles[tile_pos] = pygame.Surface(tile_rect.size).convert()
+        # drawing onto an RLE surface decodes and encodes it again on every call
+        tile.set_colorkey(None)
+        tile.fill(COLORKEY)
+        for _, _, sprite, corners in on_tile:
+            tile.blits(
+                zip(repeat(sprite), (corners - topleft).tolist()), doreturn=False
+            )
+        tile.set_colorkey(COLORKEY, pygame.RLEACCEL)
@@ -3,6 +3,7 @@ import pygame_gui
 from pygame import Color, Vector2, freetype
 
 from src.game import Game
+from src.utils.utils import Timer
 from front.utils import ProgressBar, TextBox
 from config import (
     SM,
@@ -11,6 +12,7 @@ from config import (
     FONT_FILE,
     GAME_HEALTH_BAR_SIZE,
     GAME_ENERGY_BAR_SIZE,
+    HUD_REFRESH_RATE,
 )
 
 freetype.init()
@@ -54,6 +56,8 @@ class StatsPanel:
             ),
             surface=surface,
         )
+        self.refresh_timer = Timer(1.0 / HUD_REFRESH_RATE)
+        self.refresh_timer.turn_off()
         self.set_visibility(self.show_stats_panel)
 
     def __del__(self):
@@ -62,11 +66,17 @@ class StatsPanel:
         self.energy_bar.kill()
 
     def update(self, time_delta: float):
+        """Refreshes the stats at HUD_REFRESH_RATE; the UI manager updates the bars."""
         if not self.show_stats_panel:
             return
+        self.refresh_timer.tick(time_delta)
+        if not self.refresh_timer.running():
+            self.refresh_timer.reset()
+            self.refresh_stats()
+        self.stats_textbox.update()
+
+    def refresh_stats(self):
         player = self.game.player
-        self.health_bar.update(time_delta)
-        self.energy_bar.update(time_delta)
         self.stats_textbox.set_lines(
             [
                 f'{"difficulty":<16} {self.game.settings.difficulty}',
@@ -79,7 +89,6 @@ class StatsPanel:
                 f'{"cooldown":<16} {player.get_shoot_coolodown():.2f}',
             ]
         )
-        self.stats_textbox.update()
 
     def set_visibility(self, set_to):
         self.panel.visible = self.show_stats_panel
@@ -1,12 +1,12 @@
-import shelve
 from collections import Counter
-from itertools import batched
+import math
 
 from pygame import Color, Event, Surface, Rect
 import pygame
 import pygame_gui
 
 from front.utils import paint
+from front.save_store import Save, save_store
 from config import (
     SAVES_BATCH_SIZE,
     LIGHT_MAGENTA_HEX,
@@ -16,7 +16,6 @@ from config import (
     NICER_RED_HEX,
     NICER_BLUE_HEX,
     LIGHT_BLUE_HEX,
-    SAVES_FILE,
 )
 from src.misc.artifacts import ArtifactsHandler, StatsBoost
 
@@ -52,11 +51,11 @@ class StatsWindow(pygame_gui.windows.UIMessageWindow):
         rect = Rect(40, 40, 550, 800)
         rect.center = surface.get_rect().center
 
-        with shelve.open(str(SAVES_FILE)) as saves:
-            self.save_batches = list(batched(reversed(list(saves.items())), SAVES_BATCH_SIZE))
-            self.current_batch = 0
-            self.total_batches = len(self.save_batches)
-            len_saves = len(saves)
+        # only the batch on the screen is loaded, the next one when it is asked for
+        len_saves = len(save_store)
+        self.current_batch = 0
+        self.total_batches = math.ceil(len_saves / SAVES_BATCH_SIZE)
+        self.batch: list[Save] = save_store.page(SAVES_BATCH_SIZE)
         super().__init__(
             rect=rect,
             manager=manager,
@@ -71,7 +70,9 @@ class StatsWindow(pygame_gui.windows.UIMessageWindow):
         if not self.total_batches:
             return self.construct_html(())
         header = f'saves batch {self.current_batch + 1}/{self.total_batches}<br>'
-        return header + self.construct_html(self.save_batches[self.current_batch])
+        return header + self.construct_html(
+            tuple((save.name, save.info) for save in self.batch)
+        )
 
     @staticmethod
     def construct_one_save_html(datetime_str: str, info: dict) -> str:
@@ -142,13 +143,19 @@ class StatsWindow(pygame_gui.windows.UIMessageWindow):
             texts.append(self.construct_one_save_html(datetime_str, info))
         return "\n\n".join(texts)
 
+    def next_batch(self):
+        """The batch after this one, or the first one after the last one."""
+        self.current_batch = (self.current_batch + 1) % self.total_batches
+        after = self.batch[-1] if self.current_batch and self.batch else None
+        self.batch = save_store.page(SAVES_BATCH_SIZE, after=after)
+
     def process_event(self, event: Event) -> bool:
         # space
         if event.type == pygame.KEYDOWN:
             if event.key == pygame.K_SPACE:
                 if not self.total_batches:
                     return False
-                self.current_batch = (self.current_batch + 1) % self.total_batches
+                self.next_batch()
                 assert self.text_block is not None
                 self.text_block.set_text(self.get_current_text())
         return super().process_event(event)
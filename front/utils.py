@@ -1,13 +1,21 @@
+from collections import OrderedDict
 from dataclasses import dataclass
 import math
-from typing import Literal
+from typing import Hashable, Literal
 
+import numpy as np
 import pygame
 import pygame_gui
 from pygame import Color, Vector2, freetype
 
 from src.utils.utils import Slider, Timer
-from config import FONT_FILE
+from front.dirty_rects import dirty_rects
+from config import (
+    FONT_FILE,
+    TEXT_CACHE_CAPACITY,
+    COLOR_GRADIENT_STEPS,
+    HUD_BAR_REFRESH_RATE,
+)
 
 freetype.init()
 FONT = freetype.Font(FONT_FILE, 20)
@@ -73,11 +81,57 @@ class FpsInfo:
 
 
 class ColorGradient:
-    def __init__(self, start_color: Color, end_color: Color):
+    """
+    The colors from `start_color` (at 0) to `end_color` (at 1).
+
+    With `steps`, the gradient is a palette: the colors at 0, 1/steps, ..., 1
+    are computed once, when first asked for, and a percent gets the color
+    of the nearest step (clamped to [0, 1]). The palette is also available
+    as packed pixels, for surfarray. The Colors it returns are shared and must
+    not be changed.
+    """
+
+    def __init__(self, start_color: Color, end_color: Color, steps: int | None = None):
         self.start_color = start_color
         self.end_color = end_color
+        self.steps = steps
+        self._palette: tuple[Color, ...] | None = None
+        self._packed: dict[tuple[int, ...], np.ndarray] = {}  # by pixel format
 
     def __call__(self, percent: float) -> Color:
+        if self.steps is None:
+            return self.lerp(percent)
+        if not 0.0 <= percent <= 1.0:
+            percent = min(max(percent, 0.0), 1.0)
+        return self.palette[round(percent * self.steps)]
+
+    @property
+    def palette(self) -> tuple[Color, ...]:
+        if self._palette is None:
+            steps = self.steps or COLOR_GRADIENT_STEPS
+            self._palette = tuple(self.lerp(k / steps) for k in range(steps + 1))
+        return self._palette
+
+    def indices(self, percents: np.ndarray) -> np.ndarray:
+        """The steps of the palette nearest to the percents."""
+        steps = len(self.palette) - 1
+        return np.rint(np.clip(percents, 0.0, 1.0) * steps).astype(np.intp)
+
+    def colors(self, percents: np.ndarray) -> list[Color]:
+        palette = self.palette
+        return [palette[i] for i in self.indices(percents).tolist()]
+
+    def packed(self, surface: pygame.Surface) -> np.ndarray:
+        """The palette as the (uint32) pixels of the surface, for surfarray.pixels2d."""
+        pixel_format = (surface.get_bitsize(), *surface.get_masks())
+        packed = self._packed.get(pixel_format)
+        if packed is None:
+            packed = self._packed[pixel_format] = np.array(
+                [surface.map_rgb(color) for color in self.palette], dtype=np.uint32
+            )
+        return packed
+
+    def lerp(self, percent: float) -> Color:
         return Color(
             int(self.start_color.r + (self.end_color.r - self.start_color.r) * percent),
             int(self.start_color.g + (self.end_color.g - self.start_color.g) * percent),
@@ -86,6 +140,35 @@ class ColorGradient:
         )
 
 
+class TextCache:
+    """
+    An LRU cache of rendered texts keyed by (font, size, text, color).
+    A cached surface blitted at the top left of a rect gives exactly
+    the pixels `Font.render_to` draws there.
+    """
+
+    def __init__(self, capacity: int = TEXT_CACHE_CAPACITY):
+        self.capacity = capacity
+        self._surfaces: OrderedDict[tuple, pygame.Surface] = OrderedDict()
+
+    def get(self, font: freetype.Font, text: str, color) -> pygame.Surface:
+        rgba = tuple(color if isinstance(color, Color) else Color(color))
+        key = (font, font.size, text, rgba)
+        surface = self._surfaces.pop(key, None)
+        if surface is None:
+            surface, _ = font.render(text, color)
+        self._surfaces[key] = surface  # the most recently used go last
+        if len(self._surfaces) > self.capacity:
+            self._surfaces.popitem(last=False)
+        return surface
+
+    def __len__(self) -> int:
+        return len(self._surfaces)
+
+
+text_cache = TextCache()
+
+
 class Label:
     def __init__(
         self,
@@ -120,7 +203,8 @@ class Label:
                 self.rect.bottomleft = self.position
 
     def draw(self):
-        self.font.render_to(self.surface, self.rect, self.text, self.color)  # type: ignore
+        text = text_cache.get(self.font, self.text, self.color)
+        dirty_rects.add(self.surface.blit(text, self.rect.topleft))  # type: ignore
 
     def update(self):
         self.draw()
@@ -133,6 +217,11 @@ class Label:
 
 
 class TextBox:
+    """
+    Labels stacked one under the other. They are composed into one overlay,
+    which is blitted every frame and redrawn only when a label changes.
+    """
+
     def __init__(
         self,
         text_lines: list[str],
@@ -143,6 +232,9 @@ class TextBox:
         self.text_lines = text_lines
         self.position = position
         self.surface = surface
+        self.overlay: pygame.Surface | None = None
+        self.overlay_pos = (0, 0)
+        self.overlay_key: list[tuple] = []
         self.rebuild(self.position)
 
     def rebuild(self, top_left: Vector2):
@@ -161,6 +253,7 @@ class TextBox:
         ]
         for i, r in enumerate(self.rects):
             self.labels[i].rect = r
+        self.overlay = None
 
     def total_size(self) -> Vector2:
         return Vector2(self.rects[-1].bottomright) - Vector2(self.rects[0].topleft)
@@ -178,8 +271,32 @@ class TextBox:
         self.rebuild(position)
 
     def update(self):
-        for label in self.labels:
-            label.update()
+        key = [(label.text, tuple(label.color)) for label in self.labels]
+        if self.overlay is None or key != self.overlay_key:
+            self.overlay_key = key
+            self.compose_overlay()
+        if self.overlay is not None:
+            dirty_rects.add(self.surface.blit(self.overlay, self.overlay_pos))
+
+    def compose_overlay(self):
+        texts = [
+            (text_cache.get(label.font, label.text, label.color), label.rect.topleft)
+            for label in self.labels
+            if label.rect is not None
+        ]
+        if not texts:
+            self.overlay = None
+            return
+        bounds = pygame.Rect(texts[0][1], texts[0][0].get_size()).unionall(
+            [pygame.Rect(topleft, text.get_size()) for text, topleft in texts]
+        )
+        self.overlay = pygame.Surface(bounds.size, pygame.SRCALPHA)
+        self.overlay_pos = bounds.topleft
+        for text, (x, y) in texts:
+            # the labels do not overlap: this copies their pixels, alpha included
+            self.overlay.blit(
+                text, (x - bounds.x, y - bounds.y), special_flags=pygame.BLEND_RGBA_MAX
+            )
 
     def set_lines(self, text_lines: list[str]):
         assert len(text_lines) == len(
@@ -191,6 +308,12 @@ class TextBox:
 
 
 class ProgressBar(pygame_gui.elements.UIStatusBar):
+    """
+    A bar showing a slider. It looks at the slider HUD_BAR_REFRESH_RATE times
+    a second and is redrawn only when the text or the filled width in pixels
+    changes.
+    """
+
     def __init__(
         self, color_gradient_pair: tuple[Color, Color], slider: Slider, **kwargs
     ):
@@ -198,22 +321,31 @@ class ProgressBar(pygame_gui.elements.UIStatusBar):
         self.old_text = ""
         self.new_text = ""
         super().__init__(**kwargs)
-        self.color_gradient = ColorGradient(*color_gradient_pair)
+        self.color_gradient = ColorGradient(*color_gradient_pair, COLOR_GRADIENT_STEPS)
+        self.shown_percent: float | None = None
+        self.refresh_timer = Timer(1.0 / HUD_BAR_REFRESH_RATE)
+        self.refresh_timer.turn_off()
 
     def update(self, time_delta: float):
+        self.refresh_timer.tick(time_delta)
+        if not self.refresh_timer.running():
+            self.refresh_timer.reset()
+            self.update_percent_full()
+            self.new_text = str(self.slider)
+            if self.old_text != self.new_text:
+                self.status_changed = True
+            self.old_text = self.new_text
         super().update(time_delta)
-        self.update_percent_full()
-        self.new_text = str(self.slider)
-        if self.old_text != self.new_text:
-            self.status_changed = True
-        self.old_text = self.new_text
 
     def status_text(self):
         return self.new_text
 
     def update_percent_full(self):
-        self.percent_full = self.slider.get_percent_full()
-        self.bar_filled_colour = self.color_gradient(self.percent_full)
+        width = max(self.rect.width, 1)
+        percent_full = round(self.slider.get_percent_full() * width) / width
+        if percent_full != self.shown_percent:
+            self.shown_percent = self.percent_full = percent_full
+            self.bar_filled_colour = self.color_gradient(percent_full)
 
 
 class Notification(Label):
@@ -236,6 +368,39 @@ class Notification(Label):
         )
         self.lifetime_timer = Timer(max_time=duration)
         self._is_alive = True
+        self.base_text = text
+        self.count = 1  # of the feedbacks merged into this one
+        self.key: Hashable = None
+
+    def respawn(
+        self,
+        text: str,
+        position: Vector2,
+        duration: float,
+        color: Color,
+        font: freetype.Font = FONT,
+    ):
+        """Show another notification with this object."""
+        self.text = self.base_text = text
+        self.count = 1
+        self.color = color
+        self.font = font
+        self.rect = pygame.Rect(0, 0, 100, 40)
+        self.rect.center = position
+        self.lifetime_timer.reset(duration)
+        self._is_alive = True
+
+    def merge(self, duration: float):
+        """Count one more of the same, and show it for longer."""
+        self.count += 1
+        self.text = f"{self.base_text} ×{self.count}"
+        self.lifetime_timer.reset(max(duration, self.lifetime_timer.max_time))
+
+    def is_alive(self) -> bool:
+        return self._is_alive
+
+    def kill(self):
+        self._is_alive = False
 
     def update(self, time_delta: float):
         self.lifetime_timer.tick(time_delta)
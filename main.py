@@ -1,3 +1,5 @@
+import multiprocessing
+
 import pygame
 
 from front.menu_screen import MenuScreen
@@ -11,14 +13,16 @@ def main():
 
 
 def play_through_sound_effects():
-    from front.sounds import play_sfx, SOUND_EFFECTS
+    from front.sounds import play_sfx, flush_sfx, SFX_FILES
 
-    for k in SOUND_EFFECTS:
+    for k in SFX_FILES:
         play_sfx(k)
+        flush_sfx()
         print(k)
         input()
 
 
 if __name__ == "__main__":
+    multiprocessing.freeze_support()  # the worker processes in frozen builds
     main()
     # play_through_sound_effects()
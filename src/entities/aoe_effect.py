@@ -5,7 +5,7 @@ from src.entities.entity import Entity
 from src.utils.enums import EntityType, AOEEffectEffectType
 from src.utils.utils import AppliedToEntityManager
 
-from config import BACKGROUND_COLOR_HEX
+from config import BACKGROUND_COLOR_HEX, COLOR_GRADIENT_STEPS
 
 
 class AOEEffect(Entity):
@@ -32,7 +32,9 @@ class AOEEffect(Entity):
         )
 
         self.effect_type = effect_type
-        self.color_gradient = ColorGradient(color, Color(BACKGROUND_COLOR_HEX))
+        self.color_gradient = ColorGradient(
+            color, Color(BACKGROUND_COLOR_HEX), COLOR_GRADIENT_STEPS
+        )
         self.damage = damage
 
     def update(self, time_delta: float):
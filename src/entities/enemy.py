@@ -4,7 +4,6 @@ import random
 from pygame import Vector2, Color
 
 from config.back import TRAIL_MAX_LENGTH
-from front.sounds import play_sfx
 from src.entities.aoe_effect import AOEEffect, AOEEffectEffectType
 from src.entities.energy_orb import EnergyOrb
 from src.entities.entity import Entity, DummyEntity
@@ -21,6 +20,7 @@ from src.entities.projectile import (
 )
 from src.entities.oil_spill import OilSpill
 from src.misc.interfaces import CanSpawnEntitiesInterface
+from src.misc.flow_field import FlowField
 from config import (
     ENEMY_DEFAULT_SPEED,
     ENEMY_DEFAULT_SIZE,
@@ -112,6 +112,7 @@ class Enemy(Entity):
             CanSpawnEntitiesInterface  # to avoid typing errors (this is never None)
         )
         self.shoots_player = True
+        self.flow_field: FlowField | None = None  # set by the game
         self.post_init()
 
     def post_init(self):
@@ -142,6 +143,15 @@ class Enemy(Entity):
     def shoot(self):
         self.shoot_normal()
 
+    def get_homing_direction(self) -> Vector2:
+        """Follow the shared flow field when chasing the player."""
+        if (
+            self.flow_field is None
+            or self.homing_target.get_type() != EntityType.PLAYER
+        ):
+            return super().get_homing_direction()
+        return self.flow_field.direction_at(self.pos, self.homing_target.get_pos())
+
     def update(self, time_delta: float):
         if not self.is_alive():
             return
@@ -463,7 +473,7 @@ class MinerEnemy(Enemy):
         self.dash_cooldown_timer.tick(time_delta)
         if not self.dash_cooldown_timer.running():
             self.dash_active_timer.reset()
-            play_sfx("miner_dash")
+            self.make_sound("miner_dash")
             self.dash_cooldown_timer.reset()
         if self.is_in_dash():
             self.dash_active_timer.tick(time_delta)
@@ -586,13 +596,13 @@ class GhostEnemy(Enemy):
         )
         self.trail_index_to_sit_on = random.randint(0, TRAIL_MAX_LENGTH // 2)
         assert player.i_render_trail
-        self.player_trail = player.i_render_trail.trail
+        self.player_trail = player.i_render_trail
         self.update_pos_vel()
         self.inactive_timer = Timer(max_time=1.0)
 
     def update_pos_vel(self):
-        self.pos = self.player_trail[self.trail_index_to_sit_on].copy()
-        self.vel = self.player_trail[self.trail_index_to_sit_on+1] - self.player_trail[self.trail_index_to_sit_on]
+        self.pos = self.player_trail.get_point(self.trail_index_to_sit_on)
+        self.vel = self.player_trail.get_point(self.trail_index_to_sit_on+1) - self.pos
 
     def update(self, time_delta: float):
         super().update(time_delta)
@@ -1,5 +1,6 @@
 from abc import ABC, abstractmethod
-from typing import Optional
+from collections import deque
+from typing import Callable, Optional
 import random
 import math
 
@@ -7,7 +8,7 @@ import pygame
 from pygame import Vector2, Color
 
 from src.utils.enums import EntityType
-from src.utils.utils import random_unit_vector
+from src.utils.utils import SoundEvent, random_unit_vector
 from src.misc.interfaces import (
     RendersTrailInterface,
     CanSpawnEntitiesInterface,
@@ -46,6 +47,10 @@ class Entity(ABC):
         self.color = color if color is not None else Color("white")
         self.homing_target = homing_target
         self._id = random.randrange(2**32)
+        # called once when a living entity is killed (set by the entity registry)
+        self.kill_listener: Callable[["Entity"], None] | None = None
+        # where the sounds of the entity go (set by the game for those that make any)
+        self.sound_buffer: deque[SoundEvent] | None = None
 
         # interfaces:
         self.i_render_trail = RendersTrailInterface() if render_trail else None
@@ -68,16 +73,20 @@ class Entity(ABC):
                 return
         if self.speed > 0 and self.homing_target is not None:
             self.vel = (
-                self.homing_target.get_pos() - self.pos
-            ).normalize() * self.turn_coefficient + self.vel * (
-                1 - self.turn_coefficient
+                self.get_homing_direction() * self.turn_coefficient
+                + self.vel * (1 - self.turn_coefficient)
             )
         if self.speed > 0.0 and self.vel.magnitude_squared() > 0.0:
             self.vel.scale_to_length(self.speed * time_delta)
             self.pos += self.vel
         if self.i_render_trail:
             if self.i_render_trail.tick_check_should_add(time_delta):
-                self.i_render_trail.add(self.pos.copy())
+                self.i_render_trail.add(self.pos)
+
+    def make_sound(self, name: str) -> None:
+        """A sound at the position of the entity, played by the front end."""
+        if self.sound_buffer is not None:
+            self.sound_buffer.append(SoundEvent(name, self.pos.copy()))
 
     def on_natural_death(self):
         """
@@ -85,6 +94,13 @@ class Entity(ABC):
         """
         pass
 
+    def get_homing_direction(self) -> Vector2:
+        """
+        The unit vector the entity wants to move along to reach its homing target.
+        """
+        assert self.homing_target is not None
+        return (self.homing_target.get_pos() - self.pos).normalize()
+
     def intersects(self, other: "Entity") -> bool:
         """
         Check if this entity intersects with another entity.
@@ -121,6 +137,8 @@ class Entity(ABC):
         return self._is_alive
 
     def kill(self):
+        if self._is_alive and self.kill_listener is not None:
+            self.kill_listener(self)
         self._is_alive = False
 
     def __str__(self) -> str:
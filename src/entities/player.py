@@ -2,7 +2,6 @@ import random
 
 from pygame import Vector2, Color
 from config.settings import Settings
-from front.sounds import play_sfx
 from src.misc.artifacts import ArtifactsHandler, Artifact
 from src.entities.artifact_chest import ArtifactChestGenerator
 
@@ -215,34 +214,34 @@ class Player(Entity):
         if artifact_type == ArtifactType.BULLET_SHIELD:
             self.artifacts_handler.get_bullet_shield().turn_on()
             self.get_stats().BULLET_SHIELDS_ACTIVATED += 1
-            play_sfx("bullet_shield_on")
+            self.make_sound("bullet_shield_on")
             return
         if artifact_type == ArtifactType.MINE_SPAWN:
             self.artifacts_handler.get_mine_spawn().spawn()
             self.get_stats().MINES_PLANTED += 1
-            play_sfx("mine_planted")
+            self.make_sound("mine_planted")
             return
         if artifact_type == ArtifactType.DASH:
             self.artifacts_handler.get_dash().dash(self.gravity_point)
             self.dash_needs_processing = True
             self.get_stats().DASHES_ACTIVATED += 1
-            play_sfx("player_dash")
+            self.make_sound("player_dash")
             return
         if artifact_type == ArtifactType.TIME_SLOW:
             self.artifacts_handler.get_time_slow().time_slow()
             self.get_stats().TIME_SLOWS_ACTIVATED += 1
-            play_sfx("time_slow")
+            self.make_sound("time_slow")
             return
         if artifact_type == ArtifactType.SHRAPNEL:
             self.artifacts_handler.get_shrapnel().shoot()
             # self.get_stats().SHRAPNELS_ACTIVATED += 1
-            # play_sfx('shrapnel')
+            # self.make_sound("shrapnel")
             return
         if artifact_type == ArtifactType.RAGE:
             self.artifacts_handler.get_rage().rage()
             # TODO
             # self.get_stats().RAGES_ACTIVATED += 1
-            # play_sfx('rage')
+            # self.make_sound("rage")
             return
         raise ArtifactMissing(f"artifact missing for {artifact_type.name.title()}")
 
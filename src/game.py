@@ -1,7 +1,7 @@
 from collections import deque
 import math
 import random
-from typing import Generator
+from typing import Generator, Iterable
 import itertools
 
 import pygame
@@ -24,9 +24,10 @@ from src.utils.enums import (
     ProjectileType,
     AnimationType,
     AOEEffectEffectType,
+    HazardKind,
 )
 from src.entities.projectile import Projectile
-from src.utils.utils import Timer, Feedback, random_unit_vector
+from src.utils.utils import Timer, Feedback, SoundEvent, random_unit_vector
 from src.entities.energy_orb import EnergyOrb
 from src.utils.exceptions import (
     ArtifactMissing,
@@ -39,6 +40,10 @@ from src.utils.exceptions import (
 from src.entities.enemy import ENEMY_SIZE_MAP, ENEMY_TYPE_TO_CLASS, Enemy
 from src.entities.artifact_chest import ArtifactChest
 from src.misc.animation import AnimationHandler
+from src.misc.hazard_field import HazardField
+from src.misc.flow_field import FlowField
+from src.misc.collision_worker import CollisionWorker, ContactCandidates
+from src.misc.entity_registry import EntityRegistry
 
 from config import (
     REMOVE_DEAD_ENTITIES_EVERY,
@@ -58,8 +63,8 @@ from config import (
     BOMB_SPAWN_COOLDOWN_RANGE,
     BOMB_DEFAULT_SIZE,
     BOMB_DEFAULT_LIFETIME,
+    SOUND_BUFFER_CAPACITY,
 )
-from front.sounds import play_sfx
 
 
 NICER_YELLOW = Color(NICER_YELLOW_HEX)
@@ -103,20 +108,14 @@ class Game:
         self.is_victory = False
 
         self.feedback_buffer: deque[Feedback] = deque()
+        # played by the front end once per frame
+        self.sound_buffer: deque[SoundEvent] = deque(maxlen=SOUND_BUFFER_CAPACITY)
         self._last_fps: float = 0.0
 
         # entities:
         self.player = Player(Vector2(*self.screen_rectangle.center), settings)
-        self.e_dummies: list[DummyEntity] = []
-        self.e_oil_spills: list[OilSpill] = []
-        self.e_corpses: list[Corpse] = []
-        self.e_projectiles: list[Projectile] = []
-        self.e_energy_orbs: list[EnergyOrb] = []
-        self.e_enemies: list[Enemy] = []
-        self.e_mines: list[Mine] = []
-        self.e_aoe_effects: list[AOEEffect] = []
-        self.e_artifact_chests: list[ArtifactChest] = []
-        self.e_bombs: list[Bomb] = []
+        self.player.sound_buffer = self.sound_buffer
+        self.entities = EntityRegistry()
 
         self.e_lines: list[Line] = []
 
@@ -144,6 +143,14 @@ class Game:
         # animation:
         self.animation_handler = AnimationHandler()
 
+        # broad phase for the oil spills and AOE effects:
+        self.hazard_field = HazardField(self.screen_rectangle)
+        # shared steering towards the player:
+        self.flow_field = FlowField(self.hazard_field)
+        # broad phase for the player bullets and enemies in a separate process:
+        self.collision_worker = CollisionWorker() if settings.collision_worker else None
+        self.contact_candidates: ContactCandidates | None = None
+
     def all_entities_iter(
         self,
         with_player: bool = True,
@@ -151,60 +158,59 @@ class Game:
         with_enemies: bool = True,
         with_projectiles: bool = True,
     ) -> Generator[Entity, None, None]:
-        yield from self.oil_spills(include_dead)
-        yield from self.corpses(include_dead)
-        if with_projectiles:
-            yield from self.projectiles(include_dead)
-        yield from self.energy_orbs(include_dead)
-        if with_enemies:
-            yield from self.enemies(include_dead)
-        yield from self.dummies(include_dead)
-        yield from self.mines(include_dead)
-        yield from self.aoe_effects(include_dead)
-        yield from self.artifact_chests(include_dead)
-        yield from self.bombs(include_dead)
+        excluded = []
+        if not with_enemies:
+            excluded.append(EntityType.ENEMY)
+        if not with_projectiles:
+            excluded.append(EntityType.PROJECTILE)
+        yield from self.entities.all(include_dead, exclude=excluded)
         if with_player:
             yield self.player
 
     def oil_spills(self, include_dead: bool = False) -> Generator[OilSpill, None, None]:
-        yield from (ent for ent in self.e_oil_spills if include_dead or ent.is_alive())
+        yield from self.entities.of_type(EntityType.OIL_SPILL, include_dead)  # type: ignore
 
     def corpses(self, include_dead: bool = False) -> Generator[Corpse, None, None]:
-        yield from (ent for ent in self.e_corpses if include_dead or ent.is_alive())
+        yield from self.entities.of_type(EntityType.CORPSE, include_dead)  # type: ignore
 
     def projectiles(
         self, include_dead: bool = False
     ) -> Generator[Projectile, None, None]:
-        yield from (ent for ent in self.e_projectiles if include_dead or ent.is_alive())
+        yield from self.entities.of_type(EntityType.PROJECTILE, include_dead)  # type: ignore
+
+    def player_bullets(self) -> Generator[Projectile, None, None]:
+        yield from (
+            ent
+            for ent in self.projectiles()
+            if ent.projectile_type == ProjectileType.PLAYER_BULLET
+        )
 
     def energy_orbs(
         self, include_dead: bool = False
     ) -> Generator[EnergyOrb, None, None]:
-        yield from (ent for ent in self.e_energy_orbs if include_dead or ent.is_alive())
+        yield from self.entities.of_type(EntityType.ENERGY_ORB, include_dead)  # type: ignore
 
     def enemies(self, include_dead: bool = False) -> Generator[Enemy, None, None]:
-        yield from (ent for ent in self.e_enemies if include_dead or ent.is_alive())
+        yield from self.entities.of_type(EntityType.ENEMY, include_dead)  # type: ignore
 
     def dummies(self, include_dead: bool = False) -> Generator[DummyEntity, None, None]:
-        yield from (ent for ent in self.e_dummies if include_dead or ent.is_alive())
+        yield from self.entities.of_type(EntityType.DUMMY, include_dead)  # type: ignore
 
     def mines(self, include_dead: bool = False) -> Generator[Mine, None, None]:
-        yield from (ent for ent in self.e_mines if include_dead or ent.is_alive())
+        yield from self.entities.of_type(EntityType.MINE, include_dead)  # type: ignore
 
     def aoe_effects(
         self, include_dead: bool = False
     ) -> Generator[AOEEffect, None, None]:
-        yield from (ent for ent in self.e_aoe_effects if include_dead or ent.is_alive())
+        yield from self.entities.of_type(EntityType.CRATER, include_dead)  # type: ignore
 
     def artifact_chests(
         self, include_dead: bool = False
     ) -> Generator[ArtifactChest, None, None]:
-        yield from (
-            ent for ent in self.e_artifact_chests if include_dead or ent.is_alive()
-        )
+        yield from self.entities.of_type(EntityType.ARTIFACT_CHEST, include_dead)  # type: ignore
 
     def bombs(self, include_dead: bool = False) -> Generator[Bomb, None, None]:
-        yield from (ent for ent in self.e_bombs if include_dead or ent.is_alive())
+        yield from self.entities.of_type(EntityType.BOMB, include_dead)  # type: ignore
 
     def lines(self, include_dead: bool = False) -> Generator[Line, None, None]:
         yield from (ln for ln in self.e_lines if include_dead or ln.is_alive())
@@ -221,7 +227,7 @@ class Game:
         )
         if self.level >= float("inf"):
             return False
-        play_sfx("new_level")
+        self.sound_buffer.append(SoundEvent("new_level"))
         self.level += 1
         self.feedback_buffer.append(
             Feedback(
@@ -474,15 +480,29 @@ class Game:
             entity.update(time_delta * mult)
         for line in self.lines():
             line.update(time_delta)
+        self.hazard_field.sync(self.oil_spills(), self.aoe_effects(), self.mines())
+        self.flow_field.update(self.player.get_pos())
         self.process_timers(time_delta)
+        if self.collision_worker is not None:
+            self.contact_candidates = self.collision_worker.collect(time_delta)
         self.process_collisions()
+        self.contact_candidates = None  # it points into the worker's shared memory
         self.process_dash()
+        if self.collision_worker is not None:
+            self.collision_worker.submit(
+                list(self.player_bullets()), list(self.enemies())
+            )
         self.register_new_achievements()
         self.process_dead_entities_sfx()
         self.animation_handler.update(time_delta)
 
+    def close(self) -> None:
+        """Release the resources held by the game."""
+        if self.collision_worker is not None:
+            self.collision_worker.close()
+
     def is_boss_alive(self) -> bool:
-        return any(ent.enemy_type == EnemyType.BOSS for ent in self.enemies())
+        return self.entities.count(EnemyType.BOSS) > 0
 
     def process_dash(self):
         if not self.player.dash_needs_processing:
@@ -512,58 +532,58 @@ class Game:
             self.feedback_buffer.append(
                 Feedback("[A] receive 1000 damage", 3.0, color=BLUE)
             )
-            play_sfx("new_achievement")
+            self.sound_buffer.append(SoundEvent("new_achievement"))
         if not ach.KILL_100_ENEMIES and st.ENEMIES_KILLED >= 100:
             ach.KILL_100_ENEMIES = True
             self.feedback_buffer.append(
                 Feedback("[A] killed 100 enemies", 3.0, color=BLUE)
             )
-            play_sfx("new_achievement")
+            self.sound_buffer.append(SoundEvent("new_achievement"))
         if not ach.FIRE_200_PROJECTILES and st.PROJECTILES_FIRED >= 200:
             ach.FIRE_200_PROJECTILES = True
             self.feedback_buffer.append(
                 Feedback("[A] fired 200 projectiles", 3.0, color=BLUE)
             )
-            play_sfx("new_achievement")
+            self.sound_buffer.append(SoundEvent("new_achievement"))
         if not ach.BLOCK_100_BULLETS and st.BULLET_SHIELD_BULLETS_BLOCKED >= 100:
             ach.BLOCK_100_BULLETS = True
             self.feedback_buffer.append(
                 Feedback("[A] blocked 100 bullets", 3.0, color=BLUE)
             )
-            play_sfx("new_achievement")
+            self.sound_buffer.append(SoundEvent("new_achievement"))
         if not ach.COLLECT_200_ENERGY_ORBS and st.ENERGY_ORBS_COLLECTED >= 200:
             ach.COLLECT_200_ENERGY_ORBS = True
             self.feedback_buffer.append(
                 Feedback("[A] collected 200 energy orbs", 3.0, color=BLUE)
             )
-            play_sfx("new_achievement")
+            self.sound_buffer.append(SoundEvent("new_achievement"))
         if not ach.COLLIDE_WITH_15_ENEMIES and st.ENEMIES_COLLIDED_WITH >= 15:
             ach.COLLIDE_WITH_15_ENEMIES = True
             self.feedback_buffer.append(
                 Feedback("[A] collided with 15 enemies", 3.0, color=BLUE)
             )
-            play_sfx("new_achievement")
+            self.sound_buffer.append(SoundEvent("new_achievement"))
         if not ach.DASH_THROUGH_10_ENEMIES and st.DASHED_THROUGH_ENEMIES >= 10:
             ach.DASH_THROUGH_10_ENEMIES = True
             self.feedback_buffer.append(
                 Feedback("[A] dashed through 10 enemies", 3.0, color=BLUE)
             )
-            play_sfx("new_achievement")
+            self.sound_buffer.append(SoundEvent("new_achievement"))
         if not ach.LIFT_20_BLOCKS and st.BLOCKS_LIFTED >= 20:
             ach.LIFT_20_BLOCKS = True
             self.feedback_buffer.append(
                 Feedback("[A] lifted 20 blocks", 3.0, color=BLUE)
             )
-            play_sfx("new_achievement")
+            self.sound_buffer.append(SoundEvent("new_achievement"))
 
     def player_try_shooting(self):
         try:
             self.player.shoot()
         except (OnCooldown, NotEnoughEnergy, ShootingDirectionUndefined) as e:
             self.feedback_buffer.append(Feedback(str(e), 2.0, color=Color("red")))
-            play_sfx("warning")
+            self.sound_buffer.append(SoundEvent("warning"))
         else:
-            play_sfx("player_shot")
+            self.sound_buffer.append(SoundEvent("player_shot"))
 
     def player_try_ultimate(self, artifact_type: ArtifactType):
         try:
@@ -576,7 +596,7 @@ class Game:
             TimeSlowRunning,
         ) as e:
             self.feedback_buffer.append(Feedback(str(e), 2.0, color=Color("red")))
-            play_sfx("warning")
+            self.sound_buffer.append(SoundEvent("warning"))
 
     def spawn_buffered_entities(self) -> None:
         """
@@ -587,8 +607,7 @@ class Game:
             if entity.i_can_spawn_entities:
                 new_ent.extend(entity.i_can_spawn_entities.get_entities_buffer())
                 entity.i_can_spawn_entities.clear()
-        for ent in new_ent:
-            self.add_entity(ent)
+        self.add_entities(new_ent)
 
     def process_dead_entities_sfx(self) -> None:
         for e in self.all_entities_iter(
@@ -598,7 +617,7 @@ class Game:
                 continue
             if e.type in {EntityType.MINE, EntityType.BOMB}:
                 if e._id not in self.ids_played_sound_effect:
-                    play_sfx("explosion")
+                    self.sound_buffer.append(SoundEvent("explosion", e.get_pos()))
                     self.ids_played_sound_effect.add(e._id)
 
     def reflect_projectiles_vel(self) -> None:
@@ -655,12 +674,12 @@ class Game:
                 self.feedback_buffer.append(
                     Feedback(f"+{artifact}", 3.0, color=NICER_YELLOW)
                 )
-                play_sfx("artifact_collected")
+                self.sound_buffer.append(SoundEvent("artifact_collected"))
             self.player.get_stats().BONUS_ORBS_COLLECTED += int(eo.is_enemy_bonus_orb())
             self.animation_handler.add_animation(
                 eo.get_pos(), AnimationType.ENERGY_ORB_COLLECTED
             )
-            play_sfx("energy_collected")
+            self.sound_buffer.append(SoundEvent("energy_collected", eo.get_pos()))
             eo.kill()
             self.feedback_buffer.append(
                 Feedback(
@@ -669,7 +688,10 @@ class Game:
                     color=Color(NICER_MAGENTA_HEX),
                 )
             )
-        for oil_spill in self.oil_spills():
+        player_near_oil_spill = self.hazard_field.covers(
+            self.player.get_pos(), HazardKind.OIL_SPILL
+        )
+        for oil_spill in self.oil_spills() if player_near_oil_spill else ():
             if not oil_spill.intersects(self.player):
                 continue
             if not oil_spill.is_activated():
@@ -677,7 +699,7 @@ class Game:
             self.player.effect_flags.OIL_SPILL = True
             self.player.effect_flags.SLOWNESS = OIL_SPILL_SPEED_MULTIPLIER
             self.reason_of_death = "slipped on oil to death"
-            play_sfx("in_oil_spill")
+            self.sound_buffer.append(SoundEvent("in_oil_spill"))
         for projectile in self.projectiles():
             if (
                 projectile.projectile_type != ProjectileType.PLAYER_BULLET
@@ -691,7 +713,9 @@ class Game:
                     Feedback("blocked", 1.0, color=pygame.Color("yellow"))
                 )
                 self.player.get_stats().BULLET_SHIELD_BULLETS_BLOCKED += 1
-                play_sfx("shield_blocked")
+                self.sound_buffer.append(
+                    SoundEvent("shield_blocked", projectile.get_pos())
+                )
                 continue
             if not projectile.intersects(self.player):
                 continue
@@ -730,7 +754,7 @@ class Game:
             corpse.kill()
             self.feedback_buffer.append(Feedback("collided!", 3.5, color=Color("pink")))
             self.reason_of_death = "collided with Corpse"
-            # play_sfx('fart')
+            # self.sound_buffer.append(SoundEvent("fart"))
         for mine in self.mines():
             if not mine.intersects(self.player):
                 continue
@@ -741,8 +765,11 @@ class Game:
             mine.kill()
             self.feedback_buffer.append(Feedback("mine!", 3.5, color=Color("pink")))
             self.reason_of_death = "stepped on a mine"
-            play_sfx("explosion")
-        for aoe_effect in self.aoe_effects():
+            self.sound_buffer.append(SoundEvent("explosion", mine.get_pos()))
+        player_near_aoe_effect = self.hazard_field.covers(
+            self.player.get_pos(), HazardKind.AOE_DAMAGE, HazardKind.AOE_ENEMY_BLOCK
+        )
+        for aoe_effect in self.aoe_effects() if player_near_aoe_effect else ():
             if not aoe_effect.intersects(self.player):
                 continue
             if not aoe_effect.application_manager.should_apply(self.player):
@@ -762,7 +789,7 @@ class Game:
             self.feedback_buffer.append(
                 Feedback(f"+{artifact}", 3.0, color=NICER_YELLOW)
             )
-            play_sfx("artifact_collected")
+            self.sound_buffer.append(SoundEvent("artifact_collected"))
             # remove all artifacts:
             for ac in self.artifact_chests():
                 ac.kill()
@@ -796,83 +823,94 @@ class Game:
                 self.feedback_buffer.append(
                     Feedback("defused!", 3.5, color=Color("pink"))
                 )
-                play_sfx("bomb_defused")
+                self.sound_buffer.append(SoundEvent("bomb_defused"))
+
+    def player_bullet_enemy_pairs(
+        self,
+    ) -> Generator[tuple[Projectile, Enemy], None, None]:
+        """
+        Pairs of player bullets and enemies that may intersect.
+        Narrowed down by the collision worker when it is running.
+        """
+        if self.contact_candidates is not None:
+            yield from self.contact_candidates.iter_pairs(
+                list(self.player_bullets()), list(self.enemies())
+            )
+            return
+        for bullet in self.player_bullets():
+            for enemy in self.enemies():
+                yield bullet, enemy
 
     def process_collisions_enemies(self) -> None:
         # TODO: move the for enemy in enemies outside of individual collision checks
         # player bullets collide with enemies
-        for bullet in (
-            el
-            for el in self.projectiles()
-            if el.projectile_type == ProjectileType.PLAYER_BULLET
-        ):
-            for enemy in self.enemies():
-                if not bullet.intersects(enemy):
-                    continue
-                bullet.kill()
-                is_ricochet = bullet.ricochet_count > 0
-                self.player.get_stats().ACCURATE_SHOTS += 1
-                if is_ricochet:
-                    self.player.get_stats().ACCURATE_SHOTS_RICOCHET += 1
+        for bullet, enemy in self.player_bullet_enemy_pairs():
+            if not bullet.intersects(enemy):
+                continue
+            bullet.kill()
+            is_ricochet = bullet.ricochet_count > 0
+            self.player.get_stats().ACCURATE_SHOTS += 1
+            if is_ricochet:
+                self.player.get_stats().ACCURATE_SHOTS_RICOCHET += 1
+                self.feedback_buffer.append(
+                    Feedback(
+                        "ricochet!"
+                        + (
+                            f" ({bullet.ricochet_count}x)"
+                            if bullet.ricochet_count > 1
+                            else ""
+                        ),
+                        2.0,
+                        color=Color("pink"),
+                        at_pos=enemy.get_pos(),
+                    )
+                )
+                self.enemy_types_killed_with_ricochet.add(enemy.enemy_type)
+
+                if bullet.ricochet_count >= 10 and not self.player.get_achievements().HIT_ENEMY_WITH_BULLET_WITH_AT_LEAST_10_RICOCHETS:
+                    self.player.get_achievements().HIT_ENEMY_WITH_BULLET_WITH_AT_LEAST_10_RICOCHETS = True
                     self.feedback_buffer.append(
                         Feedback(
-                            "ricochet!"
-                            + (
-                                f" ({bullet.ricochet_count}x)"
-                                if bullet.ricochet_count > 1
-                                else ""
-                            ),
-                            2.0,
-                            color=Color("pink"),
-                            at_pos=enemy.get_pos(),
+                            "[A!] hit an enemy with a bullet that had 10 ricochets!",
+                            3.0,
+                            color=BLUE,
                         )
                     )
-                    self.enemy_types_killed_with_ricochet.add(enemy.enemy_type)
-
-                    if bullet.ricochet_count >= 10 and not self.player.get_achievements().HIT_ENEMY_WITH_BULLET_WITH_AT_LEAST_10_RICOCHETS:
-                        self.player.get_achievements().HIT_ENEMY_WITH_BULLET_WITH_AT_LEAST_10_RICOCHETS = True
-                        self.feedback_buffer.append(
-                            Feedback(
-                                "[A!] hit an enemy with a bullet that had 10 ricochets!",
-                                3.0,
-                                color=BLUE,
-                            )
-                        )
-                        play_sfx("new_achievement")
-
-                    if (
-                        self.enemy_types_killed_with_ricochet == set(EnemyType)
-                        and not self.player.get_achievements().KILL_ALL_ENEMY_TYPES_WITH_RICOCHET
-                    ):
-                        self.player.get_achievements().KILL_ALL_ENEMY_TYPES_WITH_RICOCHET = True
-                        self.feedback_buffer.append(
-                            Feedback(
-                                "[A!!] killed all enemy types with ricochet!",
-                                3.0,
-                                color=BLUE,
-                            )
-                        )
-                        play_sfx("new_achievement")
-                self.deal_damage_to_enemy(enemy, bullet.get_damage())
-                enemy.caught_bullet()
-                play_sfx("accurate_shot")
-                self.animation_handler.add_animation(
-                    enemy.get_pos(),
-                    AnimationType.ACCURATE_SHOT,
-                    bullet_vel=bullet.get_vel(),
-                    enemy_size=enemy.get_size(),
-                )
+                    self.sound_buffer.append(SoundEvent("new_achievement"))
+
                 if (
-                    not self.player.get_achievements().KILL_BOSS_WITH_RICOCHET
-                    and is_ricochet
-                    and not enemy.is_alive()
-                    and enemy.enemy_type == EnemyType.BOSS
+                    self.enemy_types_killed_with_ricochet == set(EnemyType)
+                    and not self.player.get_achievements().KILL_ALL_ENEMY_TYPES_WITH_RICOCHET
                 ):
-                    self.player.get_achievements().KILL_BOSS_WITH_RICOCHET = True
+                    self.player.get_achievements().KILL_ALL_ENEMY_TYPES_WITH_RICOCHET = True
                     self.feedback_buffer.append(
-                        Feedback("[A] killed the boss with ricochet!", 3.0, color=BLUE)
+                        Feedback(
+                            "[A!!] killed all enemy types with ricochet!",
+                            3.0,
+                            color=BLUE,
+                        )
                     )
-                    play_sfx("new_achievement")
+                    self.sound_buffer.append(SoundEvent("new_achievement"))
+            self.deal_damage_to_enemy(enemy, bullet.get_damage())
+            enemy.caught_bullet()
+            self.sound_buffer.append(SoundEvent("accurate_shot", enemy.get_pos()))
+            self.animation_handler.add_animation(
+                enemy.get_pos(),
+                AnimationType.ACCURATE_SHOT,
+                bullet_vel=bullet.get_vel(),
+                enemy_size=enemy.get_size(),
+            )
+            if (
+                not self.player.get_achievements().KILL_BOSS_WITH_RICOCHET
+                and is_ricochet
+                and not enemy.is_alive()
+                and enemy.enemy_type == EnemyType.BOSS
+            ):
+                self.player.get_achievements().KILL_BOSS_WITH_RICOCHET = True
+                self.feedback_buffer.append(
+                    Feedback("[A] killed the boss with ricochet!", 3.0, color=BLUE)
+                )
+                self.sound_buffer.append(SoundEvent("new_achievement"))
         # enemy-enemy collisions
         for enem1, enem2 in itertools.combinations(self.enemies(), 2):
             if enem1.intersects(enem2):
@@ -888,13 +926,20 @@ class Game:
                 if not mine.intersects(enemy):
                     continue
                 self.deal_damage_to_enemy(enemy, mine.damage)
-                play_sfx("explosion")
+                self.sound_buffer.append(SoundEvent("explosion", mine.get_pos()))
                 mine.kill()
         # enemy-aoe_effect collisions
+        enemies_near_aoe_effects = [
+            enemy
+            for enemy in self.enemies()
+            if self.hazard_field.covers(
+                enemy.get_pos(), HazardKind.AOE_DAMAGE, HazardKind.AOE_ENEMY_BLOCK
+            )
+        ]
         for aoe_effect in self.aoe_effects():
             if not aoe_effect.application_manager.affects_enemies:
                 continue
-            for enemy in self.enemies():
+            for enemy in enemies_near_aoe_effects:
                 if not aoe_effect.intersects(enemy):
                     continue
                 if not aoe_effect.application_manager.should_apply(enemy):
@@ -941,7 +986,7 @@ class Game:
                 self.feedback_buffer.append(
                     Feedback("[A] killed the boss without bullets", 3.0, color=BLUE)
                 )
-                play_sfx("new_achievement")
+                self.sound_buffer.append(SoundEvent("new_achievement"))
             if (
                 not self.player.get_achievements().KILL_BOSS_WITHIN_ONE_SECOND
                 and enemy.i_has_lifetime.timer.current_time < 1.0
@@ -950,7 +995,7 @@ class Game:
                 self.feedback_buffer.append(
                     Feedback("[A] killed the boss within one second", 3.0, color=BLUE)
                 )
-                play_sfx("new_achievement")
+                self.sound_buffer.append(SoundEvent("new_achievement"))
 
     def process_other_collisions(self) -> None:
         for aoe_effect in self.aoe_effects():
@@ -1017,7 +1062,7 @@ class Game:
                 color=Color(NICER_MAGENTA_HEX),
             )
         )
-        play_sfx("enemy_killed")
+        self.sound_buffer.append(SoundEvent("enemy_killed", enemy.get_pos()))
 
     def player_get_damage(
         self, damage: float, ignore_invul_timer: bool = False
@@ -1038,40 +1083,29 @@ class Game:
         )
         if not self.player.health.is_alive():
             self.player.kill()
-        play_sfx("damage_taken")
+        self.sound_buffer.append(SoundEvent("damage_taken", self.player.get_pos()))
         return damage_taken_actual
 
     def add_entity(self, entity: Entity) -> None:
-        ent_type = entity.get_type()
-        if ent_type == EntityType.ENERGY_ORB:
-            self.energy_orbs_spawned += 1
-            self.e_energy_orbs.append(entity)  # type: ignore
-        elif ent_type == EntityType.ENEMY:
-            self.animation_handler.add_animation(
-                entity.get_pos(),
-                AnimationType.ENEMY_SPAWNED,
-                enemy_size=entity.get_size(),
-            )
-            self.e_enemies.append(entity)  # type: ignore
-        elif ent_type == EntityType.PROJECTILE:
-            self.e_projectiles.append(entity)  # type: ignore
-        elif ent_type == EntityType.CORPSE:
-            self.e_corpses.append(entity)  # type: ignore
-            self.player.get_stats().CORPSES_LET_SPAWN += 1
-        elif ent_type == EntityType.DUMMY:
-            self.e_dummies.append(entity)  # type: ignore
-        elif ent_type == EntityType.OIL_SPILL:
-            self.e_oil_spills.append(entity)  # type: ignore
-        elif ent_type == EntityType.MINE:
-            self.e_mines.append(entity)  # type: ignore
-        elif ent_type == EntityType.CRATER:
-            self.e_aoe_effects.append(entity)  # type: ignore
-        elif ent_type == EntityType.ARTIFACT_CHEST:
-            self.e_artifact_chests.append(entity)  # type: ignore
-        elif ent_type == EntityType.BOMB:
-            self.e_bombs.append(entity)  # type: ignore
-        else:
-            raise ValueError(f"Unknown entity type {ent_type}")
+        self.add_entities((entity,))
+
+    def add_entities(self, entities: Iterable[Entity]) -> None:
+        entities = list(entities)
+        for entity in entities:
+            ent_type = entity.get_type()
+            if ent_type == EntityType.ENERGY_ORB:
+                self.energy_orbs_spawned += 1
+            elif ent_type == EntityType.ENEMY:
+                self.animation_handler.add_animation(
+                    entity.get_pos(),
+                    AnimationType.ENEMY_SPAWNED,
+                    enemy_size=entity.get_size(),
+                )
+                entity.flow_field = self.flow_field  # type: ignore
+                entity.sound_buffer = self.sound_buffer
+            elif ent_type == EntityType.CORPSE:
+                self.player.get_stats().CORPSES_LET_SPAWN += 1
+        self.entities.add_entities(entities)
 
     def add_line(self, line: Line) -> None:
         self.e_lines.append(line)
@@ -1081,12 +1115,14 @@ class Game:
         Remove all dead entities.
         This function is called every REMOVE_DEAD_ENTITIES_EVERY seconds.
         """
-        self.e_dummies: list[DummyEntity] = list(self.dummies())
-        self.e_oil_spills: list[OilSpill] = list(self.oil_spills())
-        self.e_corpses: list[Corpse] = list(self.corpses())
-        self.e_projectiles: list[Projectile] = list(self.projectiles())
-        self.e_energy_orbs: list[EnergyOrb] = list(self.energy_orbs())
-        self.e_enemies: list[Enemy] = list(self.enemies())
+        self.entities.remove_dead(
+            EntityType.DUMMY,
+            EntityType.OIL_SPILL,
+            EntityType.CORPSE,
+            EntityType.PROJECTILE,
+            EntityType.ENERGY_ORB,
+            EntityType.ENEMY,
+        )
         self.e_lines: list[Line] = list(self.lines())
 
     def get_random_screen_position_for_entity(self, entity_size: float) -> Vector2:
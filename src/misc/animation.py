@@ -1,12 +1,17 @@
 from typing import TypedDict, Unpack, NotRequired
 
-import pygame
+import numpy as np
 from pygame import Vector2, Color
 
-from src.utils.utils import Timer
 from src.utils.enums import AnimationType
 from front.utils import ColorGradient
-from config import BACKGROUND_COLOR_HEX, BOSS_ENEMY_COLOR_HEX, NICER_MAGENTA_HEX
+from config import (
+    BACKGROUND_COLOR_HEX,
+    BOSS_ENEMY_COLOR_HEX,
+    NICER_MAGENTA_HEX,
+    ANIMATION_INITIAL_CAPACITY,
+    COLOR_GRADIENT_STEPS,
+)
 
 
 WHITE = Color("white")
@@ -15,138 +20,90 @@ NICER_MAGENTA = Color(NICER_MAGENTA_HEX)
 BG_COLOR = Color(BACKGROUND_COLOR_HEX)
 BOSS_COLOR = Color(BOSS_ENEMY_COLOR_HEX)
 
-yellow_to_bg_gradient = ColorGradient(YELLOW, BG_COLOR)
-boss_to_bg_gradient = ColorGradient(BOSS_COLOR, BG_COLOR)
-white_to_bg_gradient = ColorGradient(WHITE, BG_COLOR)
-magenta_to_bg_gradient = ColorGradient(NICER_MAGENTA, BG_COLOR)
-
-
-def draw_accurate_shot(animation: "Animation"):
-    bullet_vel, enemy_size = (
-        animation.kwargs["bullet_vel"],  # type: ignore
-        animation.kwargs["enemy_size"],  # type: ignore
-    )
-    bullet_vel = bullet_vel.normalize()
-    p = animation.life_timer.get_percent_full()
-    for i in [1.0, 1.5, 2.0]:
-        line_seed = (
-            animation.pos
-            + bullet_vel * (1 - p + (10 * i) * p)
-            + enemy_size * bullet_vel
-        )
-        line_width = (enemy_size * 5 * (1 - p)) / i
-        line_wing = bullet_vel.rotate(90) * line_width * 0.5
-        pygame.draw.line(
-            animation.surface,
-            yellow_to_bg_gradient(p),
-            line_seed - line_wing,
-            line_seed + line_wing,
-            3,
-        )
-
-
-def draw_enemy_spawned(animation: "Animation"):
-    enemy_size = animation.kwargs["enemy_size"]  # type: ignore
-    p = animation.life_timer.get_percent_full()
-    pygame.draw.circle(
-        animation.surface,
-        white_to_bg_gradient(p),
-        animation.pos,
-        enemy_size * (1.0 + 2.0 * p),
-        width=3,
-    )
-
-
-def draw_boss_died(animation: "Animation"):
-    boss_size = animation.kwargs["enemy_size"]  # type: ignore
-    p = animation.life_timer.get_percent_full()
-    for i in [2, 3, 4]:
-        pygame.draw.circle(
-            animation.surface,
-            boss_to_bg_gradient(p),
-            animation.pos,
-            boss_size * (1.0 + i * p),
-            width=i,
-        )
-
-
-def draw_energy_orb_collected(animation: "Animation"):
-    p = animation.life_timer.get_percent_full()
-    pygame.draw.circle(
-        animation.surface, magenta_to_bg_gradient(p), animation.pos, 10, width=3
-    )
-
-
-ANIM_TYPE_TO_FUNC_DUR = {
-    AnimationType.ACCURATE_SHOT: (draw_accurate_shot, 0.5),
-    AnimationType.ENEMY_SPAWNED: (draw_enemy_spawned, 0.45),
-    AnimationType.BOSS_DIED: (draw_boss_died, 1.5),
-    AnimationType.ENERGY_ORB_COLLECTED: (draw_energy_orb_collected, 0.4),
+yellow_to_bg_gradient = ColorGradient(YELLOW, BG_COLOR, COLOR_GRADIENT_STEPS)
+boss_to_bg_gradient = ColorGradient(BOSS_COLOR, BG_COLOR, COLOR_GRADIENT_STEPS)
+white_to_bg_gradient = ColorGradient(WHITE, BG_COLOR, COLOR_GRADIENT_STEPS)
+magenta_to_bg_gradient = ColorGradient(NICER_MAGENTA, BG_COLOR, COLOR_GRADIENT_STEPS)
+
+
+ANIMATION_DURATIONS = {
+    AnimationType.ACCURATE_SHOT: 0.5,
+    AnimationType.ENEMY_SPAWNED: 0.45,
+    AnimationType.BOSS_DIED: 1.5,
+    AnimationType.ENERGY_ORB_COLLECTED: 0.4,
 }
 
+# indexed by the type code of a slot; 0 is a free slot
+_DURATIONS = np.zeros(max(t.value for t in AnimationType) + 1)
+for _type, _duration in ANIMATION_DURATIONS.items():
+    _DURATIONS[_type.value] = _duration
+
 
 class AnimKwargs(TypedDict):
     bullet_vel: NotRequired[Vector2]
     enemy_size: NotRequired[float]
 
 
-class Animation:
-    def __init__(
-        self,
-        pos: Vector2,
-        surface: pygame.Surface,
-        animation_type: AnimationType,
-        **kwargs: Unpack[AnimKwargs],
-    ):
-        self.is_alive = True
-        self.pos = pos
-        self.surface = surface
-        self.animation_type = animation_type
-        self.kwargs = kwargs
-        # choose duration and draw function based on animation type:
-        self._draw, duration = ANIM_TYPE_TO_FUNC_DUR[animation_type]
-        self.life_timer = Timer(max_time=duration)
-        # TODO: maybe replace with the interface?
-
-    def draw(self):
-        self._draw(self)
-
-    def kill(self):
-        self.is_alive = False
-
-    def update(self, time_delta: float):
-        if not self.life_timer.running():
-            self.kill()
-            return
-        self.life_timer.tick(time_delta)
-        self.draw()
-
-
 class AnimationHandler:
-    def __init__(self):
-        self.surface: pygame.Surface
-        self.animations: list[Animation] = []
-        self.clean_up_timer = Timer(max_time=2.0)
-
-    def set_surface(self, surface: pygame.Surface):
-        self.surface = surface
+    """
+    The animations of the game as typed arrays, a slot per animation: its
+    type, position, start time and parameters (the size of the enemy and the
+    direction of the bullet).
+
+    The game advances them in time (`update`); the renderer draws the live
+    ones in a pass of its own (`live`), so a game runs without a surface.
+    The slot of a finished animation goes back to the free list right away;
+    the arrays grow when all the slots are taken.
+    """
+
+    def __init__(self, capacity: int = ANIMATION_INITIAL_CAPACITY):
+        self.time = 0.0
+        self.types = np.zeros(capacity, dtype=np.int8)  # AnimationType values
+        self.pos = np.zeros((capacity, 2))
+        self.start = np.zeros(capacity)
+        self.params = np.zeros((capacity, 3))  # enemy size, bullet direction
+        self._free = list(range(capacity - 1, -1, -1))
+        self.simplified = False  # set by the renderer when it runs out of time
 
     def add_animation(
         self, pos: Vector2, animation_type: AnimationType, **kwargs: Unpack[AnimKwargs]
     ):
-        self.animations.append(Animation(pos, self.surface, animation_type, **kwargs))
+        if not self._free:
+            self._grow()
+        slot = self._free.pop()
+        bullet_vel = kwargs.get("bullet_vel")
+        direction = Vector2() if bullet_vel is None else bullet_vel.normalize()
+        self.types[slot] = animation_type.value
+        self.pos[slot] = pos
+        self.start[slot] = self.time
+        self.params[slot] = kwargs.get("enemy_size", 0.0), direction.x, direction.y
 
     def update(self, time_delta: float):
-        self.clean_up_timer.tick(time_delta)
-        for animation in self.animations:
-            animation.update(time_delta)
-        if not self.clean_up_timer.running():
-            self.clean_up()
-            self.clean_up_timer.reset()
-
-    def clean_up(self) -> int:
-        old_len = len(self.animations)
-        self.animations = [
-            animation for animation in self.animations if animation.is_alive
-        ]
-        return old_len - len(self.animations)
+        over = (self.types != 0) & (self.time - self.start >= _DURATIONS[self.types])
+        if over.any():
+            self.types[over] = 0
+            self._free.extend(np.flatnonzero(over).tolist())
+        self.time += time_delta
+
+    def live(
+        self, animation_type: AnimationType
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        The positions, the parameters and the progress (from 0 to 1) of the
+        animations of a type; those added since the last update are not shown yet.
+        """
+        elapsed = self.time - self.start
+        slots = np.flatnonzero((self.types == animation_type.value) & (elapsed > 0.0))
+        progress = np.minimum(elapsed[slots] / _DURATIONS[animation_type.value], 1.0)
+        return self.pos[slots], self.params[slots], progress
+
+    def __len__(self) -> int:
+        return len(self.types) - len(self._free)
+
+    def _grow(self) -> None:
+        capacity = len(self.types)
+        self.types = np.concatenate((self.types, np.zeros_like(self.types)))
+        self.pos = np.concatenate((self.pos, np.zeros_like(self.pos)))
+        self.start = np.concatenate((self.start, np.zeros_like(self.start)))
+        self.params = np.concatenate((self.params, np.zeros_like(self.params)))
+        self._free.extend(range(2 * capacity - 1, capacity - 1, -1))
@@ -0,0 +1,328 @@
+from __future__ import annotations
+from multiprocessing import shared_memory
+from multiprocessing.connection import Connection
+from typing import Iterator, Sequence, TYPE_CHECKING
+import math
+import multiprocessing
+
+import numpy as np
+
+from src.utils.shm import attach_shared_memory
+from config import (
+    COLLISION_WORKER_CAPACITY,
+    COLLISION_WORKER_RING_SLOTS,
+    COLLISION_WORKER_MAX_CONTACTS,
+    COLLISION_WORKER_MAX_TIME_DELTA,
+    COLLISION_WORKER_SLACK,
+    COLLISION_WORKER_TIMEOUT,
+)
+
+if TYPE_CHECKING:
+    from src.entities.enemy import Enemy
+    from src.entities.projectile import Projectile
+
+CHUNK_SIZE = 4096  # bullets tested against all the enemies at once
+
+# a fresh interpreter: a forked one would inherit the signal handlers of SDL
+mp_context = multiprocessing.get_context("spawn")
+
+
+def find_contacts(
+    bullet_pos: np.ndarray,
+    bullet_reach: np.ndarray,
+    enemy_pos: np.ndarray,
+    enemy_reach: np.ndarray,
+) -> np.ndarray:
+    """
+    (bullet index, enemy index) pairs of the circles that overlap, sorted.
+    Returns an int32 array of shape (n_contacts, 2).
+    """
+    contacts = [np.empty((0, 2), dtype=np.int32)]
+    if not len(enemy_pos):
+        return contacts[0]
+    for start in range(0, len(bullet_pos), CHUNK_SIZE):
+        stop = min(start + CHUNK_SIZE, len(bullet_pos))
+        diff = bullet_pos[start:stop, None, :] - enemy_pos[None, :, :]
+        dist_sq = np.einsum("bei,bei->be", diff, diff)
+        reach = bullet_reach[start:stop, None] + enemy_reach[None, :]
+        bullets, enemies = np.nonzero(dist_sq <= reach**2)
+        contacts.append(np.stack([bullets + start, enemies], axis=1).astype(np.int32))
+    return np.concatenate(contacts)
+
+
+class SharedBuffers:
+    """
+    The shared memory the game and the worker exchange data through.
+
+    `pos` and `reach` hold the bullets first, then the enemies.
+    `pairs` is a ring of result slots: frame `i` is written to slot `i % slots`,
+    its length goes to `counts` (-1 if there were too many contacts).
+    """
+
+    def __init__(
+        self,
+        capacity: int,
+        slots: int,
+        max_contacts: int,
+        names: tuple[str, str] | None = None,
+    ):
+        self.capacity = capacity
+        self.slots = slots
+        self.max_contacts = max_contacts
+        bodies_size = capacity * 3 * 8
+        results_size = slots * 8 + slots * max_contacts * 2 * 4
+        if names is None:
+            self._bodies = shared_memory.SharedMemory(create=True, size=bodies_size)
+            self._results = shared_memory.SharedMemory(create=True, size=results_size)
+        else:
+            self._bodies = attach_shared_memory(names[0])
+            self._results = attach_shared_memory(names[1])
+        self.pos = np.ndarray((capacity, 2), dtype=np.float64, buffer=self._bodies.buf)
+        self.reach = np.ndarray(
+            (capacity,), dtype=np.float64, buffer=self._bodies.buf, offset=capacity * 16
+        )
+        self.counts = np.ndarray((slots,), dtype=np.int64, buffer=self._results.buf)
+        self.pairs = np.ndarray(
+            (slots, max_contacts, 2),
+            dtype=np.int32,
+            buffer=self._results.buf,
+            offset=slots * 8,
+        )
+
+    def names(self) -> tuple[str, str]:
+        return self._bodies.name, self._results.name
+
+    def close(self, unlink: bool = False) -> None:
+        # the views must go before the memory they point to
+        del self.pos, self.reach, self.counts, self.pairs
+        for shm in (self._bodies, self._results):
+            shm.close()
+            if unlink:
+                shm.unlink()
+
+
+def worker_main(
+    names: tuple[str, str],
+    capacity: int,
+    slots: int,
+    max_contacts: int,
+    conn: Connection,
+) -> None:
+    """The loop of the worker process: one message per frame, None to stop."""
+    buffers = SharedBuffers(capacity, slots, max_contacts, names)
+    try:
+        conn.send("ready")
+        while (message := conn.recv()) is not None:
+            frame, n_bullets, n_enemies = message
+            n_bodies = n_bullets + n_enemies
+            contacts = find_contacts(
+                buffers.pos[:n_bullets],
+                buffers.reach[:n_bullets],
+                buffers.pos[n_bullets:n_bodies],
+                buffers.reach[n_bullets:n_bodies],
+            )
+            slot = frame % slots
+            if len(contacts) > max_contacts:
+                buffers.counts[slot] = -1
+            else:
+                buffers.pairs[slot, : len(contacts)] = contacts
+                buffers.counts[slot] = len(contacts)
+            conn.send(frame)
+    except (EOFError, KeyboardInterrupt):
+        pass
+    finally:
+        buffers.close()
+
+
+class ContactCandidates:
+    """
+    Pairs of player bullets and enemies that may intersect in the current frame.
+
+    The worker found the pairs on the positions of the previous frame, with every
+    body grown by the distance it can travel in one frame. Bodies it has not seen
+    (spawned since) or that moved further than that (teleported) are matched
+    here instead.
+    """
+
+    def __init__(
+        self,
+        buffers: SharedBuffers,
+        slot: int,
+        bullets: list[Projectile],
+        enemies: list[Enemy],
+    ):
+        self.buffers = buffers
+        self.pairs = buffers.pairs[slot, : buffers.counts[slot]]  # zero-copy view
+        self.bullets = bullets
+        self.enemies = enemies
+
+    def iter_pairs(
+        self, bullets_now: Sequence[Projectile], enemies_now: Sequence[Enemy]
+    ) -> Iterator[tuple[Projectile, Enemy]]:
+        n_bullets, n_bodies = len(self.bullets), len(self.bullets) + len(self.enemies)
+        bullet_pos = self.buffers.pos[:n_bullets]
+        bullet_reach = self.buffers.reach[:n_bullets]
+        enemy_pos = self.buffers.pos[n_bullets:n_bodies].tolist()
+        enemy_reach = self.buffers.reach[n_bullets:n_bodies].tolist()
+        trusted = [
+            math.dist(enemy.get_pos(), pos) + enemy.get_size() <= reach
+            for enemy, pos, reach in zip(self.enemies, enemy_pos, enemy_reach)
+        ]
+        for bullet_i, enemy_i in self.pairs.tolist():
+            if trusted[enemy_i]:
+                yield self.bullets[bullet_i], self.enemies[enemy_i]
+
+        trusted_ids = {enemy.get_id() for enemy, ok in zip(self.enemies, trusted) if ok}
+        for enemy in enemies_now:
+            if enemy.get_id() in trusted_ids:
+                continue
+            pos = enemy.get_pos()
+            diff = bullet_pos - (pos[0], pos[1])
+            reach = bullet_reach + enemy.get_size()
+            close = np.einsum("bi,bi->b", diff, diff) <= reach**2
+            for bullet_i in np.flatnonzero(close).tolist():
+                yield self.bullets[bullet_i], enemy
+
+        seen_bullet_ids = {bullet.get_id() for bullet in self.bullets}
+        for bullet in bullets_now:
+            if bullet.get_id() in seen_bullet_ids:
+                continue
+            for enemy in enemies_now:
+                yield bullet, enemy
+
+
+class CollisionWorker:
+    """
+    Finds the contacts between the player bullets and the enemies in a separate
+    process, while the main process renders the frame.
+
+    The positions are mirrored into shared memory at the end of a tick (`submit`)
+    and the contacts are picked up at the start of the next one (`collect`).
+    `collect` returns None whenever the contacts cannot be trusted (the frame
+    was too long, there were too many bodies or contacts, the worker died):
+    the caller then checks the pairs itself.
+    """
+
+    def __init__(
+        self,
+        capacity: int = COLLISION_WORKER_CAPACITY,
+        slots: int = COLLISION_WORKER_RING_SLOTS,
+        max_contacts: int = COLLISION_WORKER_MAX_CONTACTS,
+    ):
+        self.available = False
+        self.buffers: SharedBuffers | None = None
+        self._ready = False  # the worker takes a moment to start up
+        self._frame = 0
+        self._pending: tuple[int, list[Projectile], list[Enemy]] | None = None
+        pipe: tuple[Connection, ...] = ()
+        try:
+            self.buffers = SharedBuffers(capacity, slots, max_contacts)
+            pipe = self._conn, child_conn = mp_context.Pipe()
+            self._process = mp_context.Process(
+                target=worker_main,
+                args=(self.buffers.names(), capacity, slots, max_contacts, child_conn),
+                daemon=True,
+            )
+            self._process.start()
+        except (OSError, ValueError) as e:
+            print(
+                f"[CollisionWorker] could not start the worker ({e}); checking in-process"
+            )
+            for conn in pipe:
+                conn.close()
+            self.close()
+            return
+        child_conn.close()  # the worker has its own copy
+        self.available = True
+
+    def submit(self, bullets: list[Projectile], enemies: list[Enemy]) -> None:
+        """Mirror the bodies into shared memory and let the worker find the contacts."""
+        self._pending = None
+        if not self.available or not self._is_ready():
+            return
+        assert self.buffers is not None
+        n_bullets, n_enemies = len(bullets), len(enemies)
+        n_bodies = n_bullets + n_enemies
+        if n_bodies > self.buffers.capacity:
+            return
+        bodies = [*bullets, *enemies]
+        pos = self.buffers.pos[:n_bodies]
+        pos[:, 0] = np.fromiter((body.get_pos()[0] for body in bodies), float, n_bodies)
+        pos[:, 1] = np.fromiter((body.get_pos()[1] for body in bodies), float, n_bodies)
+        self.buffers.reach[:n_bodies] = np.fromiter(
+            (
+                body.get_size()
+                + body.speed * COLLISION_WORKER_MAX_TIME_DELTA
+                + COLLISION_WORKER_SLACK
+                for body in bodies
+            ),
+            float,
+            n_bodies,
+        )
+        try:
+            self._conn.send((self._frame, n_bullets, n_enemies))
+        except OSError:
+            self.close()
+            return
+        self._pending = (self._frame, bullets, enemies)
+        self._frame += 1
+
+    def collect(self, time_delta: float) -> ContactCandidates | None:
+        """The contacts of the last submitted frame, if they can be used in this one."""
+        if self._pending is None:
+            return None
+        assert self.buffers is not None
+        frame, bullets, enemies = self._pending
+        self._pending = None
+        try:
+            if not self._conn.poll(COLLISION_WORKER_TIMEOUT):
+                raise TimeoutError
+            answered = self._conn.recv()
+        except (OSError, EOFError, TimeoutError):
+            print(
+                "[CollisionWorker] the worker stopped responding; checking in-process"
+            )
+            self.close()
+            return None
+        if answered != frame:
+            print(
+                f"[CollisionWorker] the worker answered frame {answered!r} instead of"
+                f" {frame}; checking in-process"
+            )
+            self.close()
+            return None
+        slot = frame % self.buffers.slots
+        if (
+            time_delta > COLLISION_WORKER_MAX_TIME_DELTA
+            or self.buffers.counts[slot] < 0
+        ):
+            return None
+        return ContactCandidates(self.buffers, slot, bullets, enemies)
+
+    def _is_ready(self) -> bool:
+        if not self._ready and self._conn.poll():
+            try:
+                self._ready = self._conn.recv() == "ready"
+            except EOFError:
+                print(
+                    "[CollisionWorker] the worker failed to start; checking in-process"
+                )
+                self.close()
+        return self._ready
+
+    def close(self) -> None:
+        """Stop the worker and release the shared memory."""
+        if self.available:
+            try:
+                self._conn.send(None)
+            except OSError:
+                pass
+            self._process.join(timeout=COLLISION_WORKER_TIMEOUT)
+            if self._process.is_alive():
+                self._process.terminate()
+            self._conn.close()
+        self.available = False
+        self._pending = None
+        if self.buffers is not None:
+            self.buffers.close(unlink=True)
+            self.buffers = None
@@ -0,0 +1,98 @@
+from collections import Counter
+from typing import Generator, Iterable
+
+from src.entities.entity import Entity
+from src.utils.enums import EntityType, EnemyType, ProjectileType
+
+# the order in which the entity types are drawn (from the bottom layer up)
+RENDER_ORDER = (
+    EntityType.OIL_SPILL,
+    EntityType.CRATER,
+    EntityType.PROJECTILE,
+    EntityType.ENEMY,
+    EntityType.ENERGY_ORB,
+    EntityType.CORPSE,
+    EntityType.MINE,
+    EntityType.ARTIFACT_CHEST,
+    EntityType.BOMB,
+)
+REGISTERED_TYPES = RENDER_ORDER + (EntityType.DUMMY,)
+
+# the attribute that holds the subtype of the entities that have one
+SUBTYPE_ATTRIBUTE = {
+    EntityType.ENEMY: "enemy_type",
+    EntityType.PROJECTILE: "projectile_type",
+}
+
+
+class EntityRegistry:
+    """
+    Holds all the entities of the game (except for the player), grouped by type.
+
+    Keeps count of the living entities of every type and subtype (EnemyType,
+    ProjectileType): the entities report their own death through `kill_listener`.
+    """
+
+    def __init__(self):
+        self._entities: dict[EntityType, list[Entity]] = {
+            ent_type: [] for ent_type in REGISTERED_TYPES
+        }
+        self._alive: Counter[EntityType | EnemyType | ProjectileType] = Counter()
+
+    def add(self, entity: Entity) -> None:
+        self.add_entities((entity,))
+
+    def add_entities(self, entities: Iterable[Entity]) -> None:
+        """Add the entities type by type, and count the living ones at once."""
+        by_type: dict[EntityType, list[Entity]] = {}
+        kinds: list[EntityType | EnemyType | ProjectileType] = []
+        for entity in entities:
+            ent_type = entity.get_type()
+            if ent_type not in self._entities:
+                raise ValueError(f"Unknown entity type {ent_type}")
+            by_type.setdefault(ent_type, []).append(entity)
+            entity.kill_listener = self._on_kill
+            if entity.is_alive():
+                kinds.extend(self._kinds(entity))
+        for ent_type, added in by_type.items():
+            self._entities[ent_type].extend(added)
+        self._alive.update(kinds)
+
+    def of_type(
+        self, ent_type: EntityType, include_dead: bool = False
+    ) -> Generator[Entity, None, None]:
+        if include_dead:
+            yield from self._entities[ent_type]
+        else:
+            yield from (ent for ent in self._entities[ent_type] if ent.is_alive())
+
+    def all(
+        self,
+        include_dead: bool = False,
+        exclude: Iterable[EntityType] = (),
+    ) -> Generator[Entity, None, None]:
+        """All the entities, type by type in the render order."""
+        excluded = set(exclude)
+        for ent_type in REGISTERED_TYPES:
+            if ent_type not in excluded:
+                yield from self.of_type(ent_type, include_dead)
+
+    def count(self, kind: EntityType | EnemyType | ProjectileType) -> int:
+        """The number of living entities of the given type or subtype."""
+        return self._alive[kind]
+
+    def remove_dead(self, *ent_types: EntityType) -> None:
+        for ent_type in ent_types:
+            self._entities[ent_type] = [
+                ent for ent in self._entities[ent_type] if ent.is_alive()
+            ]
+
+    def _on_kill(self, entity: Entity) -> None:
+        self._alive.subtract(self._kinds(entity))
+
+    @staticmethod
+    def _kinds(entity: Entity) -> list[EntityType | EnemyType | ProjectileType]:
+        ent_type = entity.get_type()
+        if ent_type in SUBTYPE_ATTRIBUTE:
+            return [ent_type, getattr(entity, SUBTYPE_ATTRIBUTE[ent_type])]
+        return [ent_type]
@@ -0,0 +1,164 @@
+import math
+
+import numpy as np
+from pygame import Vector2
+from scipy.sparse import csr_matrix
+from scipy.sparse.csgraph import dijkstra
+
+from src.misc.hazard_field import HazardField
+from src.misc.kernel_executor import kernel_executor
+from src.utils.enums import HazardKind
+from config import FLOW_FIELD_COARSENING, FLOW_FIELD_HAZARD_PENALTY
+
+# (row, col) steps to the 8 neighbours of a cell and the matching unit vectors
+NEIGHBOUR_STEPS = ((-1, -1), (-1, 0), (-1, 1), (0, -1), (0, 1), (1, -1), (1, 0), (1, 1))
+NEIGHBOUR_DIRECTIONS = tuple(Vector2(dc, dr).normalize() for dr, dc in NEIGHBOUR_STEPS)
+
+AVOIDED_HAZARDS = (HazardKind.OIL_SPILL, HazardKind.MINE)
+
+
+class FlowField:
+    """
+    A grid of directions towards a target (the player) shared by all the enemies.
+
+    The grid is a coarser version of the hazard field. Crossing a cell covered by
+    an activated oil spill or mine costs `hazard_penalty` more than a free cell.
+    The cost-to-target of every cell is computed with a single Dijkstra run over
+    the grid, and is rebuilt only when the target changes cell
+    or the avoided hazards change.
+
+    Cells from which the straight line to the target is already the cheapest path
+    keep the plain homing behaviour; the others follow the direction
+    to the cheapest neighbour.
+    """
+
+    def __init__(
+        self,
+        hazard_field: HazardField,
+        coarsening: int = FLOW_FIELD_COARSENING,
+        hazard_penalty: float = FLOW_FIELD_HAZARD_PENALTY,
+    ):
+        self.hazard_field = hazard_field
+        self.coarsening = coarsening
+        self.hazard_penalty = hazard_penalty
+        self.origin = hazard_field.origin
+        self.cell_size = hazard_field.cell_size * coarsening
+        self.n_rows = math.ceil(hazard_field.n_rows / coarsening)
+        self.n_cols = math.ceil(hazard_field.n_cols / coarsening)
+        self.best_neighbour = np.zeros((self.n_rows, self.n_cols), dtype=np.intp)
+        self.needs_detour = np.zeros((self.n_rows, self.n_cols), dtype=bool)
+        # (target cell, avoided hazard versions) the field was last built for
+        self._built_for: tuple | None = None
+        self._build_graph()
+
+    def _build_graph(self):
+        """Build the 8-connected grid graph once; only its weights change later."""
+        n_cells = self.n_rows * self.n_cols
+        cell_index = np.arange(n_cells).reshape(self.n_rows, self.n_cols)
+        rows, cols = np.indices((self.n_rows, self.n_cols))
+        sources, targets, lengths = [], [], []
+        for dr, dc in ((0, 1), (1, 0), (1, 1), (1, -1)):
+            to_rows, to_cols = rows + dr, cols + dc
+            inside = (
+                (to_rows >= 0)
+                & (to_rows < self.n_rows)
+                & (to_cols >= 0)
+                & (to_cols < self.n_cols)
+            )
+            sources.append(cell_index[inside])
+            targets.append(cell_index[to_rows[inside], to_cols[inside]])
+            lengths.append(np.full(inside.sum(), math.hypot(dr, dc)))
+        # the graph is undirected: store every edge in both directions
+        edge_from = np.concatenate(sources + targets)
+        edge_to = np.concatenate(targets + sources)
+        edge_length = np.concatenate(lengths + lengths)
+        # learn the order in which the CSR matrix stores the edges
+        self._graph = csr_matrix(
+            (
+                np.arange(1, len(edge_from) + 1, dtype=np.float64),
+                (edge_from, edge_to),
+            ),
+            shape=(n_cells, n_cells),
+        )
+        csr_order = self._graph.data.astype(np.intp) - 1
+        # edges in the CSR order, so that the weights are written straight into it
+        self._edge_from = edge_from[csr_order]
+        self._edge_to = edge_to[csr_order]
+        self._edge_half_length = edge_length[csr_order] * 0.5
+        self._rows, self._cols = rows, cols
+
+    def cell_of(self, pos: Vector2) -> tuple[int, int] | None:
+        row = int((pos[1] - self.origin.y) // self.cell_size)
+        col = int((pos[0] - self.origin.x) // self.cell_size)
+        if not (0 <= row < self.n_rows and 0 <= col < self.n_cols):
+            return None
+        return row, col
+
+    def update(self, target_pos: Vector2) -> None:
+        """Rebuild the field if the target moved to another cell or the hazards changed."""
+        target_cell = self.cell_of(target_pos)
+        built_for = (
+            target_cell,
+            *(self.hazard_field.layer_version(kind) for kind in AVOIDED_HAZARDS),
+        )
+        if built_for == self._built_for:
+            return
+        self._built_for = built_for
+        hazard_mask = self._hazard_mask()
+        if target_cell is None or not hazard_mask.any():
+            # nothing to walk around: every enemy homes in directly
+            self.needs_detour.fill(False)
+            return
+
+        cost = 1.0 + self.hazard_penalty * hazard_mask
+        cost[target_cell] = 1.0
+        flat_cost = cost.ravel()
+        weights = self._graph.data
+
+        def edge_weights(start: int, stop: int):
+            # the length of the edge times the average cost of its two cells
+            np.add(
+                flat_cost[self._edge_from[start:stop]],
+                flat_cost[self._edge_to[start:stop]],
+                out=weights[start:stop],
+            )
+            weights[start:stop] *= self._edge_half_length[start:stop]
+
+        kernel_executor.run(edge_weights, len(weights))
+        row, col = target_cell
+        dist = dijkstra(self._graph, indices=row * self.n_cols + col).reshape(
+            self.n_rows, self.n_cols
+        )
+
+        padded = np.pad(dist, 1, constant_values=np.inf)
+        neighbour_dist = np.stack(
+            [
+                padded[1 + dr : 1 + dr + self.n_rows, 1 + dc : 1 + dc + self.n_cols]
+                for dr, dc in NEIGHBOUR_STEPS
+            ]
+        )
+        self.best_neighbour = neighbour_dist.argmin(axis=0)
+        # the cost of the straight (octile) path in a field without hazards
+        d_rows, d_cols = np.abs(self._rows - row), np.abs(self._cols - col)
+        octile = np.maximum(d_rows, d_cols) + (math.sqrt(2) - 1) * np.minimum(
+            d_rows, d_cols
+        )
+        self.needs_detour = dist > octile + 1e-3
+
+    def direction_at(self, pos: Vector2, target_pos: Vector2) -> Vector2:
+        """The unit vector an entity at `pos` should move along to reach the target."""
+        cell = self.cell_of(pos)
+        if cell is None or not self.needs_detour[cell]:
+            return (target_pos - pos).normalize()
+        return Vector2(NEIGHBOUR_DIRECTIONS[self.best_neighbour[cell]])
+
+    def _hazard_mask(self) -> np.ndarray:
+        """The avoided hazards of the hazard field, max-pooled to the flow field cells."""
+        hazard_field = self.hazard_field
+        k = self.coarsening
+        covered = np.zeros((self.n_rows * k, self.n_cols * k), dtype=bool)
+        for kind in AVOIDED_HAZARDS:
+            covered[
+                : hazard_field.n_rows, : hazard_field.n_cols
+            ] |= hazard_field.coverage(kind)
+        return covered.reshape(self.n_rows, k, self.n_cols, k).any(axis=(1, 3))
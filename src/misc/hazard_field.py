@@ -0,0 +1,160 @@
+from dataclasses import dataclass
+from typing import Iterable
+import math
+
+import numpy as np
+import pygame
+from pygame import Vector2
+
+from src.entities.aoe_effect import AOEEffect
+from src.entities.mine import Mine
+from src.entities.oil_spill import OilSpill
+from src.utils.enums import HazardKind, AOEEffectEffectType
+from config import HAZARD_FIELD_CELL_SIZE, HAZARD_FIELD_ENTITY_MARGIN
+
+HAZARD_KIND_TO_LAYER = {kind: i for i, kind in enumerate(HazardKind)}
+
+
+@dataclass
+class Footprint:
+    """The cells a hazard was rasterized into."""
+
+    layer: int
+    key: tuple[float, float, float]
+    rows: slice
+    cols: slice
+    mask: np.ndarray
+
+
+class HazardField:
+    """
+    A coarse raster of the arena.
+    Every cell counts the hazards (activated oil spills, AOE effects and
+    activated mines) that can reach an entity standing in that cell.
+
+    The raster is conservative: the hazards are grown by `margin`
+    (the size of the biggest entity) and the radius is rounded up,
+    so a zero count means that no exact circle test can succeed there.
+    It is updated incrementally: a hazard is re-rasterized only
+    when it appears, grows past the next half-cell or dies.
+    """
+
+    def __init__(
+        self,
+        screen_rectangle: pygame.Rect,
+        cell_size: float = HAZARD_FIELD_CELL_SIZE,
+        margin: float = HAZARD_FIELD_ENTITY_MARGIN,
+    ):
+        self.origin = Vector2(screen_rectangle.topleft)
+        self.cell_size = cell_size
+        self.margin = margin
+        self.n_rows = math.ceil(screen_rectangle.height / cell_size)
+        self.n_cols = math.ceil(screen_rectangle.width / cell_size)
+        self.counts = np.zeros(
+            (len(HazardKind), self.n_rows, self.n_cols), dtype=np.int16
+        )
+        self._footprints: dict[int, Footprint] = {}
+        self.version = 0  # bumped on every change of the raster
+        self.layer_versions = [0] * len(HazardKind)  # same, per hazard kind
+
+    def sync(
+        self,
+        oil_spills: Iterable[OilSpill],
+        aoe_effects: Iterable[AOEEffect],
+        mines: Iterable[Mine],
+    ) -> None:
+        """Bring the raster up to date with the living hazards. Called once per tick."""
+        seen: set[int] = set()
+        for oil_spill in oil_spills:
+            if not oil_spill.is_activated():
+                continue
+            self._place(
+                oil_spill.get_id(),
+                HazardKind.OIL_SPILL,
+                oil_spill.get_pos(),
+                oil_spill.get_size(),
+            )
+            seen.add(oil_spill.get_id())
+        for aoe_effect in aoe_effects:
+            kind = (
+                HazardKind.AOE_DAMAGE
+                if aoe_effect.effect_type == AOEEffectEffectType.DAMAGE
+                else HazardKind.AOE_ENEMY_BLOCK
+            )
+            self._place(
+                aoe_effect.get_id(), kind, aoe_effect.get_pos(), aoe_effect.get_size()
+            )
+            seen.add(aoe_effect.get_id())
+        for mine in mines:
+            if not mine.is_activated():
+                continue
+            self._place(mine.get_id(), HazardKind.MINE, mine.get_pos(), mine.get_size())
+            seen.add(mine.get_id())
+        for hazard_id in self._footprints.keys() - seen:
+            self._remove(hazard_id)
+
+    def covers(self, pos: Vector2, *kinds: HazardKind) -> bool:
+        """
+        Return True if a hazard of one of the given kinds may affect an entity at `pos`.
+        Positions outside of the arena are always reported as covered.
+        """
+        row = int((pos[1] - self.origin.y) // self.cell_size)
+        col = int((pos[0] - self.origin.x) // self.cell_size)
+        if not (0 <= row < self.n_rows and 0 <= col < self.n_cols):
+            return True
+        return any(self.counts[HAZARD_KIND_TO_LAYER[kind], row, col] for kind in kinds)
+
+    def coverage(self, kind: HazardKind) -> np.ndarray:
+        """Boolean (rows, cols) mask of the cells reached by hazards of the given kind."""
+        return self.counts[HAZARD_KIND_TO_LAYER[kind]] > 0
+
+    def layer_version(self, kind: HazardKind) -> int:
+        return self.layer_versions[HAZARD_KIND_TO_LAYER[kind]]
+
+    def clear(self) -> None:
+        self.counts.fill(0)
+        self._footprints.clear()
+        self.version += 1
+        self.layer_versions = [v + 1 for v in self.layer_versions]
+
+    def _place(self, hazard_id: int, kind: HazardKind, pos: Vector2, size: float):
+        half_cell = self.cell_size * 0.5
+        radius = (size // half_cell + 1) * half_cell + self.margin
+        key = (pos.x, pos.y, radius)
+        footprint = self._footprints.get(hazard_id)
+        if footprint is not None:
+            if footprint.key == key:
+                return
+            self._remove(hazard_id)
+        footprint = self._rasterize(HAZARD_KIND_TO_LAYER[kind], key)
+        self.counts[footprint.layer, footprint.rows, footprint.cols] += footprint.mask
+        self._footprints[hazard_id] = footprint
+        self.version += 1
+        self.layer_versions[footprint.layer] += 1
+
+    def _remove(self, hazard_id: int):
+        footprint = self._footprints.pop(hazard_id)
+        self.counts[footprint.layer, footprint.rows, footprint.cols] -= footprint.mask
+        self.version += 1
+        self.layer_versions[footprint.layer] += 1
+
+    def _rasterize(self, layer: int, key: tuple[float, float, float]) -> Footprint:
+        x, y, radius = key
+        x -= self.origin.x
+        y -= self.origin.y
+        cs = self.cell_size
+        row_from = max(int((y - radius) // cs), 0)
+        row_to = min(int((y + radius) // cs) + 1, self.n_rows)
+        col_from = max(int((x - radius) // cs), 0)
+        col_to = min(int((x + radius) // cs) + 1, self.n_cols)
+        row_from, row_to = min(row_from, row_to), max(row_from, row_to)
+        col_from, col_to = min(col_from, col_to), max(col_from, col_to)
+        # distance from the hazard's center to the closest point of every cell
+        rows = np.arange(row_from, row_to, dtype=np.float32)[:, None] * cs
+        cols = np.arange(col_from, col_to, dtype=np.float32)[None, :] * cs
+        dy = np.maximum(np.maximum(rows - y, y - rows - cs), 0.0)
+        dx = np.maximum(np.maximum(cols - x, x - cols - cs), 0.0)
+        mask = (dx**2 + dy**2 <= radius**2).astype(np.int16)
+        return Footprint(
+            layer, key, slice(row_from, row_to), slice(col_from, col_to), mask
+        )
@@ -1,10 +1,13 @@
 from __future__ import annotations
-from collections import deque
+import weakref
+
+import numpy as np
 from pygame import Vector2
 
 from src.utils.utils import Timer
 import src.entities.entity
-from config import TRAIL_MAX_LENGTH, TRAIL_POINTS_PER_SECOND
+from src.misc.trail_store import trail_store
+from config import TRAIL_POINTS_PER_SECOND
 
 
 class HasLifetimeInterface:
@@ -34,7 +37,8 @@ class CanSpawnEntitiesInterface:
 class RendersTrailInterface:
     def __init__(self):
         self.render_trail_pseudo_timer = 1.0
-        self.trail: deque[Vector2] = deque(maxlen=TRAIL_MAX_LENGTH)
+        self.slot = trail_store.allocate()
+        weakref.finalize(self, trail_store.release, self.slot)
 
     def tick_check_should_add(self, time_delta: float) -> bool:
         """Increases timer var. Returns True if the new point should be added."""
@@ -42,8 +46,12 @@ class RendersTrailInterface:
         return self.render_trail_pseudo_timer >= 1.0 / TRAIL_POINTS_PER_SECOND
 
     def add(self, pos: Vector2):
-        self.trail.append(pos)
+        trail_store.append(self.slot, pos.x, pos.y)
         self.render_trail_pseudo_timer = 0.0
 
-    def get_trail(self) -> deque[Vector2]:
-        return self.trail
+    def get_trail(self) -> np.ndarray:
+        """The points of the trail, the oldest one first; shape (n, 2)."""
+        return trail_store.ordered(self.slot)
+
+    def get_point(self, index: int) -> Vector2:
+        return Vector2(*trail_store.point(self.slot, index))
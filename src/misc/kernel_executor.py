@@ -0,0 +1,67 @@
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable
+import os
+
+from config import KERNEL_EXECUTOR_PARALLEL_THRESHOLD, KERNEL_EXECUTOR_MAX_WORKERS
+
+# a kernel processes the items [start, stop) of its arrays in place
+Kernel = Callable[[int, int], None]
+
+
+class KernelExecutor:
+    """
+    Runs NumPy kernels over chunks of large arrays on a persistent thread pool.
+
+    NumPy releases the GIL inside its ufuncs, so the chunks of one kernel
+    really run in parallel. Arrays smaller than `threshold` items are processed
+    in the calling thread: below that the overhead of dispatching the chunks
+    is bigger than the gain.
+
+    Usage:
+    >>> def kernel(start, stop):
+    ...     np.multiply(a[start:stop], 2.0, out=b[start:stop])
+    >>> kernel_executor.run(kernel, len(a))
+    """
+
+    def __init__(
+        self,
+        max_workers: int | None = KERNEL_EXECUTOR_MAX_WORKERS,
+        threshold: int = KERNEL_EXECUTOR_PARALLEL_THRESHOLD,
+    ):
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.threshold = threshold
+        self._pool: ThreadPoolExecutor | None = None
+
+    def n_chunks(self, n_items: int) -> int:
+        """The number of chunks an array of `n_items` items is split into."""
+        if self.max_workers == 1 or n_items < self.threshold:
+            return 1
+        return min(self.max_workers, n_items * 2 // self.threshold)
+
+    def run(self, kernel: Kernel, n_items: int) -> None:
+        """Apply the kernel to all the items, in parallel if there are enough of them."""
+        n_chunks = self.n_chunks(n_items)
+        if n_chunks == 1:
+            kernel(0, n_items)
+            return
+        if self._pool is None:
+            self._pool = ThreadPoolExecutor(
+                max_workers=self.max_workers, thread_name_prefix="kernel"
+            )
+        bounds = [n_items * i // n_chunks for i in range(n_chunks + 1)]
+        futures = [
+            self._pool.submit(kernel, start, stop)
+            for start, stop in zip(bounds[1:-1], bounds[2:])
+        ]
+        # the calling thread takes the first chunk instead of waiting idly
+        kernel(bounds[0], bounds[1])
+        for future in futures:
+            future.result()
+
+    def shutdown(self) -> None:
+        if self._pool is not None:
+            self._pool.shutdown()
+            self._pool = None
+
+
+kernel_executor = KernelExecutor()
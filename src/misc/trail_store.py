@@ -0,0 +1,67 @@
+import numpy as np
+
+from config import TRAIL_MAX_LENGTH, TRAIL_STORE_INITIAL_CAPACITY
+
+
+class TrailStore:
+    """
+    The trails of all the entities that leave one, as ring buffers of
+    TRAIL_MAX_LENGTH points in one shared array: slot `s` holds the trail of
+    one entity, its next point goes to `heads[s]`.
+
+    An entity takes a slot when it is created and gives it back when it is
+    garbage collected (see RendersTrailInterface). The arrays grow when all
+    the slots are taken.
+    """
+
+    def __init__(
+        self,
+        capacity: int = TRAIL_STORE_INITIAL_CAPACITY,
+        length: int = TRAIL_MAX_LENGTH,
+    ):
+        self.length = length
+        self.points = np.zeros((capacity, length, 2))
+        self.heads = np.zeros(capacity, dtype=np.int32)
+        self.counts = np.zeros(capacity, dtype=np.int32)
+        self._free = list(range(capacity - 1, -1, -1))
+
+    def allocate(self) -> int:
+        if not self._free:
+            self._grow()
+        slot = self._free.pop()
+        self.heads[slot] = self.counts[slot] = 0
+        return slot
+
+    def release(self, slot: int) -> None:
+        self._free.append(slot)
+
+    def append(self, slot: int, x: float, y: float) -> None:
+        head = self.heads[slot]
+        self.points[slot, head] = x, y
+        self.heads[slot] = (head + 1) % self.length
+        if self.counts[slot] < self.length:
+            self.counts[slot] += 1
+
+    def point(self, slot: int, index: int) -> np.ndarray:
+        """The `index`-th point of the trail, the oldest one first."""
+        count = self.counts[slot]
+        if not 0 <= index < count:
+            raise IndexError(f"trail index {index} out of range")
+        return self.points[slot, (self.heads[slot] - count + index) % self.length]
+
+    def ordered(self, slot: int) -> np.ndarray:
+        """The points of the trail, the oldest one first; shape (n, 2)."""
+        count, head = self.counts[slot], self.heads[slot]
+        if count < self.length:
+            return self.points[slot, :count]
+        return np.concatenate((self.points[slot, head:], self.points[slot, :head]))
+
+    def _grow(self) -> None:
+        capacity = len(self.heads)
+        self.points = np.concatenate((self.points, np.zeros_like(self.points)))
+        self.heads = np.concatenate((self.heads, np.zeros_like(self.heads)))
+        self.counts = np.concatenate((self.counts, np.zeros_like(self.counts)))
+        self._free.extend(range(2 * capacity - 1, capacity - 1, -1))
+
+
+trail_store = TrailStore()
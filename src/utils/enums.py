@@ -1,4 +1,4 @@
-from enum import Enum, auto
+from enum import Enum, IntEnum, auto
 
 
 class EntityType(Enum):
@@ -66,3 +66,50 @@ class AnimationType(Enum):
 class AOEEffectEffectType(Enum):
     DAMAGE = auto()
     ENEMY_BLOCK_ON = auto()
+
+
+class HazardKind(Enum):
+    """
+    Enumeration of the layers of the hazard field.
+    """
+
+    OIL_SPILL = auto()
+    AOE_DAMAGE = auto()
+    AOE_ENEMY_BLOCK = auto()
+    MINE = auto()
+
+
+class SpriteShape(Enum):
+    """
+    Enumeration of the primitives the sprite atlas can pre-rasterize.
+    """
+
+    CIRCLE = auto()
+    MINE = auto()  # two crossing ellipses
+    RINGS = auto()  # three concentric rings of an artifact chest
+    BLOCK = auto()  # two horizontal bars of a blocking enemy
+    ARC = auto()  # a status ring filled counterclockwise from the top
+
+
+class RenderQuality(IntEnum):
+    """
+    Enumeration of the render quality tiers, from the best one down.
+    Every tier leaves out what the tiers above it leave out.
+    """
+
+    FULL = 0
+    REDUCED = 1  # shorter trails, no health rings on one-shot enemies, no Miner radii
+    LOW = 2  # no def-trajectory paths, no intent rings, simpler animations
+    MINIMAL = 3  # no trails, no timers of energy orbs and corpses
+
+
+class SfxPriority(IntEnum):
+    """
+    Enumeration of the priorities of the sound effects: when the channels
+    run out, the lower ones give way. The critical cues have channels of their own.
+    """
+
+    AMBIENT = 0
+    NORMAL = 1
+    IMPORTANT = 2
+    CRITICAL = 3
@@ -0,0 +1,22 @@
+from multiprocessing import resource_tracker, shared_memory
+import sys
+
+
+def attach_shared_memory(name: str) -> shared_memory.SharedMemory:
+    """
+    The shared memory created (and unlinked) by another process, e.g. in a worker.
+
+    Before Python 3.13 attaching registers the memory with the resource tracker,
+    which the spawned processes share with their parent: the memory would be
+    reported as leaked if the worker outlived its unlinking, and unregistering
+    it here would drop the registration of the creator as well. So the worker
+    does not register it at all.
+    """
+    if sys.version_info >= (3, 13):
+        return shared_memory.SharedMemory(name=name, track=False)
+    register = resource_tracker.register
+    resource_tracker.register = lambda name, rtype: None
+    try:
+        return shared_memory.SharedMemory(name=name)
+    finally:
+        resource_tracker.register = register
@@ -8,7 +8,7 @@ from pygame import Color, Vector2
 from scipy.interpolate import make_interp_spline, BSpline
 import numpy as np
 
-from src.utils.enums import EntityType
+from src.utils.enums import EntityType, SfxPriority
 
 
 def random_unit_vector() -> Vector2:
@@ -112,6 +112,13 @@ class Feedback:
     color: Color = field(default_factory=default_color)
 
 
+@dataclass
+class SoundEvent:
+    name: str
+    pos: Vector2 | None = None  # where in the world, if anywhere
+    priority: SfxPriority | None = None  # the one of the sound by default
+
+
 class AppliedToEntityManager:
     """Interface class for effects that can be applied to some entities."""
 